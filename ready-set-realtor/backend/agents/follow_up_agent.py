@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 from uuid import UUID
-import openai
 from ..mcp.core import AgentContext, AgentType, AgentState
+from ..core.llm_cache import llm_cache
+from ..services.openai_service import openai_service
+from ..core.templating import CompiledTemplate, compile_template
 
 class FollowUpTemplate(BaseModel):
     template_id: str
@@ -13,6 +15,16 @@ class FollowUpTemplate(BaseModel):
     conditions: Dict
     delay: Optional[int]  # delay in days
 
+    @property
+    def compiled(self) -> CompiledTemplate:
+        return compile_template(self.content)
+
+    def render(self, context: Dict) -> str:
+        """
+        Fill the template fields the context provides, keeping the rest as placeholders.
+        """
+        return self.compiled.render_partial(context)
+
 class FollowUpSchedule(BaseModel):
     lead_id: UUID
     templates: List[FollowUpTemplate]
@@ -24,10 +36,15 @@ class FollowUpSchedule(BaseModel):
 class FollowUpAgent:
     def __init__(self, context: AgentContext):
         self.context = context
-        self.openai_client = openai.OpenAI()
         self.follow_up_schedules: Dict[UUID, FollowUpSchedule] = {}
         self.templates: Dict[str, FollowUpTemplate] = self._initialize_templates()
 
+    def reset(self) -> None:
+        """
+        Drops schedules built for the previous task; compiled templates are kept.
+        """
+        self.follow_up_schedules = {}
+
     def _initialize_templates(self) -> Dict[str, FollowUpTemplate]:
         """
         Initializes default follow-up templates.
@@ -88,38 +105,69 @@ class FollowUpAgent:
         """
         Generates a personalized follow-up message using the specified template.
         """
+        template = self._get_template(lead_id, template_id)
+
+        # Get personalized message from OpenAI
+        content = await llm_cache.complete(
+            AgentType.FOLLOW_UP.value,
+            openai_service.chat_completion,
+            **self._message_request(template, context)
+        )
+
+        # Process the response
+        message = self._process_message_response(content)
+        self._record_contact(lead_id, template)
+
+        return message
+
+    def stream_follow_up_message(self, lead_id: UUID, template_id: str, context: Dict) -> AsyncIterator[str]:
+        """
+        Streams a personalized follow-up message as it is generated.
+
+        The lead and template are checked before the stream is returned; the
+        schedule is updated once the message completes.
+        """
+        template = self._get_template(lead_id, template_id)
+        return self._stream_message(lead_id, template, context)
+
+    async def _stream_message(self, lead_id: UUID, template: FollowUpTemplate, context: Dict) -> AsyncIterator[str]:
+        async for delta in llm_cache.stream(
+            AgentType.FOLLOW_UP.value,
+            openai_service.stream_chat_completion,
+            **self._message_request(template, context)
+        ):
+            yield delta
+        self._record_contact(lead_id, template)
+
+    def _get_template(self, lead_id: UUID, template_id: str) -> FollowUpTemplate:
         if lead_id not in self.follow_up_schedules:
             raise ValueError("Lead not found in follow-up schedules")
 
         template = self.templates.get(template_id)
         if not template:
             raise ValueError("Template not found")
+        return template
 
-        # Create the prompt for message generation
-        prompt = self._create_message_prompt(template, context)
-
-        # Get personalized message from OpenAI
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
+    def _message_request(self, template: FollowUpTemplate, context: Dict) -> Dict:
+        """
+        Builds the completion request for a follow-up message.
+        """
+        return {
+            "model": "gpt-4",
+            "messages": [
                 {"role": "system", "content": "You are a real estate follow-up expert."},
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": self._create_message_prompt(template, context)}
             ],
-            temperature=0.7,
-            max_tokens=500
-        )
+            "temperature": 0.7,
+            "max_tokens": 500
+        }
 
-        # Process the response
-        message = self._process_message_response(response.choices[0].message.content)
-        
-        # Update schedule
+    def _record_contact(self, lead_id: UUID, template: FollowUpTemplate) -> None:
         schedule = self.follow_up_schedules[lead_id]
         schedule.last_contact = datetime.now()
         schedule.next_contact = self._calculate_next_contact(template)
         schedule.notes.append(f"Sent {template.name} on {datetime.now().isoformat()}")
 
-        return message
-
     def _select_templates(self, lead_data: Dict) -> List[FollowUpTemplate]:
         """
         Selects appropriate templates based on lead data and status.
@@ -148,7 +196,7 @@ class FollowUpAgent:
         """
         prompt = f"""
         Please generate a personalized follow-up message using this template:
-        {template.content}
+        {template.render(context)}
 
         Context:
         Lead Name: {context.get('lead_name', 'Not specified')}
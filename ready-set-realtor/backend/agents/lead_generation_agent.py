@@ -2,8 +2,9 @@ from typing import Dict, List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from uuid import UUID
-import openai
 from ..mcp.core import AgentContext, AgentType, AgentState
+from ..core.llm_cache import llm_cache
+from ..services.openai_service import openai_service
 
 class LeadQualificationCriteria(BaseModel):
     budget_min: Optional[float]
@@ -16,7 +17,12 @@ class LeadQualificationCriteria(BaseModel):
 class LeadGenerationAgent:
     def __init__(self, context: AgentContext):
         self.context = context
-        self.openai_client = openai.OpenAI()
+        self.qualification_criteria = {}
+
+    def reset(self) -> None:
+        """
+        Forgets the criteria from the previous task.
+        """
         self.qualification_criteria = {}
 
     async def qualify_lead(self, lead_data: Dict) -> Dict:
@@ -31,7 +37,9 @@ class LeadGenerationAgent:
         prompt = self._create_qualification_prompt(conversation_history, criteria)
 
         # Get qualification assessment from OpenAI
-        response = await self.openai_client.chat.completions.create(
+        content = await llm_cache.complete(
+            AgentType.LEAD_GENERATION.value,
+            openai_service.chat_completion,
             model="gpt-4",
             messages=[
                 {"role": "system", "content": "You are a real estate lead qualification expert."},
@@ -42,7 +50,7 @@ class LeadGenerationAgent:
         )
 
         # Process the response
-        qualification_result = self._process_qualification_response(response.choices[0].message.content)
+        qualification_result = self._process_qualification_response(content)
         
         return qualification_result
 
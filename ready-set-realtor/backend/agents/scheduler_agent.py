@@ -1,9 +1,12 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from uuid import UUID
-import openai
 from ..mcp.core import AgentContext, AgentType, AgentState
+from ..core.config import settings
+from ..core.intervals import IntervalIndex, working_slots
+from ..core.llm_cache import llm_cache
+from ..services.openai_service import openai_service
 
 class TimeSlot(BaseModel):
     start_time: datetime
@@ -26,39 +29,59 @@ class Appointment(BaseModel):
 class SchedulerAgent:
     def __init__(self, context: AgentContext):
         self.context = context
-        self.openai_client = openai.OpenAI()
-        self.time_slots: Dict[datetime, TimeSlot] = {}
+        # Booked intervals; free slots are computed from the gaps rather than stored
+        self.bookings = IntervalIndex()
         self.appointments: Dict[UUID, Appointment] = {}
+        self.opens = time(settings.AVAILABILITY_DAY_START_HOUR)
+        self.closes = time(settings.AVAILABILITY_DAY_END_HOUR)
+        self.step = timedelta(minutes=settings.AVAILABILITY_SLOT_MINUTES)
+
+    def reset(self) -> None:
+        """
+        Empties the calendar loaded for the previous task.
+        """
+        self.bookings = IntervalIndex()
+        self.appointments = {}
+
+    def load_appointments(self, appointments: List[Appointment]) -> None:
+        """
+        Index appointments already on the calendar, e.g. from the persisted store.
+        """
+        for appointment in appointments:
+            self.appointments[appointment.appointment_id] = appointment
+            if appointment.status != "cancelled":
+                self.bookings.add(appointment.start_time, appointment.end_time, appointment.appointment_id)
 
     async def find_available_slots(self, date: datetime, duration: int = 60) -> List[TimeSlot]:
         """
         Finds available time slots for a given date and duration (in minutes).
         """
-        available_slots = []
-        current_date = date.replace(hour=9, minute=0, second=0, microsecond=0)  # Start at 9 AM
-        end_date = current_date.replace(hour=17, minute=0)  # End at 5 PM
-
-        while current_date < end_date:
-            slot_end = current_date + timedelta(minutes=duration)
-            if slot_end <= end_date:
-                slot = self.time_slots.get(current_date)
-                if not slot:
-                    slot = TimeSlot(start_time=current_date, end_time=slot_end)
-                    self.time_slots[current_date] = slot
-                
-                if slot.is_available:
-                    available_slots.append(slot)
-            
-            current_date += timedelta(minutes=30)  # 30-minute intervals
-
-        return available_slots
+        day = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        slots = working_slots(
+            self.bookings, day, day + timedelta(days=1), timedelta(minutes=duration),
+            self.step, self.opens, self.closes
+        )
+        return [TimeSlot(start_time=start, end_time=end) for start, end in slots]
+
+    async def next_available_slot(self, after: datetime, duration: int = 60, days: int = 30) -> Optional[TimeSlot]:
+        """
+        Finds the earliest available slot of the given duration (in minutes) after a time.
+        """
+        slots = working_slots(
+            self.bookings, after, after + timedelta(days=days), timedelta(minutes=duration),
+            self.step, self.opens, self.closes
+        )
+        slot = next(slots, None)
+        if slot is None:
+            return None
+        return TimeSlot(start_time=slot[0], end_time=slot[1])
 
     async def schedule_appointment(self, lead_id: UUID, agent_id: UUID, slot: TimeSlot, 
                                  appointment_type: str, location: str) -> Appointment:
         """
         Schedules an appointment for a specific time slot.
         """
-        if not slot.is_available:
+        if not slot.is_available or not self.bookings.is_free(slot.start_time, slot.end_time):
             raise ValueError("Time slot is not available")
 
         appointment = Appointment(
@@ -73,6 +96,7 @@ class SchedulerAgent:
             notes=None
         )
 
+        self.bookings.add(slot.start_time, slot.end_time, appointment.appointment_id)
         slot.is_available = False
         slot.booking_id = appointment.appointment_id
         self.appointments[appointment.appointment_id] = appointment
@@ -89,15 +113,17 @@ class SchedulerAgent:
         """
         if appointment_id not in self.appointments:
             raise ValueError("Appointment not found")
-        if not new_slot.is_available:
-            raise ValueError("New time slot is not available")
 
         appointment = self.appointments[appointment_id]
-        old_slot = self.time_slots.get(appointment.start_time)
-        if old_slot:
-            old_slot.is_available = True
-            old_slot.booking_id = None
+        booked = appointment_id in self.bookings
+        if booked:
+            self.bookings.remove(appointment_id)
+        if not new_slot.is_available or not self.bookings.is_free(new_slot.start_time, new_slot.end_time):
+            if booked:
+                self.bookings.add(appointment.start_time, appointment.end_time, appointment_id)
+            raise ValueError("New time slot is not available")
 
+        self.bookings.add(new_slot.start_time, new_slot.end_time, appointment_id)
         appointment.start_time = new_slot.start_time
         appointment.end_time = new_slot.end_time
         new_slot.is_available = False
@@ -117,10 +143,8 @@ class SchedulerAgent:
             raise ValueError("Appointment not found")
 
         appointment = self.appointments[appointment_id]
-        slot = self.time_slots.get(appointment.start_time)
-        if slot:
-            slot.is_available = True
-            slot.booking_id = None
+        if appointment_id in self.bookings:
+            self.bookings.remove(appointment_id)
 
         appointment.status = "cancelled"
         
@@ -143,10 +167,80 @@ class SchedulerAgent:
 
         return reminder
 
+    def stream_message(self, appointment: Appointment, kind: str) -> AsyncIterator[str]:
+        """
+        Streams a confirmation, reschedule, cancellation or reminder message as it is generated.
+        """
+        prompts = {
+            "confirmation": self._confirmation_prompt,
+            "reschedule": self._reschedule_prompt,
+            "cancellation": self._cancellation_prompt,
+            "reminder": self._reminder_prompt,
+        }
+        if kind not in prompts:
+            raise ValueError("Unknown message type")
+
+        return llm_cache.stream(
+            AgentType.SCHEDULER.value,
+            openai_service.stream_chat_completion,
+            **self._message_request(prompts[kind](appointment))
+        )
+
+    async def _generate_message(self, prompt: str) -> str:
+        return await llm_cache.complete(
+            AgentType.SCHEDULER.value,
+            openai_service.chat_completion,
+            **self._message_request(prompt)
+        )
+
+    def _message_request(self, prompt: str) -> Dict:
+        """
+        Builds the completion request for an appointment message.
+        """
+        return {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "system", "content": "You are a professional real estate scheduling assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 500
+        }
+
     async def _generate_confirmation_message(self, appointment: Appointment) -> str:
         """
         Generates a confirmation message for a new appointment.
         """
+        return await self._generate_message(self._confirmation_prompt(appointment))
+
+    async def _generate_reschedule_message(self, appointment: Appointment) -> str:
+        """
+        Generates a message for a rescheduled appointment.
+        """
+        return await self._generate_message(self._reschedule_prompt(appointment))
+
+    async def _generate_cancellation_message(self, appointment: Appointment) -> str:
+        """
+        Generates a cancellation message for an appointment.
+        """
+        return await self._generate_message(self._cancellation_prompt(appointment))
+
+    async def _generate_reminder_message(self, appointment: Appointment) -> Dict:
+        """
+        Generates a reminder message for an upcoming appointment.
+        """
+        content = await self._generate_message(self._reminder_prompt(appointment))
+
+        return {
+            'content': content,
+            'generated_at': datetime.now().isoformat(),
+            'metadata': {
+                'type': 'reminder',
+                'version': '1.0'
+            }
+        }
+
+    def _confirmation_prompt(self, appointment: Appointment) -> str:
         prompt = f"""
         Please generate a professional appointment confirmation message with the following details:
         
@@ -161,23 +255,9 @@ class SchedulerAgent:
         3. What to bring/prepare
         4. Contact information for questions
         """
+        return prompt
 
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a professional real estate scheduling assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-
-        return response.choices[0].message.content
-
-    async def _generate_reschedule_message(self, appointment: Appointment) -> str:
-        """
-        Generates a message for a rescheduled appointment.
-        """
+    def _reschedule_prompt(self, appointment: Appointment) -> str:
         prompt = f"""
         Please generate a professional appointment rescheduling confirmation with the following details:
         
@@ -192,23 +272,9 @@ class SchedulerAgent:
         3. Confirmation request
         4. Contact information for questions
         """
+        return prompt
 
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a professional real estate scheduling assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-
-        return response.choices[0].message.content
-
-    async def _generate_cancellation_message(self, appointment: Appointment) -> str:
-        """
-        Generates a cancellation message for an appointment.
-        """
+    def _cancellation_prompt(self, appointment: Appointment) -> str:
         prompt = f"""
         Please generate a professional appointment cancellation message for:
         
@@ -221,23 +287,9 @@ class SchedulerAgent:
         2. Option to reschedule
         3. Contact information for questions
         """
+        return prompt
 
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a professional real estate scheduling assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-
-        return response.choices[0].message.content
-
-    async def _generate_reminder_message(self, appointment: Appointment) -> Dict:
-        """
-        Generates a reminder message for an upcoming appointment.
-        """
+    def _reminder_prompt(self, appointment: Appointment) -> str:
         prompt = f"""
         Please generate a friendly reminder message for an upcoming appointment:
         
@@ -252,25 +304,7 @@ class SchedulerAgent:
         3. Any preparation instructions
         4. Contact information
         """
-
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a professional real estate scheduling assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-
-        return {
-            'content': response.choices[0].message.content,
-            'generated_at': datetime.now().isoformat(),
-            'metadata': {
-                'type': 'reminder',
-                'version': '1.0'
-            }
-        }
+        return prompt
 
     async def update_context(self, new_context: Dict) -> None:
         """
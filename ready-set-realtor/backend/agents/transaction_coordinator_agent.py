@@ -1,22 +1,36 @@
-from typing import Dict, List, Optional
+import re
+from typing import AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 from uuid import UUID
-import openai
 from ..mcp.core import AgentContext, AgentType, AgentState
+from ..core.llm_cache import llm_cache
+from ..services.openai_service import openai_service
+
+def milestone_key(name: str) -> str:
+    """
+    Stable lookup key for a milestone name, e.g. "Loan Approval" -> "loan_approval".
+    """
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
 
 class TransactionMilestone(BaseModel):
+    key: str
     name: str
     due_date: datetime
     status: str
-    description: Optional[str]
-    assigned_to: Optional[str]
-    completed_at: Optional[datetime]
+    description: Optional[str] = None
+    assigned_to: Optional[str] = None
+    completed_at: Optional[datetime] = None
 
 class TransactionCoordinatorAgent:
     def __init__(self, context: AgentContext):
         self.context = context
-        self.openai_client = openai.OpenAI()
+        self.active_transactions = {}
+
+    def reset(self) -> None:
+        """
+        Forgets transactions tracked for the previous task.
+        """
         self.active_transactions = {}
 
     async def create_transaction(self, transaction_data: Dict) -> Dict:
@@ -29,6 +43,7 @@ class TransactionCoordinatorAgent:
         self.active_transactions[transaction_id] = {
             'data': transaction_data,
             'milestones': milestones,
+            'milestones_by_key': {milestone.key: milestone for milestone in milestones},
             'status': 'active',
             'created_at': datetime.now(),
             'last_updated': datetime.now()
@@ -43,41 +58,61 @@ class TransactionCoordinatorAgent:
         if transaction_id not in self.active_transactions:
             raise ValueError("Transaction not found")
 
-        # Create the prompt for document generation
-        prompt = self._create_document_prompt(document_type, context)
-
         # Get document content from OpenAI
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a real estate document generation expert."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=1000
+        content = await llm_cache.complete(
+            AgentType.TRANSACTION_COORDINATOR.value,
+            openai_service.chat_completion,
+            **self._document_request(document_type, context)
         )
 
         # Process the response into a structured document
-        document = self._process_document_response(response.choices[0].message.content)
+        document = self._process_document_response(content)
         
         return document
 
+    def stream_document(self, transaction_id: UUID, document_type: str, context: Dict) -> AsyncIterator[str]:
+        """
+        Streams a real estate document's text as it is generated.
+        """
+        if transaction_id not in self.active_transactions:
+            raise ValueError("Transaction not found")
+
+        return llm_cache.stream(
+            AgentType.TRANSACTION_COORDINATOR.value,
+            openai_service.stream_chat_completion,
+            **self._document_request(document_type, context)
+        )
+
+    def _document_request(self, document_type: str, context: Dict) -> Dict:
+        """
+        Builds the completion request for a document.
+        """
+        return {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "system", "content": "You are a real estate document generation expert."},
+                {"role": "user", "content": self._create_document_prompt(document_type, context)}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 1000
+        }
+
     async def update_milestone(self, transaction_id: UUID, milestone_name: str, status: str) -> Dict:
         """
-        Updates the status of a transaction milestone.
+        Updates the status of a transaction milestone, given its name or key.
         """
         if transaction_id not in self.active_transactions:
             raise ValueError("Transaction not found")
 
         transaction = self.active_transactions[transaction_id]
-        for milestone in transaction['milestones']:
-            if milestone.name == milestone_name:
-                milestone.status = status
-                if status == 'completed':
-                    milestone.completed_at = datetime.now()
-                transaction['last_updated'] = datetime.now()
-                break
-
+        milestone = transaction['milestones_by_key'].get(milestone_key(milestone_name))
+        if milestone is None:
+            raise ValueError("Milestone not found")
+
+        milestone.status = status
+        if status == 'completed':
+            milestone.completed_at = datetime.now()
+        transaction['last_updated'] = datetime.now()
         return transaction
 
     def _generate_transaction_milestones(self, transaction_data: Dict) -> List[TransactionMilestone]:
@@ -88,30 +123,35 @@ class TransactionCoordinatorAgent:
         base_date = datetime.now()
         milestones = [
             TransactionMilestone(
+                key="contract_signed",
                 name="Contract Signed",
                 due_date=base_date + timedelta(days=1),
                 status="pending",
                 description="Get purchase agreement signed by all parties"
             ),
             TransactionMilestone(
+                key="earnest_money_deposited",
                 name="Earnest Money Deposited",
                 due_date=base_date + timedelta(days=3),
                 status="pending",
                 description="Ensure earnest money is deposited into escrow"
             ),
             TransactionMilestone(
+                key="inspection_period",
                 name="Inspection Period",
                 due_date=base_date + timedelta(days=10),
                 status="pending",
                 description="Complete all property inspections"
             ),
             TransactionMilestone(
+                key="loan_approval",
                 name="Loan Approval",
                 due_date=base_date + timedelta(days=21),
                 status="pending",
                 description="Obtain final loan approval"
             ),
             TransactionMilestone(
+                key="closing",
                 name="Closing",
                 due_date=base_date + timedelta(days=30),
                 status="pending",
@@ -0,0 +1,208 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from ..core.config import settings
+from ..core.database import get_db
+from ..core.security import get_current_user, TokenData
+from ..schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentResponse, TimeSlot
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.lead import Lead
+from ..services.availability_service import SlotUnavailableError, as_aware, availability_service
+
+router = APIRouter(prefix="/appointments", tags=["appointments"])
+
+async def get_appointment(db: AsyncSession, appointment_id: UUID, user_id: UUID) -> Appointment:
+    result = await db.execute(
+        select(Appointment).where(
+            Appointment.id == appointment_id,
+            Appointment.user_id == user_id
+        )
+    )
+    appointment = result.scalars().first()
+
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Appointment not found"
+        )
+
+    return appointment
+
+def check_range(start: datetime, end: datetime) -> None:
+    start, end = as_aware(start), as_aware(end)
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start"
+        )
+    if end - start > timedelta(days=settings.AVAILABILITY_SEARCH_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Ranges are limited to {settings.AVAILABILITY_SEARCH_DAYS} days"
+        )
+
+@router.post("", response_model=AppointmentResponse)
+async def create_appointment(
+    appointment_data: AppointmentCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Book an appointment on the current user's calendar.
+
+    Returns 409 if it overlaps another booking.
+    """
+    if appointment_data.lead_id is not None:
+        result = await db.execute(
+            select(Lead.id).where(
+                Lead.id == appointment_data.lead_id,
+                Lead.user_id == current_user.user_id
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lead not found"
+            )
+
+    appointment = Appointment(user_id=current_user.user_id, **appointment_data.model_dump())
+    try:
+        return await availability_service.book(db, appointment)
+    except SlotUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("", response_model=List[AppointmentResponse])
+async def get_appointments(
+    start: datetime,
+    end: datetime,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get the current user's appointments starting between start and end.
+    """
+    check_range(start, end)
+    result = await db.execute(
+        select(Appointment).where(
+            Appointment.user_id == current_user.user_id,
+            Appointment.start_time >= start,
+            Appointment.start_time < end
+        ).order_by(Appointment.start_time)
+    )
+    return result.scalars().all()
+
+@router.get("/availability", response_model=List[TimeSlot])
+async def get_availability(
+    start: datetime,
+    end: datetime,
+    duration: int = Query(60, ge=1, le=settings.APPOINTMENT_MAX_MINUTES),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get the free slots of `duration` minutes within working hours between start and end.
+    """
+    check_range(start, end)
+    slots = await availability_service.free_slots(
+        db, current_user.user_id, start, end, timedelta(minutes=duration)
+    )
+    return [TimeSlot(start_time=slot_start, end_time=slot_end) for slot_start, slot_end in slots]
+
+@router.get("/availability/next", response_model=TimeSlot)
+async def get_next_available(
+    duration: int = Query(60, ge=1, le=settings.APPOINTMENT_MAX_MINUTES),
+    after: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get the earliest free slot of `duration` minutes, from now or `after`.
+    """
+    slot = await availability_service.next_available(
+        db, current_user.user_id, after or datetime.now(timezone.utc), timedelta(minutes=duration)
+    )
+    if slot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No free slot in the next {settings.AVAILABILITY_SEARCH_DAYS} days"
+        )
+
+    slot_start, slot_end = slot
+    return TimeSlot(start_time=slot_start, end_time=slot_end)
+
+@router.get("/{appointment_id}", response_model=AppointmentResponse)
+async def get_appointment_by_id(
+    appointment_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get a specific appointment by ID.
+    """
+    return await get_appointment(db, appointment_id, current_user.user_id)
+
+@router.patch("/{appointment_id}", response_model=AppointmentResponse)
+async def update_appointment(
+    appointment_id: UUID,
+    appointment_data: AppointmentUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Update an appointment; new times and reopened appointments are checked against the rest of the calendar.
+    """
+    appointment = await get_appointment(db, appointment_id, current_user.user_id)
+    was_cancelled = appointment.status == AppointmentStatus.CANCELLED
+    changes = appointment_data.model_dump(exclude_unset=True)
+    start = changes.pop("start_time", None)
+    end = changes.pop("end_time", None)
+
+    for field, value in changes.items():
+        setattr(appointment, field, value)
+
+    # A cancelled appointment no longer holds its slot, so reopening it must claim the slot again
+    reopened = was_cancelled and appointment.status != AppointmentStatus.CANCELLED
+    if start is not None or end is not None or reopened:
+        try:
+            return await availability_service.reschedule(
+                db, appointment, start or appointment.start_time, end or appointment.end_time
+            )
+        except SlotUnavailableError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=str(e)
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    await db.commit()
+    await db.refresh(appointment)
+    return appointment
+
+@router.delete("/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_appointment(
+    appointment_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Cancel an appointment, freeing its slot.
+    """
+    appointment = await get_appointment(db, appointment_id, current_user.user_id)
+    appointment.status = AppointmentStatus.CANCELLED
+    await db.commit()
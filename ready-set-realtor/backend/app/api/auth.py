@@ -1,27 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
 from ..core.security import (
-    verify_password,
     create_access_token,
-    get_password_hash,
     Token
 )
 from ..core.database import get_db
+from ..core.hashing import password_hasher
 from ..schemas.user import UserCreate, UserResponse
 from ..models.user import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=UserResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user.
     """
     # Check if user already exists
-    if db.query(User).filter(User.email == user_data.email).first():
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    if result.scalars().first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -34,25 +35,26 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         company_name=user_data.company_name,
         license_number=user_data.license_number,
         role=user_data.role,
-        hashed_password=get_password_hash(user_data.password)
+        hashed_password=await password_hasher.hash(user_data.password)
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     OAuth2 compatible token login.
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    result = await db.execute(select(User).where(User.email == form_data.username))
+    user = result.scalars().first()
+    if not user or not await password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
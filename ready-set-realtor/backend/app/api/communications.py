@@ -1,62 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import Optional
 from datetime import datetime
 
-from ..core.database import get_db
-from ..core.security import get_current_user
-from ..models.user import User
+from ..core.database import get_db, get_sessionmaker
+from ..core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
+from ..core.security import get_current_user, TokenData
+from ..core.streaming import export_response
 from ..models.communication import Communication, CommunicationType, CommunicationDirection, CommunicationStatus
+from ..models.lead import Lead
 from ..schemas.communication import (
     CommunicationCreate,
     CommunicationUpdate,
     CommunicationResponse,
     EmailCommunication,
     SMSCommunication,
+    BulkSMSCommunication,
+    BulkSMSResponse,
     CallCommunication,
 )
+from ..schemas.pagination import Page
 from ..services.email_service import email_service
 from ..services.twilio_service import twilio_service
 from ..services.vapi_service import vapi_service
 
 router = APIRouter(prefix="/communications", tags=["communications"])
 
-@router.get("/", response_model=List[CommunicationResponse])
+@router.get("/", response_model=Page[CommunicationResponse])
 async def get_communications(
-    skip: int = 0,
-    limit: int = 100,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all communications for the current user.
+    Get the current user's communications, newest first, one cursor page at a time.
     """
-    communications = (
-        db.query(Communication)
-        .filter(Communication.user_id == user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = select(Communication).where(Communication.user_id == current_user.user_id)
+    return await paginate(db, query, Communication, cursor, limit)
+
+@router.get("/export")
+async def export_communications(
+    file_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    compress: bool = False,
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user),
+):
+    """
+    Stream every communication for the current user as NDJSON or CSV.
+    """
+    query = (
+        select(Communication)
+        .where(Communication.user_id == current_user.user_id)
+        .order_by(Communication.created_at, Communication.id)
     )
-    return communications
+    return export_response(session_factory, query, CommunicationResponse, file_format, "communications", compress=compress)
 
 @router.get("/{communication_id}", response_model=CommunicationResponse)
 async def get_communication(
     communication_id: str,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get a specific communication by ID.
     """
-    communication = (
-        db.query(Communication)
-        .filter(
+    result = await db.execute(
+        select(Communication)
+        .where(
             Communication.id == communication_id,
-            Communication.user_id == user.id,
+            Communication.user_id == current_user.user_id,
         )
-        .first()
     )
+    communication = result.scalars().first()
     if not communication:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -67,8 +84,8 @@ async def get_communication(
 @router.post("/email", response_model=CommunicationResponse)
 async def send_email(
     email_data: EmailCommunication,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Send an email communication.
@@ -86,7 +103,7 @@ async def send_email(
 
         # Create communication record
         communication = Communication(
-            user_id=user.id,
+            user_id=current_user.user_id,
             lead_id=email_data.lead_id,
             type=CommunicationType.EMAIL,
             direction=CommunicationDirection.OUTBOUND,
@@ -96,8 +113,8 @@ async def send_email(
             metadata={"email_id": email_result["id"]},
         )
         db.add(communication)
-        db.commit()
-        db.refresh(communication)
+        await db.commit()
+        await db.refresh(communication)
         return communication
     except Exception as e:
         raise HTTPException(
@@ -108,8 +125,8 @@ async def send_email(
 @router.post("/sms", response_model=CommunicationResponse)
 async def send_sms(
     sms_data: SMSCommunication,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Send an SMS communication.
@@ -123,7 +140,7 @@ async def send_sms(
 
         # Create communication record
         communication = Communication(
-            user_id=user.id,
+            user_id=current_user.user_id,
             lead_id=sms_data.lead_id,
             type=CommunicationType.SMS,
             direction=CommunicationDirection.OUTBOUND,
@@ -133,8 +150,8 @@ async def send_sms(
             metadata={"message_id": sms_result["id"]},
         )
         db.add(communication)
-        db.commit()
-        db.refresh(communication)
+        await db.commit()
+        await db.refresh(communication)
         return communication
     except Exception as e:
         raise HTTPException(
@@ -142,11 +159,78 @@ async def send_sms(
             detail=str(e),
         )
 
+@router.post("/sms/bulk", response_model=BulkSMSResponse)
+async def send_sms_bulk(
+    sms_data: BulkSMSCommunication,
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Send one SMS to many leads concurrently, reporting the outcome per lead.
+    """
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id.in_(sms_data.lead_ids),
+            Lead.user_id == current_user.user_id,
+        )
+    )
+    leads = {lead.id: lead for lead in result.scalars().all()}
+
+    results = {}
+    recipients = []
+    for lead_id in dict.fromkeys(sms_data.lead_ids):
+        lead = leads.get(lead_id)
+        if lead is None:
+            results[lead_id] = {"lead_id": lead_id, "success": False, "error": "Lead not found"}
+        elif not lead.phone:
+            results[lead_id] = {"lead_id": lead_id, "success": False, "error": "Lead has no phone number"}
+        else:
+            recipients.append(lead)
+
+    outcomes = await twilio_service.send_sms_many([
+        {"to_number": lead.phone, "message": sms_data.message}
+        for lead in recipients
+    ])
+
+    # One communication record per attempted send, committed together
+    sent_at = datetime.utcnow()
+    communications = []
+    for lead, outcome in zip(recipients, outcomes):
+        communication = Communication(
+            user_id=current_user.user_id,
+            lead_id=lead.id,
+            type=CommunicationType.TEXT,
+            direction=CommunicationDirection.OUTBOUND,
+            content=sms_data.message,
+            status=CommunicationStatus.COMPLETED if outcome["success"] else CommunicationStatus.FAILED,
+            sent_at=sent_at if outcome["success"] else None,
+            metadata=(
+                {"message_id": outcome["message"]["id"]}
+                if outcome["success"]
+                else {"error": outcome["error"]}
+            ),
+        )
+        db.add(communication)
+        communications.append((communication, outcome))
+    await db.commit()
+
+    for communication, outcome in communications:
+        results[communication.lead_id] = {
+            "lead_id": communication.lead_id,
+            "success": outcome["success"],
+            "communication_id": communication.id,
+            "error": outcome["error"],
+        }
+
+    ordered = [results[lead_id] for lead_id in dict.fromkeys(sms_data.lead_ids)]
+    sent = sum(1 for item in ordered if item["success"])
+    return {"sent": sent, "failed": len(ordered) - sent, "results": ordered}
+
 @router.post("/call", response_model=CommunicationResponse)
 async def make_call(
     call_data: CallCommunication,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Make a voice call using Vapi.ai.
@@ -162,7 +246,7 @@ async def make_call(
 
         # Create communication record
         communication = Communication(
-            user_id=user.id,
+            user_id=current_user.user_id,
             lead_id=call_data.lead_id,
             type=CommunicationType.CALL,
             direction=CommunicationDirection.OUTBOUND,
@@ -171,8 +255,8 @@ async def make_call(
             metadata={"call_id": call_result["id"]},
         )
         db.add(communication)
-        db.commit()
-        db.refresh(communication)
+        await db.commit()
+        await db.refresh(communication)
         return communication
     except Exception as e:
         raise HTTPException(
@@ -183,8 +267,8 @@ async def make_call(
 @router.get("/call/{call_id}/transcript")
 async def get_call_transcript(
     call_id: str,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get the transcript of a call.
@@ -202,8 +286,8 @@ async def get_call_transcript(
 @router.get("/call/{call_id}/recording")
 async def get_call_recording(
     call_id: str,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get the recording URL of a call.
@@ -1,27 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import List, Optional
 from uuid import UUID
 
-from ..core.database import get_db
+from ..core.config import settings
+from ..core.database import get_db, get_sessionmaker
+from ..core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 from ..core.security import get_current_user, TokenData
+from ..core.streaming import export_response, zip_response
 from ..schemas.document import (
     DocumentCreate,
     DocumentUpdate,
     DocumentResponse,
     DocumentGeneration,
+    DocumentBatchGeneration,
     DocumentSignatureRequest,
     DocumentSignatureStatus
 )
+from ..schemas.pagination import Page
 from ..models.document import Document, DocumentStatus
-from ..services.document_service import document_service
+from ..models.lead import Lead
+from ..services.document_service import document_service, signature_status_from_document
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 @router.post("", response_model=DocumentResponse)
 async def create_document(
     document_data: DocumentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
@@ -29,44 +36,67 @@ async def create_document(
     """
     db_document = Document(**document_data.model_dump())
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    await db.commit()
+    await db.refresh(db_document)
     return db_document
 
-@router.get("", response_model=List[DocumentResponse])
+@router.get("", response_model=Page[DocumentResponse])
 async def get_documents(
     lead_id: UUID = None,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
-    Get all documents, optionally filtered by lead_id.
+    Get documents newest first, optionally filtered by lead_id.
     """
-    query = db.query(Document).filter(
+    query = select(Document).where(
         Document.user_id == current_user.user_id
     )
     
     if lead_id:
-        query = query.filter(Document.lead_id == lead_id)
+        query = query.where(Document.lead_id == lead_id)
     
-    documents = query.offset(skip).limit(limit).all()
-    return documents
+    return await paginate(db, query, Document, cursor, limit)
+
+@router.get("/export")
+async def export_documents(
+    lead_id: UUID = None,
+    file_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    compress: bool = False,
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream every document for the current user as NDJSON or CSV.
+    """
+    query = select(Document).where(
+        Document.user_id == current_user.user_id
+    )
+    
+    if lead_id:
+        query = query.where(Document.lead_id == lead_id)
+    
+    query = query.order_by(Document.created_at, Document.id)
+    return export_response(session_factory, query, DocumentResponse, file_format, "documents", compress=compress)
 
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Get a specific document by ID.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.user_id == current_user.user_id
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -80,16 +110,19 @@ async def get_document(
 async def update_document(
     document_id: UUID,
     document_data: DocumentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Update a document's information.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.user_id == current_user.user_id
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -100,14 +133,14 @@ async def update_document(
     for field, value in document_data.model_dump(exclude_unset=True).items():
         setattr(document, field, value)
 
-    db.commit()
-    db.refresh(document)
+    await db.commit()
+    await db.refresh(document)
     return document
 
 @router.post("/generate", response_model=DocumentResponse)
 async def generate_document(
     generation_data: DocumentGeneration,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
@@ -130,24 +163,105 @@ async def generate_document(
     )
     
     db.add(document)
-    db.commit()
-    db.refresh(document)
+    await db.commit()
+    await db.refresh(document)
     return document
 
+@router.post("/generate/batch", response_model=List[DocumentResponse])
+async def generate_documents(
+    batch: DocumentBatchGeneration,
+    archive: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Generate many documents from templates in one request.
+
+    All rows are written with a single multi-row INSERT. With `archive=true`
+    the rendered documents are streamed back as a zip instead of JSON.
+    """
+    if len(batch.documents) > settings.DOCUMENT_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.DOCUMENT_BATCH_MAX_SIZE} documents per batch"
+        )
+
+    lead_ids = []
+    for index, item in enumerate(batch.documents):
+        try:
+            lead_ids.append(UUID(str(item.context["lead_id"])))
+        except (KeyError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Document {index}: context.lead_id must be a lead UUID"
+            )
+
+    result = await db.execute(
+        select(Lead.id).where(
+            Lead.id.in_(set(lead_ids)),
+            Lead.user_id == current_user.user_id
+        )
+    )
+    owned = set(result.scalars().all())
+    for index, lead_id in enumerate(lead_ids):
+        if lead_id not in owned:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Document {index}: lead not found"
+            )
+
+    try:
+        contents = await document_service.generate_documents([
+            (item.template_name, item.context) for item in batch.documents
+        ])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    rows = [
+        {
+            "user_id": current_user.user_id,
+            "lead_id": lead_id,
+            "title": f"{item.template_name} - {item.context.get('property_address')}",
+            "type": item.template_name,
+            "content": content,
+            "status": DocumentStatus.DRAFT,
+        }
+        for item, lead_id, content in zip(batch.documents, lead_ids, contents)
+    ]
+    result = await db.scalars(insert(Document).returning(Document), rows)
+    documents = result.all()
+    await db.commit()
+
+    if archive:
+        return zip_response(
+            (
+                (f"{index + 1:03d}-{document.type.value}-{document.id}.txt", document.content)
+                for index, document in enumerate(documents)
+            ),
+            "documents",
+        )
+    return documents
+
 @router.post("/{document_id}/sign", response_model=DocumentResponse)
 async def send_for_signature(
     document_id: UUID,
     signature_request: DocumentSignatureRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Send a document for electronic signature.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.user_id == current_user.user_id
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -170,23 +284,26 @@ async def send_for_signature(
         "sent_for_signature_at": datetime.now().isoformat()
     })
 
-    db.commit()
-    db.refresh(document)
+    await db.commit()
+    await db.refresh(document)
     return document
 
 @router.get("/{document_id}/signature-status", response_model=DocumentSignatureStatus)
 async def get_signature_status(
     document_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Get the signature status of a document.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.user_id == current_user.user_id
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -200,12 +317,10 @@ async def get_signature_status(
             detail="Document has not been sent for signature"
         )
 
-    # Get signature status from DocuSign
-    status = await document_service.get_signature_status(document.docusign_id)
+    # Kept current by DocuSign Connect events and the envelope sync job
+    signature_status = signature_status_from_document(document)
 
     return DocumentSignatureStatus(
         document_id=document.id,
-        status=status["status"],
-        signed_by=status.get("signed_by"),
-        signed_at=status.get("completed_datetime")
-    ) 
\ No newline at end of file
+        **signature_status
+    )
@@ -0,0 +1,195 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import AsyncIterator, Awaitable, Callable, Dict, Tuple
+from uuid import UUID, uuid4
+
+from ..core.database import get_db, get_sessionmaker
+from ..core.security import get_current_user, TokenData
+from ..core.streaming import sse_response
+from ..schemas.draft import AppointmentMessageDraftCreate, DocumentDraftCreate, FollowUpDraftCreate
+from ..models.communication import Communication, CommunicationDirection, CommunicationStatus, CommunicationType
+from ..models.document import Document, DocumentStatus
+from ..models.lead import Lead
+from ..agents.scheduler_agent import Appointment
+from ..mcp.core import AgentType
+from ..mcp.pool import agent_pool
+
+router = APIRouter(prefix="/drafts", tags=["drafts"])
+
+async def draft_events(
+    deltas: AsyncIterator[str],
+    save: Callable[[str], Awaitable[UUID]],
+) -> AsyncIterator[Tuple[str, Dict]]:
+    """
+    Relay generated text as `token` events, then save the full text and send `done`.
+
+    The response has started by the time generation fails, so errors are
+    reported as an `error` event. Nothing is saved unless the text completes;
+    a client that disconnects cancels the generation.
+    """
+    parts = []
+    try:
+        async for delta in deltas:
+            parts.append(delta)
+            yield "token", {"text": delta}
+    except Exception as e:
+        print(f"Error streaming draft: {str(e)}")
+        yield "error", {"detail": "Generation failed"}
+        return
+
+    draft_id = await save("".join(parts))
+    yield "done", {"id": str(draft_id)}
+
+async def get_lead(db: AsyncSession, lead_id: UUID, user_id: UUID) -> Lead:
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id == lead_id,
+            Lead.user_id == user_id
+        )
+    )
+    lead = result.scalars().first()
+
+    if not lead:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lead not found"
+        )
+
+    return lead
+
+def save_communication(
+    session_factory: async_sessionmaker,
+    user_id: UUID,
+    lead_id: UUID,
+    channel: CommunicationType,
+    metadata: Dict,
+) -> Callable[[str], Awaitable[UUID]]:
+    async def save(content: str) -> UUID:
+        async with session_factory() as session:
+            communication = Communication(
+                user_id=user_id,
+                lead_id=lead_id,
+                type=channel,
+                direction=CommunicationDirection.OUTBOUND,
+                status=CommunicationStatus.SCHEDULED,
+                content=content,
+                metadata={"draft": True, **metadata}
+            )
+            session.add(communication)
+            await session.commit()
+            return communication.id
+
+    return save
+
+@router.post("/follow-up")
+async def stream_follow_up_draft(
+    draft: FollowUpDraftCreate,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream a follow-up message for a lead over server-sent events.
+
+    Emits `token` events as text arrives and `done` with the saved
+    communication's id once the message is complete.
+    """
+    lead = await get_lead(db, draft.lead_id, current_user.user_id)
+
+    # The agent stays checked out until the stream ends
+    agent = agent_pool.checkout(AgentType.FOLLOW_UP)
+    try:
+        await agent.create_follow_up_schedule(lead.id, {"stage": draft.context.get("stage", "initial_contact")})
+        deltas = agent.stream_follow_up_message(lead.id, draft.template_id, draft.context)
+    except ValueError as e:
+        agent_pool.release(agent)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except BaseException:
+        agent_pool.release(agent)
+        raise
+
+    template = agent.templates[draft.template_id]
+    save = save_communication(
+        session_factory,
+        current_user.user_id,
+        lead.id,
+        CommunicationType(template.channel),
+        {"template_id": template.template_id},
+    )
+    return sse_response(draft_events(agent_pool.hold(agent, deltas), save))
+
+@router.post("/appointment-message")
+async def stream_appointment_message_draft(
+    draft: AppointmentMessageDraftCreate,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream an appointment confirmation, reschedule, cancellation or reminder over server-sent events.
+    """
+    lead = await get_lead(db, draft.lead_id, current_user.user_id)
+
+    appointment = Appointment(
+        appointment_id=uuid4(),
+        lead_id=lead.id,
+        agent_id=current_user.user_id,
+        start_time=draft.start_time,
+        end_time=draft.end_time,
+        type=draft.type,
+        location=draft.location,
+        status="scheduled",
+        notes=None
+    )
+    agent = agent_pool.checkout(AgentType.SCHEDULER)
+    deltas = agent_pool.hold(agent, agent.stream_message(appointment, draft.kind))
+
+    save = save_communication(
+        session_factory,
+        current_user.user_id,
+        lead.id,
+        draft.channel,
+        {"appointment_message": draft.kind},
+    )
+    return sse_response(draft_events(deltas, save))
+
+@router.post("/document")
+async def stream_document_draft(
+    draft: DocumentDraftCreate,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream a generated document over server-sent events, saving it as a draft document.
+    """
+    lead = await get_lead(db, draft.lead_id, current_user.user_id)
+
+    agent = agent_pool.checkout(AgentType.TRANSACTION_COORDINATOR)
+    try:
+        # The agent keeps transactions in memory; the lead stands in for one here
+        await agent.create_transaction({**draft.context, "transaction_id": str(lead.id)})
+        deltas = agent_pool.hold(agent, agent.stream_document(lead.id, draft.type.value, draft.context))
+    except BaseException:
+        agent_pool.release(agent)
+        raise
+
+    async def save(content: str) -> UUID:
+        async with session_factory() as session:
+            document = Document(
+                user_id=current_user.user_id,
+                lead_id=lead.id,
+                title=draft.title,
+                type=draft.type,
+                content=content,
+                status=DocumentStatus.DRAFT
+            )
+            session.add(document)
+            await session.commit()
+            return document.id
+
+    return sse_response(draft_events(deltas, save))
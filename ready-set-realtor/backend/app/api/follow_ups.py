@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from uuid import UUID
+
+from ..core.database import get_db
+from ..core.security import get_current_user, TokenData
+from ..schemas.follow_up import FollowUpScheduleCreate, FollowUpScheduleResponse
+from ..models.follow_up_schedule import FollowUpSchedule
+from ..models.lead import Lead
+from ..services.follow_up_service import follow_up_service
+
+router = APIRouter(prefix="/follow-ups", tags=["follow-ups"])
+
+async def get_schedule(db: AsyncSession, schedule_id: UUID, user_id: UUID) -> FollowUpSchedule:
+    result = await db.execute(
+        select(FollowUpSchedule).where(
+            FollowUpSchedule.id == schedule_id,
+            FollowUpSchedule.user_id == user_id
+        )
+    )
+    schedule = result.scalars().first()
+
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Follow-up schedule not found"
+        )
+
+    return schedule
+
+@router.post("", response_model=FollowUpScheduleResponse, status_code=status.HTTP_201_CREATED)
+async def create_follow_up_schedule(
+    schedule_data: FollowUpScheduleCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Schedule follow-ups for a lead, replacing its active schedule.
+
+    Messages are generated and sent by the follow-up dispatcher as each comes due.
+    """
+    result = await db.execute(
+        select(Lead.id).where(
+            Lead.id == schedule_data.lead_id,
+            Lead.user_id == current_user.user_id
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lead not found"
+        )
+
+    try:
+        return await follow_up_service.create_schedule(
+            db, current_user.user_id, schedule_data.lead_id, schedule_data.stage, schedule_data.context
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("", response_model=List[FollowUpScheduleResponse])
+async def get_follow_up_schedules(
+    lead_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get a lead's follow-up schedules, newest first.
+    """
+    result = await db.execute(
+        select(FollowUpSchedule).where(
+            FollowUpSchedule.lead_id == lead_id,
+            FollowUpSchedule.user_id == current_user.user_id
+        ).order_by(FollowUpSchedule.created_at.desc())
+    )
+    return result.scalars().all()
+
+@router.get("/{schedule_id}", response_model=FollowUpScheduleResponse)
+async def get_follow_up_schedule(
+    schedule_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get a specific follow-up schedule by ID.
+    """
+    return await get_schedule(db, schedule_id, current_user.user_id)
+
+@router.delete("/{schedule_id}", response_model=FollowUpScheduleResponse)
+async def cancel_follow_up_schedule(
+    schedule_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Cancel a follow-up schedule; nothing more is sent for it.
+    """
+    schedule = await get_schedule(db, schedule_id, current_user.user_id)
+    return await follow_up_service.cancel_schedule(db, schedule)
@@ -1,21 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import Optional
 from uuid import UUID
 
-from ..core.database import get_db
+from ..core.database import get_db, get_sessionmaker
+from ..core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 from ..core.security import get_current_user, TokenData
-from ..schemas.lead import LeadCreate, LeadUpdate, LeadResponse, LeadQualification
+from ..core.streaming import export_response
+from ..schemas.lead import (
+    LeadCreate,
+    LeadUpdate,
+    LeadResponse,
+    LeadQualification,
+    LeadImportResult,
+    QualificationJobCreate,
+    QualificationJobResponse,
+)
+from ..schemas.pagination import Page
 from ..models.lead import Lead
-from ..agents.lead_generation_agent import LeadGenerationAgent
-from ..mcp.core import AgentContext, AgentType
+from ..models.qualification_job import QualificationJob
+from ..services.lead_import_service import lead_import_service
+from ..services.qualification_service import qualification_service
+from ..tasks import qualify_leads
+from ..mcp.core import AgentType
+from ..mcp.pool import agent_pool
 
 router = APIRouter(prefix="/leads", tags=["leads"])
 
 @router.post("", response_model=LeadResponse)
 async def create_lead(
     lead_data: LeadCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
@@ -23,38 +39,133 @@ async def create_lead(
     """
     db_lead = Lead(**lead_data.model_dump())
     db.add(db_lead)
-    db.commit()
-    db.refresh(db_lead)
+    await db.commit()
+    await db.refresh(db_lead)
     return db_lead
 
-@router.get("", response_model=List[LeadResponse])
+@router.post("/import", response_model=LeadImportResult)
+async def import_leads(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    batch_size: Optional[int] = Query(None, ge=1, le=10000),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Bulk import leads from a CSV or NDJSON file.
+
+    Rows are validated and inserted in batches; invalid rows are skipped and
+    reported by row number.
+    """
+    if file_format is None:
+        try:
+            file_format = lead_import_service.detect_format(file.filename, file.content_type)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    return await lead_import_service.import_leads(
+        db,
+        file.file,
+        file_format,
+        current_user.user_id,
+        batch_size=batch_size,
+    )
+
+@router.get("", response_model=Page[LeadResponse])
 async def get_leads(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
-    Get all leads for the current user.
+    Get the current user's leads, newest first, one cursor page at a time.
     """
-    leads = db.query(Lead).filter(
+    query = select(Lead).where(
         Lead.user_id == current_user.user_id
-    ).offset(skip).limit(limit).all()
-    return leads
+    )
+    return await paginate(db, query, Lead, cursor, limit)
+
+@router.get("/export")
+async def export_leads(
+    file_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    compress: bool = False,
+    session_factory: async_sessionmaker = Depends(get_sessionmaker),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream every lead for the current user as NDJSON or CSV.
+    """
+    query = select(Lead).where(
+        Lead.user_id == current_user.user_id
+    ).order_by(Lead.created_at, Lead.id)
+    return export_response(session_factory, query, LeadResponse, file_format, "leads", compress=compress)
+
+@router.post("/qualification-jobs", response_model=QualificationJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_qualification_job(
+    job_data: QualificationJobCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Queue a background job qualifying the given leads, or every lead matching the statuses.
+
+    Poll the returned job for progress.
+    """
+    job = await qualification_service.create_job(
+        db,
+        current_user.user_id,
+        lead_ids=job_data.lead_ids,
+        statuses=job_data.statuses,
+        criteria=job_data.criteria,
+    )
+    qualify_leads.delay(str(job.id))
+    return job
+
+@router.get("/qualification-jobs/{job_id}", response_model=QualificationJobResponse)
+async def get_qualification_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get a qualification job's status and progress.
+    """
+    result = await db.execute(
+        select(QualificationJob).where(
+            QualificationJob.id == job_id,
+            QualificationJob.user_id == current_user.user_id
+        )
+    )
+    job = result.scalars().first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Qualification job not found"
+        )
+
+    return job
 
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Get a specific lead by ID.
     """
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id == lead_id,
+            Lead.user_id == current_user.user_id
+        )
+    )
+    lead = result.scalars().first()
     
     if not lead:
         raise HTTPException(
@@ -68,16 +179,19 @@ async def get_lead(
 async def update_lead(
     lead_id: UUID,
     lead_data: LeadUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Update a lead's information.
     """
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id == lead_id,
+            Lead.user_id == current_user.user_id
+        )
+    )
+    lead = result.scalars().first()
     
     if not lead:
         raise HTTPException(
@@ -88,23 +202,26 @@ async def update_lead(
     for field, value in lead_data.model_dump(exclude_unset=True).items():
         setattr(lead, field, value)
 
-    db.commit()
-    db.refresh(lead)
+    await db.commit()
+    await db.refresh(lead)
     return lead
 
 @router.delete("/{lead_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_lead(
     lead_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Delete a lead.
     """
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id == lead_id,
+            Lead.user_id == current_user.user_id
+        )
+    )
+    lead = result.scalars().first()
     
     if not lead:
         raise HTTPException(
@@ -112,23 +229,26 @@ async def delete_lead(
             detail="Lead not found"
         )
 
-    db.delete(lead)
-    db.commit()
+    await db.delete(lead)
+    await db.commit()
 
 @router.post("/{lead_id}/qualify", response_model=dict)
 async def qualify_lead(
     lead_id: UUID,
     qualification_data: LeadQualification,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: TokenData = Depends(get_current_user)
 ):
     """
     Qualify a lead using the Lead Generation Agent.
     """
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.user_id == current_user.user_id
-    ).first()
+    result = await db.execute(
+        select(Lead).where(
+            Lead.id == lead_id,
+            Lead.user_id == current_user.user_id
+        )
+    )
+    lead = result.scalars().first()
     
     if not lead:
         raise HTTPException(
@@ -136,19 +256,12 @@ async def qualify_lead(
             detail="Lead not found"
         )
 
-    # Initialize Lead Generation Agent
-    agent_context = AgentContext(
-        agent_type=AgentType.LEAD_GENERATION,
-        capabilities=["lead_qualification"],
-        tools=[]
-    )
-    agent = LeadGenerationAgent(agent_context)
-
-    # Qualify the lead
-    qualification_result = await agent.qualify_lead({
-        "conversation_history": qualification_data.conversation_history,
-        "criteria": qualification_data.criteria
-    })
+    # Qualify the lead with a pooled Lead Generation Agent
+    async with agent_pool.acquire(AgentType.LEAD_GENERATION) as agent:
+        qualification_result = await agent.qualify_lead({
+            "conversation_history": qualification_data.conversation_history,
+            "criteria": qualification_data.criteria
+        })
 
     # Update lead status based on qualification
     lead.status = "qualified" if qualification_result.get("qualification_status") == "Qualified" else "contacted"
@@ -157,7 +270,7 @@ async def qualify_lead(
         "qualified_at": qualification_result.get("qualified_at")
     })
 
-    db.commit()
-    db.refresh(lead)
+    await db.commit()
+    await db.refresh(lead)
 
     return qualification_result 
\ No newline at end of file
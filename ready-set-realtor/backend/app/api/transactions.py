@@ -0,0 +1,148 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from ..core.config import settings
+from ..core.database import get_db
+from ..core.security import get_current_user, TokenData
+from ..schemas.transaction import MilestoneResponse, MilestoneUpdate, TransactionCreate, TransactionResponse
+from ..models.lead import Lead
+from ..models.transaction import Transaction, TransactionMilestone
+from ..services.transaction_service import transaction_service
+
+router = APIRouter(prefix="/transactions", tags=["transactions"])
+
+async def get_transaction(db: AsyncSession, transaction_id: UUID, user_id: UUID) -> Transaction:
+    result = await db.execute(
+        select(Transaction).where(
+            Transaction.id == transaction_id,
+            Transaction.user_id == user_id
+        )
+    )
+    transaction = result.scalars().first()
+
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction not found"
+        )
+
+    return transaction
+
+def transaction_response(transaction: Transaction, milestones: List[TransactionMilestone]) -> TransactionResponse:
+    response = TransactionResponse.model_validate(transaction)
+    response.milestones = [MilestoneResponse.model_validate(milestone) for milestone in milestones]
+    return response
+
+def window(within_hours: Optional[int]) -> Optional[timedelta]:
+    return timedelta(hours=within_hours) if within_hours is not None else None
+
+@router.post("", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
+async def create_transaction(
+    transaction_data: TransactionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Open a transaction with its planned milestones.
+    """
+    if transaction_data.lead_id is not None:
+        result = await db.execute(
+            select(Lead.id).where(
+                Lead.id == transaction_data.lead_id,
+                Lead.user_id == current_user.user_id
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lead not found"
+            )
+
+    transaction, milestones = await transaction_service.create_transaction(
+        db, current_user.user_id, **transaction_data.model_dump()
+    )
+    return transaction_response(transaction, milestones)
+
+@router.get("/milestones/due", response_model=List[MilestoneResponse])
+async def get_due_milestones(
+    within_hours: Optional[int] = Query(None, ge=1, le=24 * 90),
+    limit: int = Query(100, ge=1, le=settings.MILESTONE_QUERY_LIMIT),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Open milestones across the current user's deals due in the next `within_hours`, soonest first.
+    """
+    result = await db.execute(transaction_service.due_query(
+        datetime.now(timezone.utc), window(within_hours), current_user.user_id, limit
+    ))
+    return result.scalars().all()
+
+@router.get("/milestones/overdue", response_model=List[MilestoneResponse])
+async def get_overdue_milestones(
+    limit: int = Query(100, ge=1, le=settings.MILESTONE_QUERY_LIMIT),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Open milestones across the current user's deals that are past due, most overdue first.
+    """
+    result = await db.execute(transaction_service.overdue_query(
+        datetime.now(timezone.utc), current_user.user_id, limit
+    ))
+    return result.scalars().all()
+
+@router.get("/milestones/at-risk", response_model=List[MilestoneResponse])
+async def get_at_risk_milestones(
+    within_hours: Optional[int] = Query(None, ge=1, le=24 * 90),
+    limit: int = Query(100, ge=1, le=settings.MILESTONE_QUERY_LIMIT),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Milestones due in the next `within_hours` that are still pending, soonest first.
+    """
+    result = await db.execute(transaction_service.at_risk_query(
+        datetime.now(timezone.utc), window(within_hours), current_user.user_id, limit
+    ))
+    return result.scalars().all()
+
+@router.get("/{transaction_id}", response_model=TransactionResponse)
+async def get_transaction_by_id(
+    transaction_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Get a transaction and its milestones in due-date order.
+    """
+    transaction = await get_transaction(db, transaction_id, current_user.user_id)
+    return transaction_response(transaction, await transaction_service.get_milestones(db, transaction.id))
+
+@router.patch("/{transaction_id}/milestones/{key}", response_model=MilestoneResponse)
+async def update_milestone(
+    transaction_id: UUID,
+    key: str,
+    milestone_data: MilestoneUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Update a milestone by key, e.g. `inspection_period`.
+    """
+    transaction = await get_transaction(db, transaction_id, current_user.user_id)
+    result = await db.execute(transaction_service.milestone_query(transaction.id, key))
+    milestone = result.scalars().first()
+    if not milestone:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Milestone not found"
+        )
+
+    return await transaction_service.update_milestone(
+        db, milestone, milestone_data.model_dump(exclude_unset=True)
+    )
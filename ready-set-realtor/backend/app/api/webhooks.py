@@ -0,0 +1,65 @@
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import get_db
+from ..core.security import verify_hmac_signature
+from ..models.document import Document
+from ..services.document_service import apply_envelope_update, parse_connect_event
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+@router.post("/docusign")
+async def docusign_connect(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Receive DocuSign Connect envelope events and record them on the document.
+    """
+    if not settings.DOCUSIGN_CONNECT_HMAC_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="DocuSign Connect is not configured"
+        )
+
+    # Connect sends one X-DocuSign-Signature-N header per configured key
+    body = await request.body()
+    signatures = [
+        value for name, value in request.headers.items()
+        if name.lower().startswith("x-docusign-signature-")
+    ]
+    if not any(verify_hmac_signature(settings.DOCUSIGN_CONNECT_HMAC_KEY, body, signature) for signature in signatures):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid DocuSign signature"
+        )
+
+    try:
+        update = parse_connect_event(json.loads(body))
+    except (ValueError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid DocuSign event payload"
+        )
+
+    if not update["envelope_id"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Event has no envelope id"
+        )
+
+    result = await db.execute(
+        select(Document).where(Document.docusign_id == update["envelope_id"])
+    )
+    document = result.scalars().first()
+
+    # Acknowledge envelopes we do not track so Connect stops retrying them
+    if document is None:
+        return {"status": "ignored"}
+
+    if not apply_envelope_update(document, update):
+        return {"status": "stale"}
+
+    await db.commit()
+    return {"status": "updated"}
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+class TTLCache(Generic[ValueT]):
+    """
+    Bounded LRU cache whose entries also expire at a wall-clock time.
+
+    Each entry carries its own expiry, so callers can pin it to something
+    like a token's `exp` claim instead of a fixed TTL.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], ValueT]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ValueT]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: ValueT,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """
+        Store a value until `expires_at`, or for `ttl` (default_ttl) seconds.
+        """
+        if self.max_size <= 0:
+            return
+        if expires_at is None:
+            ttl = self.default_ttl if ttl is None else ttl
+            expires_at = self._clock() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from celery import Celery
+from celery.schedules import crontab
+
+from .config import settings
+
+celery_app = Celery(
+    "ready_set_realtor",
+    broker=settings.CELERY_BROKER_URL or settings.REDIS_URL,
+    backend=settings.CELERY_RESULT_BACKEND or settings.REDIS_URL,
+    include=["app.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    timezone="UTC",
+    enable_utc=True,
+    # Jobs record their own progress, so a task lost with its worker is redelivered and resumes
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    beat_schedule={
+        "requalify-active-leads": {
+            "task": "app.tasks.requalify_active_leads",
+            "schedule": crontab(hour=settings.QUALIFICATION_NIGHTLY_HOUR, minute=0),
+        },
+        # Claims are SKIP LOCKED, so an overlapping run or a second beat is harmless
+        "dispatch-follow-ups": {
+            "task": "app.tasks.dispatch_follow_ups",
+            "schedule": timedelta(seconds=settings.FOLLOW_UP_POLL_SECONDS),
+        },
+        # Catches Connect deliveries that never arrived; stale changes are ignored, so overlap is harmless
+        "sync-envelopes": {
+            "task": "app.tasks.sync_envelopes",
+            "schedule": timedelta(seconds=settings.DOCUSIGN_SYNC_INTERVAL_SECONDS),
+        },
+    },
+)
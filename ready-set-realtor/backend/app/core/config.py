@@ -5,9 +5,23 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_CONNECT_TIMEOUT: int = 10
+    DB_COMMAND_TIMEOUT: float = 60
 
     # OpenAI
     OPENAI_API_KEY: str
+    OPENAI_TIMEOUT: float = 60
+    OPENAI_MAX_RETRIES: int = 5
+    OPENAI_MAX_CONCURRENCY: int = 8
+    # Organisation limits shared by every agent; bursts are capped at OPENAI_BURST_SECONDS of budget
+    OPENAI_RPM: int = 500
+    OPENAI_TPM: int = 40000
+    OPENAI_BURST_SECONDS: float = 10
 
     # Supabase
     SUPABASE_URL: str
@@ -16,23 +30,65 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # LLM response cache ("redis" or "memory")
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "redis"
+    LLM_CACHE_TTL: int = 24 * 60 * 60
+    LLM_CACHE_LOCAL_MAX_SIZE: int = 1000
+    # Agent types (e.g. "follow_up") whose completions are never cached
+    LLM_CACHE_DISABLED_AGENTS: List[str] = []
+    LLM_CACHE_REDIS_TIMEOUT: float = 0.25
+    LLM_CACHE_REDIS_RETRY_AFTER: float = 30
+
     # API Keys
     VAPI_API_KEY: str
+    VAPI_BASE_URL: str = "https://api.vapi.ai/v1"
+    VAPI_HTTP2: bool = True
+    VAPI_MAX_CONNECTIONS: int = 20
+    VAPI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    VAPI_KEEPALIVE_EXPIRY: float = 30
+    VAPI_CONNECT_TIMEOUT: float = 5
+    VAPI_READ_TIMEOUT: float = 30
+    VAPI_WRITE_TIMEOUT: float = 30
+    VAPI_POOL_TIMEOUT: float = 5
     DOCUSIGN_API_KEY: str
+    DOCUSIGN_ACCOUNT_ID: str = ""
+    DOCUSIGN_CONNECT_HMAC_KEY: str = ""
+    DOCUSIGN_SYNC_BATCH_SIZE: int = 100
+    DOCUSIGN_SYNC_CONCURRENCY: int = 4
+    DOCUSIGN_SYNC_INTERVAL_SECONDS: int = 900
     MAKE_API_KEY: str
     ZAPIER_API_KEY: str
     N8N_API_KEY: str
 
+    # Twilio
+    TWILIO_ACCOUNT_SID: str
+    TWILIO_AUTH_TOKEN: str
+    TWILIO_PHONE_NUMBER: str
+    TWILIO_MAX_CONNECTIONS: int = 50
+    TWILIO_KEEPALIVE_EXPIRY: float = 30
+    TWILIO_TIMEOUT: float = 30
+    TWILIO_SEND_CONCURRENCY: int = 20
+
     # Email
     SMTP_HOST: str
     SMTP_PORT: int
     SMTP_USERNAME: str
     SMTP_PASSWORD: str
+    SMTP_START_TLS: bool = True
+    SMTP_USE_TLS: bool = False
+    SMTP_TIMEOUT: float = 30
+    SMTP_POOL_SIZE: int = 4
+    SMTP_POOL_IDLE_TIMEOUT: float = 60
 
     # Security
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_RETRY_AFTER: int = 2
 
     # Application
     ENVIRONMENT: str = "development"
@@ -43,6 +99,52 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FILE: str = "app.log"
 
+    # Lead import
+    LEAD_IMPORT_BATCH_SIZE: int = 1000
+    LEAD_IMPORT_MAX_ERRORS: int = 1000
+
+    # Batch document generation
+    DOCUMENT_BATCH_MAX_SIZE: int = 500
+    DOCUMENT_RENDER_WORKERS: int = 2
+    # Documents per render process task; batches no larger than this render on a thread
+    DOCUMENT_RENDER_CHUNK_SIZE: int = 1000
+
+    # Celery; broker and results default to REDIS_URL
+    CELERY_BROKER_URL: str = ""
+    CELERY_RESULT_BACKEND: str = ""
+
+    # Batch lead qualification
+    QUALIFICATION_BATCH_SIZE: int = 50
+    # Hour (UTC) of the nightly re-qualification of active leads
+    QUALIFICATION_NIGHTLY_HOUR: int = 2
+
+    # Appointment availability: working hours, slot spacing and the search horizon
+    AVAILABILITY_DAY_START_HOUR: int = 9
+    AVAILABILITY_DAY_END_HOUR: int = 17
+    AVAILABILITY_SLOT_MINUTES: int = 30
+    AVAILABILITY_SEARCH_DAYS: int = 30
+    # Longest bookable appointment; also bounds availability index scans
+    APPOINTMENT_MAX_MINUTES: int = 8 * 60
+
+    # MCP task executor: workers per agent type, and unfinished tasks each type may hold
+    MCP_WORKERS_PER_AGENT_TYPE: int = 4
+    MCP_MAX_QUEUED_TASKS: int = 100
+    # Agent instances built per type at startup, and the most kept idle per type
+    AGENT_POOL_WARM: int = 2
+    AGENT_POOL_MAX_IDLE: int = 32
+
+    # Follow-up dispatch: beat poll interval, schedules claimed per query, how
+    # long a claim keeps other workers off a row, and retries before giving up
+    FOLLOW_UP_POLL_SECONDS: int = 30
+    FOLLOW_UP_DISPATCH_BATCH_SIZE: int = 500
+    FOLLOW_UP_LEASE_SECONDS: int = 600
+    FOLLOW_UP_MAX_ATTEMPTS: int = 5
+    FOLLOW_UP_RETRY_MINUTES: int = 15
+
+    # Transaction milestones: default window for the due-soon and at-risk views
+    MILESTONE_DUE_SOON_HOURS: int = 48
+    MILESTONE_QUERY_LIMIT: int = 500
+
     class Config:
         env_file = ".env"
         case_sensitive = True
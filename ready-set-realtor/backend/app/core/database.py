@@ -1,20 +1,132 @@
+import time
+from typing import Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..models.base import Base
+from .config import settings
+from .metrics import metrics
+
+DATABASE_URL = settings.DATABASE_URL
+
+# Async drivers used by the request path, keyed by the sync URL's backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+def get_async_database_url(url: str) -> str:
+    """
+    Translate a sync database URL into its async driver equivalent.
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+# Time spent waiting for a pooled connection, from free slot to pool timeout
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+pool_wait_seconds = metrics.histogram(
+    "db_pool_wait_seconds",
+    "Time API requests waited to check out a database connection",
+    buckets=POOL_WAIT_BUCKETS,
+)
+pool_timeouts = metrics.counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds",
+)
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits for a connection.
+    """
 
-load_dotenv()
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_wait_seconds.observe(time.perf_counter() - start)
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL environment variable is not set")
+def pool_options(url: str) -> Dict:
+    """
+    Pool options for an engine, taken from settings.
 
-engine = create_engine(DATABASE_URL)
+    SQLite connections are local files, so only the defaults apply there.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def sync_pool_options(url: str) -> Dict:
+    options = pool_options(url)
+    if options:
+        options["connect_args"] = {"connect_timeout": settings.DB_CONNECT_TIMEOUT}
+    return options
+
+def async_pool_options(url: str) -> Dict:
+    options = pool_options(url)
+    if options:
+        options["poolclass"] = InstrumentedAsyncPool
+        options["connect_args"] = {
+            "timeout": settings.DB_CONNECT_TIMEOUT,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        }
+    return options
+
+def register_pool_metrics(engine: AsyncEngine) -> None:
+    """
+    Expose the engine's pool occupancy as gauges read at scrape time.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return
+
+    metrics.gauge("db_pool_size", "Connections the pool keeps open", pool.size)
+    metrics.gauge("db_pool_checked_out", "Connections currently in use", pool.checkedout)
+    metrics.gauge("db_pool_checked_in", "Idle connections available in the pool", pool.checkedin)
+    metrics.gauge("db_pool_overflow", "Connections opened beyond pool_size", lambda: max(pool.overflow(), 0))
+
+# Sync engine for scripts and one-off jobs (init_db, migrations)
+engine = create_engine(DATABASE_URL, **sync_pool_options(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def get_db():
-    db = SessionLocal()
-    try:
+# Async engine for the API so queries never block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL),
+    **async_pool_options(DATABASE_URL),
+)
+register_pool_metrics(async_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close() 
\ No newline at end of file
+
+def get_sessionmaker() -> async_sessionmaker:
+    """
+    Session factory for work that outlives the request, such as streamed exports.
+    """
+    return AsyncSessionLocal
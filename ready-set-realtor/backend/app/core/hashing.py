@@ -0,0 +1,95 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+
+from .config import settings
+from .metrics import metrics
+from .security import get_password_hash, verify_password
+
+ResultT = TypeVar("ResultT")
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool, away from the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    Admission is bounded: once `workers + max_queue` calls are in flight, new
+    ones are rejected with a 503 instead of queueing behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        metrics.gauge("password_hash_in_flight", "Hashing calls running or queued", lambda: self.in_flight)
+        metrics.gauge(
+            "password_hash_queue_depth",
+            "Hashing calls waiting for a free worker",
+            lambda: max(self.in_flight - self.workers, 0),
+        )
+        self.rejected = metrics.counter(
+            "password_hash_rejected_total",
+            "Hashing calls refused with 503 because the pool was full",
+        )
+        self.queue_wait_seconds = metrics.histogram(
+            "password_hash_queue_wait_seconds",
+            "Time hashing calls waited for a free worker",
+        )
+        self.duration_seconds = metrics.histogram(
+            "password_hash_duration_seconds",
+            "Time spent inside bcrypt per call",
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _run(self, func: Callable[..., ResultT], *args) -> ResultT:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests, please retry shortly",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            self.queue_wait_seconds.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                self.duration_seconds.observe(time.perf_counter() - started)
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), timed)
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# Create a singleton instance
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
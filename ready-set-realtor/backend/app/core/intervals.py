@@ -0,0 +1,139 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+class IntervalIndex:
+    """
+    Sorted, non-overlapping half-open [start, end) intervals, one per booking.
+
+    Because bookings never overlap, starts and ends sort in the same order,
+    so every query is a pair of binary searches plus a walk over the
+    intervals actually involved: overlap checks are O(log n) and free-slot
+    and next-available searches touch only the bookings inside their window.
+    """
+
+    def __init__(self):
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+        self._keys: List[Hashable] = []
+        self._by_key: Dict[Hashable, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._by_key
+
+    def _span(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        # Positions of the intervals overlapping [start, end)
+        return bisect_right(self._ends, start), bisect_left(self._starts, end)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime, Hashable]]:
+        """
+        Bookings overlapping [start, end), in order.
+        """
+        first, last = self._span(start, end)
+        return list(zip(self._starts[first:last], self._ends[first:last], self._keys[first:last]))
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        first, last = self._span(start, end)
+        return first >= last
+
+    def add(self, start: datetime, end: datetime, key: Hashable) -> None:
+        """
+        Book [start, end) under `key`; raises ValueError if it overlaps a booking.
+        """
+        if end <= start:
+            raise ValueError("Interval must end after it starts")
+        if key in self._by_key:
+            raise ValueError("Booking already indexed")
+        first, last = self._span(start, end)
+        if first < last:
+            raise ValueError("Time slot is not available")
+        self._starts.insert(first, start)
+        self._ends.insert(first, end)
+        self._keys.insert(first, key)
+        self._by_key[key] = start
+
+    def remove(self, key: Hashable) -> Interval:
+        """
+        Free a booking, returning its interval.
+        """
+        start = self._by_key.pop(key)
+        position = bisect_left(self._starts, start)
+        end = self._ends[position]
+        del self._starts[position], self._ends[position], self._keys[position]
+        return start, end
+
+    def gaps(self, start: datetime, end: datetime) -> Iterator[Interval]:
+        """
+        Free stretches of [start, end), in order.
+        """
+        first, last = self._span(start, end)
+        cursor = start
+        for position in range(first, last):
+            if self._starts[position] > cursor:
+                yield cursor, self._starts[position]
+            cursor = max(cursor, self._ends[position])
+        if cursor < end:
+            yield cursor, end
+
+    def free_slots(
+        self,
+        start: datetime,
+        end: datetime,
+        duration: timedelta,
+        step: timedelta,
+        anchor: Optional[datetime] = None,
+    ) -> Iterator[Interval]:
+        """
+        Free slots of `duration` within [start, end), starting on `step` boundaries counted from `anchor`.
+        """
+        anchor = anchor or start
+        for gap_start, gap_end in self.gaps(start, end):
+            # First step boundary at or after the gap opens
+            offset = (gap_start - anchor) % step
+            slot_start = gap_start + (step - offset if offset else timedelta(0))
+            while slot_start + duration <= gap_end:
+                yield slot_start, slot_start + duration
+                slot_start += step
+
+    def first_slot(
+        self,
+        start: datetime,
+        end: datetime,
+        duration: timedelta,
+        step: timedelta,
+        anchor: Optional[datetime] = None,
+    ) -> Optional[Interval]:
+        return next(self.free_slots(start, end, duration, step, anchor), None)
+
+def daily_windows(start: datetime, end: datetime, opens: time, closes: time) -> Iterator[Tuple[datetime, datetime, datetime]]:
+    """
+    Working-hours windows on each day, clipped to [start, end), as (start, end, opening time).
+    """
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        opening = datetime.combine(day.date(), opens, tzinfo=start.tzinfo)
+        window_start = max(start, opening)
+        window_end = min(end, datetime.combine(day.date(), closes, tzinfo=start.tzinfo))
+        if window_start < window_end:
+            yield window_start, window_end, opening
+        day += timedelta(days=1)
+
+def working_slots(
+    index: IntervalIndex,
+    start: datetime,
+    end: datetime,
+    duration: timedelta,
+    step: timedelta,
+    opens: time,
+    closes: time,
+) -> Iterator[Interval]:
+    """
+    Free slots within working hours, stepping from each day's opening time.
+    """
+    for window_start, window_end, opening in daily_windows(start, end, opens, closes):
+        yield from index.free_slots(window_start, window_end, duration, step, anchor=opening)
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import json
+import textwrap
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from .cache import TTLCache
+from .config import settings
+from .metrics import Counter, metrics
+
+# Bump to orphan every cached completion, e.g. when the stored shape changes
+KEY_PREFIX = "llm:v1:"
+
+def normalize_content(content: str) -> str:
+    """
+    Normalize prompt text so formatting-only differences share a cache entry.
+
+    Prompts are built with indented f-strings, so the same request can differ
+    in leading indentation and trailing whitespace; neither reaches the model
+    as meaning.
+    """
+    lines = textwrap.dedent(content).strip().splitlines()
+    return "\n".join(line.rstrip() for line in lines)
+
+def completion_key(model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: Optional[int]) -> str:
+    """
+    Cache key for a chat completion request.
+    """
+    normalized = {
+        "model": model,
+        "messages": [
+            {"role": message["role"], "content": normalize_content(message["content"])}
+            for message in messages
+        ],
+        "temperature": round(float(temperature), 3),
+        "max_tokens": max_tokens,
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+
+class LLMCache:
+    """
+    Two-tier cache for chat completion text.
+
+    A small in-process LRU sits in front of Redis, so completions are shared
+    across workers and survive restarts, and repeat prompts in one process skip
+    the network entirely. If Redis is unreachable the in-process tier keeps
+    serving and Redis is retried after `redis_retry_after` seconds.
+    Concurrent misses for the same key share a single upstream call.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        ttl: int,
+        local_max_size: int,
+        disabled_agents: List[str],
+        redis_timeout: float = 0.25,
+        redis_retry_after: float = 30,
+        enabled: bool = True,
+    ):
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.enabled = enabled
+        self.disabled_agents = set(disabled_agents)
+        self.redis_timeout = redis_timeout
+        self.redis_retry_after = redis_retry_after
+        self.local: TTLCache[str] = TTLCache(max_size=local_max_size, default_ttl=ttl)
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_down_until = 0.0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.hits = metrics.counter("llm_cache_hits_total", "Completions served from the LLM cache")
+        self.misses = metrics.counter("llm_cache_misses_total", "Completions that called the model")
+        self.bypassed = metrics.counter("llm_cache_bypassed_total", "Completions that skipped the cache (opted-out agent or uncacheable request)")
+        self.redis_errors = metrics.counter("llm_cache_redis_errors_total", "Redis failures the LLM cache fell back from")
+        metrics.gauge("llm_cache_hit_ratio", "Share of cacheable completions served from cache", self.hit_ratio)
+        self._agent_hits: Dict[str, Counter] = {}
+        self._agent_misses: Dict[str, Counter] = {}
+
+    def hit_ratio(self) -> float:
+        total = self.hits.value + self.misses.value
+        return self.hits.value / total if total else 0.0
+
+    def _count(self, agent: str, hit: bool) -> None:
+        (self.hits if hit else self.misses).inc()
+        counters = self._agent_hits if hit else self._agent_misses
+        if agent not in counters:
+            kind = "hits" if hit else "misses"
+            counters[agent] = metrics.counter(
+                f"llm_cache_{agent}_{kind}_total", f"LLM cache {kind} for the {agent} agent"
+            )
+        counters[agent].inc()
+
+    def is_enabled(self, agent: str) -> bool:
+        return self.enabled and agent not in self.disabled_agents
+
+    @property
+    def redis(self) -> Optional[aioredis.Redis]:
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.Redis.from_url(
+                self.redis_url,
+                socket_timeout=self.redis_timeout,
+                socket_connect_timeout=self.redis_timeout,
+            )
+        return self._redis
+
+    def _redis_failed(self) -> None:
+        self.redis_errors.inc()
+        self._redis_down_until = time.monotonic() + self.redis_retry_after
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        redis = self.redis
+        if redis is None:
+            return None
+        try:
+            stored = await redis.get(key)
+        except (RedisError, OSError):
+            self._redis_failed()
+            return None
+        if stored is None:
+            return None
+        value = stored.decode()
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        ttl = ttl or self.ttl
+        self.local.set(key, value, ttl=ttl)
+
+        redis = self.redis
+        if redis is None:
+            return
+        try:
+            await redis.set(key, value, ex=ttl)
+        except (RedisError, OSError):
+            self._redis_failed()
+
+    async def complete(
+        self,
+        agent: str,
+        create: Callable[..., Awaitable[Any]],
+        *,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 1.0,
+        max_tokens: Optional[int] = None,
+        ttl: Optional[int] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Return the completion text for a request, calling the model only on a miss.
+
+        `create` makes the actual call, e.g. openai_service.chat_completion.
+        """
+        request = {"model": model, "messages": messages, "temperature": temperature, **kwargs}
+        if max_tokens is not None:
+            request["max_tokens"] = max_tokens
+
+        if not self.is_enabled(agent) or kwargs:
+            # Tools, seeds, streaming etc. are not part of the key, so never cache them
+            self.bypassed.inc()
+            response = await create(**request)
+            return response.choices[0].message.content
+
+        key = completion_key(model, messages, temperature, max_tokens)
+        cached = await self.get(key)
+        if cached is not None:
+            self._count(agent, hit=True)
+            return cached
+
+        while (pending := self._in_flight.get(key)) is not None:
+            try:
+                content = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The caller making the shared call was cancelled, not this one: make it ourselves
+                if not pending.cancelled():
+                    raise
+                continue
+            self._count(agent, hit=True)
+            return content
+
+        self._count(agent, hit=False)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await create(**request)
+            content = response.choices[0].message.content
+            if content is not None:
+                await self.set(key, content, ttl)
+            future.set_result(content)
+            return content
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so an unwaited future stays quiet
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def stream(
+        self,
+        agent: str,
+        create_stream: Callable[..., AsyncIterator[str]],
+        *,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 1.0,
+        max_tokens: Optional[int] = None,
+        ttl: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Yield completion text as the model produces it, or all at once on a hit.
+
+        `create_stream` yields text deltas, e.g. openai_service.stream_chat_completion.
+        Streams share keys with `complete`, so a finished stream is served to
+        either; a stream the caller abandons is not cached.
+        """
+        request = {"model": model, "messages": messages, "temperature": temperature, **kwargs}
+        if max_tokens is not None:
+            request["max_tokens"] = max_tokens
+
+        if not self.is_enabled(agent) or kwargs:
+            self.bypassed.inc()
+            async for delta in create_stream(**request):
+                yield delta
+            return
+
+        key = completion_key(model, messages, temperature, max_tokens)
+        cached = await self.get(key)
+        if cached is not None:
+            self._count(agent, hit=True)
+            yield cached
+            return
+
+        self._count(agent, hit=False)
+        parts: List[str] = []
+        async for delta in create_stream(**request):
+            parts.append(delta)
+            yield delta
+        await self.set(key, "".join(parts), ttl)
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+# Create a singleton instance
+llm_cache = LLMCache(
+    redis_url=settings.REDIS_URL if settings.LLM_CACHE_BACKEND == "redis" else None,
+    ttl=settings.LLM_CACHE_TTL,
+    local_max_size=settings.LLM_CACHE_LOCAL_MAX_SIZE,
+    disabled_agents=settings.LLM_CACHE_DISABLED_AGENTS,
+    redis_timeout=settings.LLM_CACHE_REDIS_TIMEOUT,
+    redis_retry_after=settings.LLM_CACHE_REDIS_RETRY_AFTER,
+    enabled=settings.LLM_CACHE_ENABLED,
+)
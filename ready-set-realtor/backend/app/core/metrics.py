@@ -0,0 +1,114 @@
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Default latency buckets in seconds, from 1ms to 10s
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> Dict:
+        return {"type": "counter", "description": self.description, "value": self.value}
+
+class Gauge:
+    def __init__(self, name: str, description: str, callback: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self._callback = callback
+
+    def set(self, value: float):
+        self.value = value
+
+    def snapshot(self) -> Dict:
+        value = self._callback() if self._callback else self.value
+        return {"type": "gauge", "description": self.description, "value": value}
+
+class Histogram:
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        # One slot per bucket plus the +Inf overflow slot
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            count, total = self.count, self.sum
+
+        # Cumulative counts, as in the Prometheus exposition format
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, bucket_count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += bucket_count
+            buckets[bound] = running
+
+        return {
+            "type": "histogram",
+            "description": self.description,
+            "count": count,
+            "sum": total,
+            "buckets": buckets,
+        }
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} is already registered as a different type")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(Counter(name, description))
+
+    def gauge(self, name: str, description: str, callback: Optional[Callable[[], float]] = None) -> Gauge:
+        gauge = self._register(Gauge(name, description, callback))
+        if callback is not None:
+            # Re-registering rebinds the callback, e.g. when an engine is recreated
+            gauge._callback = callback
+        return gauge
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, buckets))
+
+    def names(self) -> List[str]:
+        return sorted(self._metrics)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Current value of every registered metric, keyed by name.
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: metric.snapshot() for name, metric in sorted(metrics.items())}
+
+# Create a singleton instance
+metrics = MetricsRegistry()
@@ -0,0 +1,60 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+Cursor = Tuple[datetime, UUID]
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a (created_at, id) position as an opaque, URL-safe cursor.
+    """
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+def keyset_query(query: Select, model, cursor: Optional[str], limit: int) -> Select:
+    """
+    Order a query newest-first on (created_at, id) and seek past the cursor.
+
+    One extra row is fetched so the caller can tell whether another page exists.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+async def paginate(db: AsyncSession, query: Select, model, cursor: Optional[str], limit: int) -> dict:
+    """
+    Fetch one keyset page, returning the rows and the cursor for the next page.
+    """
+    result = await db.execute(keyset_query(query, model, cursor, limit))
+    rows = result.scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
@@ -0,0 +1,71 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+class TokenBucket:
+    """
+    Async token bucket refilled continuously at a per-minute rate.
+
+    Waiters are served in arrival order. `capacity` bounds the burst: a full
+    minute's allowance spent in the first second is exactly the burst-then-stall
+    pattern provider limits punish, so callers usually size it to a few
+    seconds' worth. `pause` stops all acquisitions, e.g. for a Retry-After.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._clock = clock
+        self.tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, amount: float = 1) -> float:
+        """
+        Seconds until `amount` tokens could be taken, without taking them.
+        """
+        self._refill()
+        paused = max(self._paused_until - self._clock(), 0)
+        missing = max(min(amount, self.capacity) - self.tokens, 0)
+        return max(paused, missing / self.rate)
+
+    async def acquire(self, amount: float = 1) -> float:
+        """
+        Take `amount` tokens, waiting as long as needed; returns the time waited.
+
+        Requests larger than the bucket are clamped to its capacity so they
+        cannot wait forever.
+        """
+        amount = min(amount, self.capacity)
+        started = self._clock()
+        async with self._lock:
+            while True:
+                wait = self.delay(amount)
+                if wait <= 0:
+                    self.tokens -= amount
+                    return self._clock() - started
+                await asyncio.sleep(wait)
+
+    def adjust(self, amount: float) -> None:
+        """
+        Charge (positive) or refund (negative) tokens after the fact.
+
+        Used when the real cost is only known afterwards; the balance may go
+        negative, which delays the next callers accordingly.
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
@@ -1,5 +1,9 @@
+import base64
+import hashlib
+import hmac
+import inspect
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional, Tuple, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, Security
@@ -7,7 +11,9 @@ from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
 from uuid import UUID
 
+from .cache import TTLCache
 from .config import settings
+from .metrics import metrics
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -21,6 +27,46 @@ class TokenData(BaseModel):
     email: str
     role: str
 
+# Verified tokens, keyed by SHA-256 of the raw token and evicted at its `exp`
+token_cache: TTLCache[Tuple[TokenData, dict]] = TTLCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+token_cache_hits = metrics.counter("auth_token_cache_hits_total", "Requests authenticated from the token cache")
+token_cache_misses = metrics.counter("auth_token_cache_misses_total", "Requests that needed a full JWT decode")
+
+# Called with the decoded claims on every request, cached or not; return True to reject
+RevocationCheck = Callable[[dict], Union[bool, Awaitable[bool]]]
+revocation_checks: List[RevocationCheck] = []
+
+def token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+def add_revocation_check(check: RevocationCheck) -> None:
+    """
+    Register a check that can reject an otherwise valid token.
+    """
+    revocation_checks.append(check)
+
+def invalidate_token(token: str) -> None:
+    """
+    Drop a token from the cache so its next use is fully re-verified.
+    """
+    token_cache.delete(token_cache_key(token))
+
+async def is_revoked(claims: dict) -> bool:
+    for check in revocation_checks:
+        result = check(claims)
+        if inspect.isawaitable(result):
+            result = await result
+        if result:
+            return True
+    return False
+
+def verify_hmac_signature(secret: str, body: bytes, signature: str) -> bool:
+    """
+    Check a base64 HMAC-SHA256 signature over a raw request body.
+    """
+    expected = base64.b64encode(hmac.new(secret.encode(), body, hashlib.sha256).digest()).decode()
+    return hmac.compare_digest(expected, signature)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
@@ -54,30 +100,54 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 async def get_current_user(token: str = Security(oauth2_scheme)) -> TokenData:
     """
     Get the current user from a JWT token.
+
+    Verified tokens are cached until they expire, so repeat requests skip the
+    signature check. Revocation checks still run on every request.
     """
     credentials_exception = HTTPException(
         status_code=401,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        email: str = payload.get("email")
-        role: str = payload.get("role")
-        
+
+    key = token_cache_key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        token_cache_hits.inc()
+        token_data, claims = cached
+    else:
+        token_cache_misses.inc()
+        try:
+            claims = jwt.decode(
+                token, 
+                settings.JWT_SECRET, 
+                algorithms=[settings.JWT_ALGORITHM]
+            )
+        except JWTError:
+            raise credentials_exception
+
+        user_id: str = claims.get("sub")
+        email: str = claims.get("email")
+        role: str = claims.get("role")
+
         if user_id is None or email is None:
             raise credentials_exception
-            
-        return TokenData(user_id=UUID(user_id), email=email, role=role)
-    except JWTError:
+
+        try:
+            token_data = TokenData(user_id=UUID(user_id), email=email, role=role)
+        except ValueError:
+            raise credentials_exception
+
+        # Tokens without an expiry are never cached
+        if "exp" in claims:
+            token_cache.set(key, (token_data, claims), expires_at=claims["exp"])
+
+    if revocation_checks and await is_revoked(claims):
+        invalidate_token(token)
         raise credentials_exception
 
+    return token_data
+
 def check_permissions(required_role: str, user_role: str) -> bool:
     """
     Check if a user has the required role permissions.
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from email.message import Message
+from typing import List, Optional, Tuple
+
+import aiosmtplib
+
+from .metrics import metrics
+
+# Errors after which a pooled connection is discarded and the send retried once
+RECONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError)
+
+class SMTPConnectionPool:
+    """
+    A small pool of connected, authenticated SMTP sessions.
+
+    Connect, STARTTLS and AUTH happen once per connection instead of once per
+    message. Connections idle for longer than `idle_timeout` are replaced
+    before use, and a send that hits a dropped connection is retried once on
+    a fresh one.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 4,
+        start_tls: bool = True,
+        use_tls: bool = False,
+        timeout: float = 30,
+        idle_timeout: float = 60,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.start_tls = start_tls
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self.connections_opened = metrics.counter("smtp_connections_opened_total", "SMTP sessions opened")
+        self.reconnects = metrics.counter("smtp_reconnects_total", "Sends retried after a dropped SMTP connection")
+        self.send_seconds = metrics.histogram("smtp_send_seconds", "Time to hand one message to the SMTP server")
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        if self.username and self.password:
+            await client.login(self.username, self.password)
+        self.connections_opened.inc()
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client, last_used = self._idle.pop()
+            if client.is_connected and time.monotonic() - last_used < self.idle_timeout:
+                return client
+            await self._discard(client)
+        return await self._connect()
+
+    def _release(self, client: aiosmtplib.SMTP) -> None:
+        if client.is_connected:
+            self._idle.append((client, time.monotonic()))
+
+    async def send(self, message: Message, sender: str, recipients: List[str]) -> None:
+        """
+        Send a message on a pooled connection, reconnecting once if it was dropped.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+
+        async with self._slots:
+            start = time.perf_counter()
+            client = await self._acquire()
+            try:
+                try:
+                    await client.send_message(message, sender=sender, recipients=recipients)
+                except RECONNECT_ERRORS:
+                    self.reconnects.inc()
+                    client.close()
+                    client = await self._connect()
+                    await client.send_message(message, sender=sender, recipients=recipients)
+            except Exception:
+                # Never hand a session in an unknown state to the next sender
+                await self._discard(client)
+                raise
+            self._release(client)
+            self.send_seconds.observe(time.perf_counter() - start)
+
+    async def close(self) -> None:
+        """
+        Quit every idle connection; called from the app lifespan.
+        """
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._discard(client) for client, _ in idle))
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import time
+import zipfile
+import zlib
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Tuple, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+# Rows fetched per round-trip from the server-side cursor
+EXPORT_FETCH_SIZE = 1000
+# Approximate size of each chunk written to the client
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Entries larger than this are compressed and flushed piecewise
+ZIP_ENTRY_CHUNK_BYTES = 1024 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+async def iter_rows(
+    session_factory: async_sessionmaker,
+    query: Select,
+    schema: Type[BaseModel],
+) -> AsyncIterator[Dict]:
+    """
+    Stream query results through a server-side cursor as JSON-ready dicts.
+
+    The export owns its session rather than borrowing the request's: the body
+    is produced after the endpoint returns, so it must not depend on when
+    request-scoped dependencies are torn down.
+    """
+    async with session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_FETCH_SIZE))
+        async for row in result.scalars():
+            yield schema.model_validate(row).model_dump(mode="json")
+
+async def encode_ndjson(rows: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+    buffer: List[str] = []
+    size = 0
+    async for row in rows:
+        line = json.dumps(row, separators=(",", ":")) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+async def encode_csv(rows: AsyncIterator[Dict], fieldnames: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    async for row in rows:
+        writer.writerow({
+            key: json.dumps(value) if isinstance(value, (dict, list)) else value
+            for key, value in row.items()
+        })
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def export_response(
+    session_factory: async_sessionmaker,
+    query: Select,
+    schema: Type[BaseModel],
+    file_format: str,
+    filename: str,
+    compress: bool = False,
+) -> StreamingResponse:
+    """
+    Build a streaming NDJSON or CSV export of a query, optionally gzip-encoded.
+    """
+    rows = iter_rows(session_factory, query, schema)
+    if file_format == "csv":
+        body = encode_csv(rows, list(schema.model_fields))
+    else:
+        body = encode_ndjson(rows)
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{file_format}"'}
+    if compress:
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[file_format], headers=headers)
+
+class _ZipSink:
+    """
+    Write-only, unseekable file object that hands written bytes back out.
+
+    zipfile notices it cannot seek and writes each entry's sizes in a trailing
+    data descriptor, so the archive can be produced strictly front to back.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def zip_chunks(entries: Iterable[Tuple[str, str]]) -> Iterator[bytes]:
+    """
+    Stream a deflated zip of (filename, text) entries without building it in memory.
+
+    Only the entry being compressed is held at once. This is a plain
+    generator: StreamingResponse iterates it in a worker thread, keeping
+    compression off the event loop.
+    """
+    sink = _ZipSink()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for filename, text in entries:
+            info = zipfile.ZipInfo(filename, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            data = text.encode()
+            with archive.open(info, mode="w") as entry:
+                for start in range(0, len(data), ZIP_ENTRY_CHUNK_BYTES):
+                    entry.write(data[start:start + ZIP_ENTRY_CHUNK_BYTES])
+                    yield sink.drain()
+            yield sink.drain()
+    # Central directory
+    yield sink.drain()
+
+def zip_response(entries: Iterable[Tuple[str, str]], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        (chunk for chunk in zip_chunks(entries) if chunk),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.zip"'},
+    )
+
+def encode_sse(event: str, data: Dict) -> bytes:
+    """
+    Encode one server-sent event; data is JSON so newlines in text stay inside the event.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+async def _encode_events(events: AsyncIterator[Tuple[str, Dict]]) -> AsyncIterator[bytes]:
+    async for event, data in events:
+        yield encode_sse(event, data)
+
+def sse_response(events: AsyncIterator[Tuple[str, Dict]]) -> StreamingResponse:
+    """
+    Stream (event, data) pairs to the client as text/event-stream.
+    """
+    return StreamingResponse(
+        _encode_events(events),
+        media_type="text/event-stream",
+        # Proxies (nginx in particular) would otherwise hold tokens back in their buffers
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
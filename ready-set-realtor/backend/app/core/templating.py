@@ -0,0 +1,249 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+# Number of distinct template sources kept compiled
+TEMPLATE_CACHE_SIZE = 1024
+
+# "{{" / "}}" escape a literal brace; everything else in braces is a tag
+TOKEN = re.compile(r"\{\{|\}\}|\{(#if|#else|/if|#each|/each)?\s*([^{}]*?)\s*\}")
+FIELD = re.compile(r"^(this|[A-Za-z_]\w*)(\.\w+)*$")
+
+RenderFn = Callable[[Mapping[str, Any], bool], str]
+
+class TemplateError(ValueError):
+    pass
+
+class MissingFieldError(TemplateError, KeyError):
+    def __init__(self, field: str):
+        super().__init__(f"Missing template field: {field}")
+        self.field = field
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+    def __reduce__(self):
+        # Keep the field when raised inside a render worker process
+        return (MissingFieldError, (self.field,))
+
+_MISSING = object()
+
+def _lookup(context: Mapping[str, Any], path: Tuple[str, ...]) -> Any:
+    value = context.get(path[0], _MISSING)
+    for part in path[1:]:
+        if value is _MISSING or value is None:
+            return _MISSING
+        if isinstance(value, Mapping):
+            value = value.get(part, _MISSING)
+        else:
+            value = getattr(value, part, _MISSING)
+    return value
+
+def _parse_field(expression: str, tag: str) -> Tuple[Tuple[str, ...], str]:
+    name, _, spec = expression.partition(":")
+    name = name.strip()
+    if not FIELD.match(name):
+        raise TemplateError(f"Invalid field {name!r} in {tag}")
+    return tuple(name.split(".")), spec
+
+def _compile_sequence(nodes: List) -> RenderFn:
+    """
+    Fold a node list into one render function over a preassembled parts list.
+
+    Static text sits in the list once; rendering copies it, fills the dynamic
+    slots and joins, so there is no per-render parsing or string scanning.
+    """
+    parts: List[str] = []
+    slots: List[Tuple[int, RenderFn]] = []
+    for node in nodes:
+        if isinstance(node, str):
+            if parts and not (slots and slots[-1][0] == len(parts) - 1):
+                parts[-1] += node
+            else:
+                parts.append(node)
+        else:
+            slots.append((len(parts), node))
+            parts.append("")
+
+    if not slots:
+        text = "".join(parts)
+        return lambda context, partial: text
+
+    def render(context: Mapping[str, Any], partial: bool) -> str:
+        out = parts.copy()
+        for index, fn in slots:
+            out[index] = fn(context, partial)
+        return "".join(out)
+
+    return render
+
+def _compile_field(path: Tuple[str, ...], spec: str, source: str) -> RenderFn:
+    name = ".".join(path)
+
+    if len(path) == 1 and not spec:
+        # Plain {name}: the common case, one dict lookup and no formatting
+        def render_name(context: Mapping[str, Any], partial: bool) -> str:
+            try:
+                value = context[name]
+            except KeyError:
+                if partial:
+                    return source
+                raise MissingFieldError(name) from None
+            if value.__class__ is str:
+                return value
+            return "" if value is None else str(value)
+
+        return render_name
+
+    def render(context: Mapping[str, Any], partial: bool) -> str:
+        value = _lookup(context, path)
+        if value is _MISSING:
+            if partial:
+                return source
+            raise MissingFieldError(name)
+        if value is None:
+            return ""
+        return format(value, spec) if spec else str(value)
+
+    return render
+
+def _compile_if(path: Tuple[str, ...], then: RenderFn, otherwise: RenderFn) -> RenderFn:
+    def render(context: Mapping[str, Any], partial: bool) -> str:
+        value = _lookup(context, path)
+        if value is not _MISSING and value:
+            return then(context, partial)
+        return otherwise(context, partial)
+
+    return render
+
+def _compile_each(path: Tuple[str, ...], body: RenderFn) -> RenderFn:
+    def render(context: Mapping[str, Any], partial: bool) -> str:
+        items = _lookup(context, path)
+        if items is _MISSING or not items:
+            return ""
+        rendered = []
+        for item in items:
+            # Item keys shadow the outer context; "this" is the item itself
+            scope = {**context, **item} if isinstance(item, Mapping) else dict(context)
+            scope["this"] = item
+            rendered.append(body(scope, partial))
+        return "".join(rendered)
+
+    return render
+
+class CompiledTemplate:
+    """
+    A template parsed once into render functions.
+
+    Supports `{field}` and `{field:spec}` substitution with dotted paths,
+    `{#if field}...{#else}...{/if}` and `{#each items}...{/each}` sections.
+    `fields` lists the context names the template reads outside loop bodies;
+    `required_fields` only those read outside any section, i.e. the ones a
+    render cannot do without.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        fields: set = set()
+        required: set = set()
+        self._render = self._compile(source, fields, required)
+        self.fields: FrozenSet[str] = frozenset(fields)
+        self.required_fields: FrozenSet[str] = frozenset(required)
+
+    @staticmethod
+    def _compile(source: str, fields: set, required: set) -> RenderFn:
+        # Each open section is (tag, path, nodes of the then-branch, nodes of the else-branch or None)
+        stack: List[Tuple[Optional[str], Optional[Tuple[str, ...]], List, Optional[List]]] = [
+            (None, None, [], None)
+        ]
+        # Inside {#each} a name may belong to the item, so it is not recorded
+        loop_depth = 0
+
+        def current() -> List:
+            tag, path, then, otherwise = stack[-1]
+            return then if otherwise is None else otherwise
+
+        position = 0
+        for match in TOKEN.finditer(source):
+            if match.start() > position:
+                current().append(source[position:match.start()])
+            position = match.end()
+
+            token = match.group(0)
+            if token in ("{{", "}}"):
+                current().append(token[0])
+                continue
+
+            tag, expression = match.group(1), match.group(2)
+            if tag in ("#if", "#each"):
+                path, _ = _parse_field(expression, tag)
+                if not loop_depth:
+                    fields.add(path[0])
+                stack.append((tag, path, [], None))
+                if tag == "#each":
+                    loop_depth += 1
+            elif tag == "#else":
+                open_tag, path, then, otherwise = stack[-1]
+                if open_tag != "#if" or otherwise is not None:
+                    raise TemplateError("{#else} outside of an {#if} section")
+                stack[-1] = (open_tag, path, then, [])
+            elif tag in ("/if", "/each"):
+                open_tag, path, then, otherwise = stack.pop() if len(stack) > 1 else (None,) * 4
+                if open_tag != "#" + tag[1:]:
+                    raise TemplateError(f"Unexpected {{{tag}}}")
+                if open_tag == "#if":
+                    node = _compile_if(path, _compile_sequence(then), _compile_sequence(otherwise or []))
+                else:
+                    loop_depth -= 1
+                    node = _compile_each(path, _compile_sequence(then))
+                current().append(node)
+            else:
+                path, spec = _parse_field(expression, token)
+                if not loop_depth:
+                    fields.add(path[0])
+                    if len(stack) == 1:
+                        required.add(path[0])
+                current().append(_compile_field(path, spec, token))
+
+        if len(stack) > 1:
+            raise TemplateError(f"Unclosed {{{stack[-1][0]}}} section")
+        if position < len(source):
+            current().append(source[position:])
+        return _compile_sequence(stack[0][2])
+
+    def missing(self, context: Mapping[str, Any]) -> FrozenSet[str]:
+        """
+        Required fields absent from a context.
+        """
+        return self.required_fields.difference(context)
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """
+        Render with a context, raising MissingFieldError for any unset field.
+        """
+        return self._render(context, False)
+
+    def render_partial(self, context: Mapping[str, Any]) -> str:
+        """
+        Render what the context can fill and leave other placeholders as written.
+        """
+        return self._render(context, True)
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compile a template, reusing the compiled form for a source seen before.
+    """
+    return CompiledTemplate(source)
+
+def render_template(source: str, context: Dict[str, Any]) -> str:
+    return compile_template(source).render(context)
+
+def render_many(sources: Dict[str, str], items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Render (template name, context) pairs against a name -> source mapping.
+
+    Module-level so a process pool can run it; each worker compiles a source
+    once and reuses it through the compile cache.
+    """
+    return [compile_template(sources[name]).render(context) for name, context in items]
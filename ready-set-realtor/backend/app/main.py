@@ -1,17 +1,49 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
 
-from .api import auth, leads, communications, documents
+from .api import auth, leads, appointments, communications, documents, drafts, follow_ups, transactions, webhooks
 from .core.config import settings
+from .core.hashing import password_hasher
+from .core.llm_cache import llm_cache
+from .core.metrics import metrics
+from .core.security import TokenData, check_permissions, get_current_user
+from .mcp.executor import task_executor
+from .mcp.pool import agent_pool
+from .services.document_service import document_service
+from .services.email_service import email_service
+from .services.openai_service import openai_service
+from .services.twilio_service import twilio_service
+from .services.vapi_service import vapi_service
 
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await vapi_service.start()
+    await twilio_service.start()
+    await openai_service.start()
+    await agent_pool.start()
+    await task_executor.start()
+    yield
+    await task_executor.close()
+    agent_pool.close()
+    await vapi_service.close()
+    await twilio_service.close()
+    await email_service.close()
+    await llm_cache.close()
+    await openai_service.close()
+    password_hasher.shutdown()
+    document_service.shutdown()
+
 app = FastAPI(
     title="Ready Set Realtor API",
     description="AI-driven platform for real estate professionals",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -26,8 +58,13 @@ app.add_middleware(
 # Include routers
 app.include_router(auth.router)
 app.include_router(leads.router)
+app.include_router(appointments.router)
 app.include_router(communications.router)
 app.include_router(documents.router)
+app.include_router(drafts.router)
+app.include_router(follow_ups.router)
+app.include_router(transactions.router)
+app.include_router(webhooks.router)
 
 @app.get("/")
 async def root():
@@ -43,4 +80,16 @@ async def health_check():
         "status": "healthy",
         "version": "1.0.0",
         "environment": settings.ENVIRONMENT
-    } 
\ No newline at end of file
+    }
+
+@app.get("/metrics")
+async def read_metrics(current_user: TokenData = Depends(get_current_user)):
+    """
+    Runtime metrics; they describe internals, so only admins may read them.
+    """
+    if not check_permissions("admin", current_user.role):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return metrics.snapshot()
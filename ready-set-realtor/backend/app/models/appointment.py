@@ -0,0 +1,30 @@
+from sqlalchemy import CheckConstraint, Column, Index, String, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+from .base import BaseModel
+
+class AppointmentStatus(str, enum.Enum):
+    SCHEDULED = "scheduled"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+class Appointment(BaseModel):
+    __tablename__ = "appointments"
+    __table_args__ = (
+        # Availability: an agent's bookings in a time range
+        Index("ix_appointments_user_id_start_time", "user_id", "start_time"),
+        # Lead timelines and the foreign key check when a lead is deleted
+        Index("ix_appointments_lead_id_start_time", "lead_id", "start_time"),
+        CheckConstraint("end_time > start_time", name="ck_appointments_end_after_start"),
+    )
+
+    # The agent whose calendar the appointment is on
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    # Empty for time the agent has blocked out
+    lead_id = Column(UUID(as_uuid=True), ForeignKey('leads.id'))
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
+    type = Column(String, nullable=False)
+    location = Column(String)
+    status = Column(SQLEnum(AppointmentStatus), nullable=False, default=AppointmentStatus.SCHEDULED)
+    notes = Column(String)
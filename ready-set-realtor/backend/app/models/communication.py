@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Index, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 from .base import BaseModel
@@ -21,6 +21,14 @@ class CommunicationStatus(str, enum.Enum):
 
 class Communication(BaseModel):
     __tablename__ = "communications"
+    __table_args__ = (
+        # Keyset pagination: per-user listings ordered by (created_at, id)
+        Index("ix_communications_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Per-user listings narrowed to one lead
+        Index("ix_communications_user_id_lead_id_created_at_id", "user_id", "lead_id", "created_at", "id"),
+        # Lead timelines and the foreign key check when a lead is deleted
+        Index("ix_communications_lead_id_created_at", "lead_id", "created_at"),
+    )
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     lead_id = Column(UUID(as_uuid=True), ForeignKey('leads.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Index, String, Text, ForeignKey, JSON, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 from .base import BaseModel
@@ -20,12 +20,23 @@ class DocumentStatus(str, enum.Enum):
 
 class Document(BaseModel):
     __tablename__ = "documents"
+    __table_args__ = (
+        # Keyset pagination: per-user listings ordered by (created_at, id)
+        Index("ix_documents_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Per-user listings narrowed to one lead
+        Index("ix_documents_user_id_lead_id_created_at_id", "user_id", "lead_id", "created_at", "id"),
+        # Lead timelines and the foreign key check when a lead is deleted
+        Index("ix_documents_lead_id_created_at", "lead_id", "created_at"),
+        # DocuSign Connect events and status sync look documents up by envelope
+        Index("ix_documents_docusign_id", "docusign_id"),
+    )
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     lead_id = Column(UUID(as_uuid=True), ForeignKey('leads.id'), nullable=False)
     title = Column(String, nullable=False)
     type = Column(SQLEnum(DocumentType), nullable=False)
     status = Column(SQLEnum(DocumentStatus), nullable=False, default=DocumentStatus.DRAFT)
+    content = Column(Text)
     docusign_id = Column(String)
     storage_path = Column(String)
     metadata = Column(JSON, default={}) 
\ No newline at end of file
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+from .base import BaseModel
+
+class FollowUpScheduleStatus(str, enum.Enum):
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class FollowUpSchedule(BaseModel):
+    __tablename__ = "follow_up_schedules"
+    __table_args__ = (
+        # Due-time dispatch: active schedules in next_contact order, so each
+        # poll reads only the rows it claims however many are scheduled
+        Index("ix_follow_up_schedules_status_next_contact", "status", "next_contact"),
+        # A lead's schedules, and the foreign key check when a lead is deleted
+        Index("ix_follow_up_schedules_lead_id", "lead_id"),
+    )
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    lead_id = Column(UUID(as_uuid=True), ForeignKey('leads.id'), nullable=False)
+    stage = Column(String, nullable=False)
+    # FollowUpAgent templates to send, in order; `step` is the next one
+    template_ids = Column(JSON, nullable=False)
+    step = Column(Integer, nullable=False, default=0)
+    context = Column(JSON, default={})
+    status = Column(SQLEnum(FollowUpScheduleStatus), nullable=False, default=FollowUpScheduleStatus.ACTIVE)
+    # When the next message is due; while a worker holds the row it is pushed out by the claim lease
+    next_contact = Column(DateTime(timezone=True))
+    last_contact = Column(DateTime(timezone=True))
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String)
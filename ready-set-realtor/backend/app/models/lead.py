@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Index, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 from .base import BaseModel
@@ -22,6 +22,10 @@ class LeadSource(str, enum.Enum):
 
 class Lead(BaseModel):
     __tablename__ = "leads"
+    __table_args__ = (
+        # Keyset pagination: per-user listings ordered by (created_at, id)
+        Index("ix_leads_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     first_name = Column(String, nullable=False)
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+from .base import BaseModel
+
+class QualificationJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class QualificationJob(BaseModel):
+    __tablename__ = "qualification_jobs"
+    __table_args__ = (
+        # Per-user job history, newest first
+        Index("ix_qualification_jobs_user_id_created_at", "user_id", "created_at"),
+    )
+
+    # Empty for the nightly job, which covers every user's leads
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'))
+    status = Column(SQLEnum(QualificationJobStatus), nullable=False, default=QualificationJobStatus.QUEUED)
+    # Explicit lead ids, or None to select by lead_statuses
+    lead_ids = Column(JSON)
+    lead_statuses = Column(JSON)
+    criteria = Column(JSON, default={})
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    qualified = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    # Last lead written back; a redelivered task resumes after it
+    last_lead_id = Column(UUID(as_uuid=True))
+    error = Column(String)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
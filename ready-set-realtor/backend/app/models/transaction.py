@@ -0,0 +1,54 @@
+from sqlalchemy import Column, Index, String, ForeignKey, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+from .base import BaseModel
+
+class TransactionStatus(str, enum.Enum):
+    ACTIVE = "active"
+    CLOSED = "closed"
+    CANCELLED = "cancelled"
+
+class MilestoneStatus(str, enum.Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    WAIVED = "waived"
+
+class Transaction(BaseModel):
+    __tablename__ = "transactions"
+    __table_args__ = (
+        # Per-user listings, and the foreign key check when a lead is deleted
+        Index("ix_transactions_user_id_created_at", "user_id", "created_at"),
+        Index("ix_transactions_lead_id", "lead_id"),
+    )
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    lead_id = Column(UUID(as_uuid=True), ForeignKey('leads.id'))
+    property_address = Column(String, nullable=False)
+    status = Column(SQLEnum(TransactionStatus), nullable=False, default=TransactionStatus.ACTIVE)
+    closing_date = Column(DateTime(timezone=True))
+    # Price, parties and terms, as handed to the Transaction Coordinator agent
+    details = Column(JSON, default={})
+
+class TransactionMilestone(BaseModel):
+    __tablename__ = "transaction_milestones"
+    __table_args__ = (
+        # Deadline views across every deal: open milestones by due date.
+        # Status leads so the unbounded overdue range skips completed history.
+        Index("ix_transaction_milestones_status_due_date", "status", "due_date"),
+        # The same views limited to one user's deals
+        Index("ix_transaction_milestones_user_id_status_due_date", "user_id", "status", "due_date"),
+        # Milestone lookup by key, and a transaction's milestones
+        Index("uq_transaction_milestones_transaction_id_key", "transaction_id", "key", unique=True),
+    )
+
+    transaction_id = Column(UUID(as_uuid=True), ForeignKey('transactions.id'), nullable=False)
+    # Copied from the transaction so per-user deadline queries need no join
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    key = Column(String, nullable=False)
+    name = Column(String, nullable=False)
+    description = Column(String)
+    due_date = Column(DateTime(timezone=True), nullable=False)
+    status = Column(SQLEnum(MilestoneStatus), nullable=False, default=MilestoneStatus.PENDING)
+    assigned_to = Column(String)
+    completed_at = Column(DateTime(timezone=True))
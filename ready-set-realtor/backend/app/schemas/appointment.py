@@ -0,0 +1,41 @@
+from pydantic import BaseModel, model_validator
+from typing import Optional
+from uuid import UUID
+from datetime import datetime
+from ..models.appointment import AppointmentStatus
+
+class AppointmentBase(BaseModel):
+    lead_id: Optional[UUID] = None
+    start_time: datetime
+    end_time: datetime
+    type: str
+    location: Optional[str] = None
+    notes: Optional[str] = None
+
+class AppointmentCreate(AppointmentBase):
+    @model_validator(mode="after")
+    def check_times(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
+class AppointmentUpdate(BaseModel):
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    location: Optional[str] = None
+    status: Optional[AppointmentStatus] = None
+    notes: Optional[str] = None
+
+class AppointmentResponse(AppointmentBase):
+    id: UUID
+    user_id: UUID
+    status: AppointmentStatus
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class TimeSlot(BaseModel):
+    start_time: datetime
+    end_time: datetime
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from ..models.communication import CommunicationType, CommunicationDirection, CommunicationStatus
@@ -49,6 +49,21 @@ class SMSCommunication(BaseModel):
     lead_id: UUID
     message: str
 
+class BulkSMSCommunication(BaseModel):
+    lead_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+    message: str
+
+class BulkSMSResult(BaseModel):
+    lead_id: UUID
+    success: bool
+    communication_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class BulkSMSResponse(BaseModel):
+    sent: int
+    failed: int
+    results: List[BulkSMSResult]
+
 class CallCommunication(BaseModel):
     lead_id: UUID
     script: Optional[str] = None
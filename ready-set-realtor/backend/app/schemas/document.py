@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
@@ -30,6 +30,7 @@ class DocumentInDB(DocumentBase):
     updated_at: datetime
     docusign_id: Optional[str] = None
     storage_path: Optional[str] = None
+    content: Optional[str] = None
     metadata: dict = {}
 
     class Config:
@@ -42,6 +43,9 @@ class DocumentGeneration(BaseModel):
     template_name: str
     context: dict
 
+class DocumentBatchGeneration(BaseModel):
+    documents: List[DocumentGeneration] = Field(..., min_length=1)
+
 class DocumentSignatureRequest(BaseModel):
     document_id: UUID
     signers: List[dict]  # List of {name: str, email: str} dictionaries
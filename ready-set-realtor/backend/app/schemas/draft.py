@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from uuid import UUID
+from datetime import datetime
+from ..models.communication import CommunicationType
+from ..models.document import DocumentType
+
+class FollowUpDraftCreate(BaseModel):
+    lead_id: UUID
+    template_id: str
+    context: dict = {}
+
+class AppointmentMessageDraftCreate(BaseModel):
+    lead_id: UUID
+    kind: str = Field(..., pattern="^(confirmation|reschedule|cancellation|reminder)$")
+    channel: CommunicationType = CommunicationType.EMAIL
+    start_time: datetime
+    end_time: datetime
+    type: str
+    location: str
+
+class DocumentDraftCreate(BaseModel):
+    lead_id: UUID
+    title: str
+    type: DocumentType
+    context: dict = {}
@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from ..models.follow_up_schedule import FollowUpScheduleStatus
+
+class FollowUpScheduleCreate(BaseModel):
+    lead_id: UUID
+    # Picks the FollowUpAgent templates, e.g. "initial_contact" or "viewed"
+    stage: str
+    # Template fields such as property_address
+    context: dict = {}
+
+class FollowUpScheduleResponse(BaseModel):
+    id: UUID
+    lead_id: UUID
+    stage: str
+    template_ids: List[str]
+    step: int
+    status: FollowUpScheduleStatus
+    next_contact: Optional[datetime] = None
+    last_contact: Optional[datetime] = None
+    attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, computed_field, model_validator
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from ..models.lead import LeadStatus, LeadSource
+from ..models.qualification_job import QualificationJobStatus
 
 class LeadBase(BaseModel):
     first_name: str
@@ -43,4 +44,46 @@ class LeadResponse(LeadInDB):
 class LeadQualification(BaseModel):
     lead_id: UUID
     conversation_history: list[str]
-    criteria: dict 
\ No newline at end of file
+    criteria: dict 
+
+class LeadImportRowError(BaseModel):
+    row: int
+    errors: List[dict]
+
+class LeadImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[LeadImportRowError]
+    errors_truncated: bool = False
+
+class QualificationJobCreate(BaseModel):
+    # Either explicit leads or a status filter; neither means every active lead
+    lead_ids: Optional[List[UUID]] = Field(None, min_length=1)
+    statuses: Optional[List[LeadStatus]] = Field(None, min_length=1)
+    criteria: dict = {}
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if self.lead_ids is not None and self.statuses is not None:
+            raise ValueError("Pass lead_ids or statuses, not both")
+        return self
+
+class QualificationJobResponse(BaseModel):
+    id: UUID
+    status: QualificationJobStatus
+    total: int
+    processed: int
+    qualified: int
+    failed: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @computed_field
+    @property
+    def progress(self) -> float:
+        return self.processed / self.total if self.total else 1.0
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,45 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from ..models.transaction import MilestoneStatus, TransactionStatus
+
+class TransactionCreate(BaseModel):
+    lead_id: Optional[UUID] = None
+    property_address: str
+    closing_date: Optional[datetime] = None
+    # Price, parties and terms for the Transaction Coordinator agent
+    details: dict = {}
+
+class MilestoneUpdate(BaseModel):
+    status: Optional[MilestoneStatus] = None
+    due_date: Optional[datetime] = None
+    assigned_to: Optional[str] = None
+
+class MilestoneResponse(BaseModel):
+    id: UUID
+    transaction_id: UUID
+    key: str
+    name: str
+    description: Optional[str] = None
+    due_date: datetime
+    status: MilestoneStatus
+    assigned_to: Optional[str] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class TransactionResponse(BaseModel):
+    id: UUID
+    user_id: UUID
+    lead_id: Optional[UUID] = None
+    property_address: str
+    status: TransactionStatus
+    closing_date: Optional[datetime] = None
+    details: dict = {}
+    created_at: datetime
+    milestones: List[MilestoneResponse] = []
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,154 @@
+from datetime import datetime, time, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.intervals import Interval, IntervalIndex, working_slots
+from ..models.appointment import Appointment, AppointmentStatus
+from ..models.user import User
+
+def as_aware(value: datetime) -> datetime:
+    """
+    Treat naive datetimes as UTC so they compare with stored, zone-aware times.
+    """
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+class SlotUnavailableError(ValueError):
+    """
+    The requested time overlaps another of the agent's bookings.
+    """
+
+class AvailabilityService:
+    """
+    Free-slot, overlap and next-available queries over an agent's persisted appointments.
+
+    Each query loads only the bookings that can touch its window, through the
+    (user_id, start_time) index, into an IntervalIndex. Appointments are
+    capped at `max_duration`, so a booking overlapping the window must start
+    no earlier than that before it, which bounds the index range scan.
+    """
+
+    def __init__(self):
+        self.opens = time(settings.AVAILABILITY_DAY_START_HOUR)
+        self.closes = time(settings.AVAILABILITY_DAY_END_HOUR)
+        self.step = timedelta(minutes=settings.AVAILABILITY_SLOT_MINUTES)
+        self.max_duration = timedelta(minutes=settings.APPOINTMENT_MAX_MINUTES)
+        self.search_days = settings.AVAILABILITY_SEARCH_DAYS
+
+    def booked_query(self, user_id: UUID, start: datetime, end: datetime):
+        """
+        An agent's active bookings overlapping [start, end).
+        """
+        return select(Appointment.id, Appointment.start_time, Appointment.end_time).where(
+            Appointment.user_id == user_id,
+            Appointment.start_time > start - self.max_duration,
+            Appointment.start_time < end,
+            Appointment.end_time > start,
+            Appointment.status != AppointmentStatus.CANCELLED,
+        ).order_by(Appointment.start_time)
+
+    async def load_index(self, db: AsyncSession, user_id: UUID, start: datetime, end: datetime) -> IntervalIndex:
+        index = IntervalIndex()
+        result = await db.execute(self.booked_query(user_id, start, end))
+        for appointment_id, booked_start, booked_end in result:
+            index.add(as_aware(booked_start), as_aware(booked_end), appointment_id)
+        return index
+
+    async def free_slots(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        start: datetime,
+        end: datetime,
+        duration: timedelta,
+    ) -> List[Interval]:
+        """
+        Every free slot of `duration` within working hours between start and end.
+
+        Working hours are taken in the time zone of `start`.
+        """
+        start, end = as_aware(start), as_aware(end)
+        index = await self.load_index(db, user_id, start, end)
+        return list(working_slots(index, start, end, duration, self.step, self.opens, self.closes))
+
+    async def next_available(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        after: datetime,
+        duration: timedelta,
+    ) -> Optional[Interval]:
+        """
+        The earliest free slot of `duration` after `after`, within the search horizon.
+
+        Bookings are loaded a week at a time, so a free slot soon after
+        `after` is found without reading the rest of the calendar.
+        """
+        after = as_aware(after)
+        horizon = after + timedelta(days=self.search_days)
+        window_start = after
+        while window_start < horizon:
+            # Windows end at midnight so no working day is split between two of them
+            week_later = (window_start + timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+            window_end = min(week_later, horizon)
+            index = await self.load_index(db, user_id, window_start, window_end)
+            slot = next(working_slots(index, window_start, window_end, duration, self.step, self.opens, self.closes), None)
+            if slot is not None:
+                return slot
+            window_start = window_end
+        return None
+
+    async def _lock_calendar(self, db: AsyncSession, user_id: UUID) -> None:
+        # Serialise bookings per agent so two requests cannot both pass the overlap check
+        await db.execute(select(User.id).where(User.id == user_id).with_for_update())
+
+    def _check_duration(self, start: datetime, end: datetime) -> None:
+        if end <= start:
+            raise ValueError("Appointment must end after it starts")
+        if end - start > self.max_duration:
+            raise ValueError(f"Appointments can last at most {settings.APPOINTMENT_MAX_MINUTES} minutes")
+
+    async def book(self, db: AsyncSession, appointment: Appointment) -> Appointment:
+        """
+        Persist a new appointment; raises SlotUnavailableError if the agent is already booked then.
+        """
+        appointment.start_time = as_aware(appointment.start_time)
+        appointment.end_time = as_aware(appointment.end_time)
+        self._check_duration(appointment.start_time, appointment.end_time)
+        await self._lock_calendar(db, appointment.user_id)
+        index = await self.load_index(db, appointment.user_id, appointment.start_time, appointment.end_time)
+        if not index.is_free(appointment.start_time, appointment.end_time):
+            raise SlotUnavailableError("Time slot is not available")
+
+        db.add(appointment)
+        await db.commit()
+        await db.refresh(appointment)
+        return appointment
+
+    async def reschedule(self, db: AsyncSession, appointment: Appointment, start: datetime, end: datetime) -> Appointment:
+        """
+        Move an appointment; raises SlotUnavailableError if the new time clashes with another booking.
+
+        A cancelled appointment holds no slot, so only its duration is checked.
+        """
+        start, end = as_aware(start), as_aware(end)
+        self._check_duration(start, end)
+        if appointment.status != AppointmentStatus.CANCELLED:
+            await self._lock_calendar(db, appointment.user_id)
+            index = await self.load_index(db, appointment.user_id, start, end)
+            if appointment.id in index:
+                index.remove(appointment.id)
+            if not index.is_free(start, end):
+                raise SlotUnavailableError("Time slot is not available")
+
+        appointment.start_time = start
+        appointment.end_time = end
+        await db.commit()
+        await db.refresh(appointment)
+        return appointment
+
+# Create a singleton instance
+availability_service = AvailabilityService()
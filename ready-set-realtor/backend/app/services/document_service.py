@@ -1,15 +1,141 @@
-from typing import Dict, List, Optional
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from uuid import UUID
 import docusign_esign as docusign
 from docusign_esign import EnvelopesApi, EnvelopeDefinition, Document, Signer, SignHere
 from ..core.config import settings
+from ..core.templating import MissingFieldError, compile_template, render_many
+from ..models.document import DocumentStatus
+
+# DocuSign envelope statuses mapped onto the document lifecycle
+ENVELOPE_STATUSES = {
+    "created": DocumentStatus.PENDING_SIGNATURE,
+    "sent": DocumentStatus.PENDING_SIGNATURE,
+    "delivered": DocumentStatus.PENDING_SIGNATURE,
+    "correct": DocumentStatus.PENDING_SIGNATURE,
+    "signed": DocumentStatus.PENDING_SIGNATURE,
+    "completed": DocumentStatus.SIGNED,
+    "declined": DocumentStatus.CANCELLED,
+    "voided": DocumentStatus.CANCELLED,
+    "deleted": DocumentStatus.CANCELLED,
+}
+
+def parse_docusign_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+def parse_connect_event(payload: Dict) -> Dict:
+    """
+    Turn a DocuSign Connect (JSON, SIM) envelope event into an envelope update.
+    """
+    data = payload.get("data") or {}
+    summary = data.get("envelopeSummary") or {}
+    event = payload.get("event", "")
+
+    # Without "include envelope data" the status is only in the event name
+    status = summary.get("status") or event.removeprefix("envelope-")
+    signers = (summary.get("recipients") or {}).get("signers") or []
+
+    return {
+        "envelope_id": data.get("envelopeId") or summary.get("envelopeId"),
+        "status": status,
+        "status_changed_at": (
+            summary.get("statusChangedDateTime")
+            or payload.get("generatedDateTime")
+        ),
+        "sent_at": summary.get("sentDateTime"),
+        "completed_at": summary.get("completedDateTime"),
+        "signers": [
+            {
+                "name": signer.get("name"),
+                "email": signer.get("email"),
+                "status": signer.get("status"),
+                "signed_at": signer.get("signedDateTime"),
+            }
+            for signer in signers
+        ],
+    }
+
+def envelope_to_update(envelope) -> Dict:
+    """
+    Turn an envelope from the eSignature API into the same update shape.
+    """
+    signers = (envelope.recipients.signers or []) if envelope.recipients else []
+    return {
+        "envelope_id": envelope.envelope_id,
+        "status": envelope.status,
+        "status_changed_at": envelope.status_changed_date_time,
+        "sent_at": envelope.sent_date_time,
+        "completed_at": envelope.completed_date_time,
+        "signers": [
+            {
+                "name": signer.name,
+                "email": signer.email,
+                "status": signer.status,
+                "signed_at": signer.signed_date_time,
+            }
+            for signer in signers
+        ],
+    }
+
+def apply_envelope_update(document, update: Dict) -> bool:
+    """
+    Apply an envelope update to a document, ignoring stale or repeated ones.
+
+    Connect retries deliveries and does not guarantee ordering, so an update
+    only wins if it is newer than the last one applied. Returns whether the
+    document changed.
+    """
+    metadata = dict(document.metadata or {})
+    docusign = dict(metadata.get("docusign") or {})
+
+    changed_at = parse_docusign_datetime(update.get("status_changed_at"))
+    last_changed_at = parse_docusign_datetime(docusign.get("status_changed_at"))
+    if changed_at and last_changed_at and changed_at <= last_changed_at:
+        return False
+
+    docusign["envelope_status"] = update["status"]
+    if changed_at:
+        docusign["status_changed_at"] = changed_at.isoformat()
+    if update.get("completed_at"):
+        docusign["completed_at"] = parse_docusign_datetime(update["completed_at"]).isoformat()
+    if update.get("signers"):
+        docusign["signers"] = update["signers"]
+
+    new_status = ENVELOPE_STATUSES.get(update["status"])
+    if new_status is not None:
+        document.status = new_status
+
+    # Reassign so the JSON column is marked dirty
+    metadata["docusign"] = docusign
+    document.metadata = metadata
+    return True
+
+def signature_status_from_document(document) -> Dict:
+    """
+    Signature status as last recorded on the document by Connect or the sync job.
+    """
+    docusign = (document.metadata or {}).get("docusign") or {}
+    signers = docusign.get("signers") or []
+    return {
+        "status": document.status,
+        "signed_by": [
+            signer["email"] or signer["name"]
+            for signer in signers
+            if signer.get("status") == "completed"
+        ] or None,
+        "signed_at": parse_docusign_datetime(docusign.get("completed_at")),
+    }
 
 class DocumentTemplate:
-    def __init__(self, name: str, content: str, fields: List[str]):
+    def __init__(self, name: str, content: str, fields: Optional[List[str]] = None):
         self.name = name
         self.content = content
-        self.fields = fields
+        self.compiled = compile_template(content)
+        # Declared fields take precedence over the ones found in the content
+        self.fields = frozenset(fields) if fields is not None else self.compiled.required_fields
 
 class DocumentService:
     def __init__(self):
@@ -17,6 +143,9 @@ class DocumentService:
         self.api_client.host = "https://demo.docusign.net/restapi"  # Use production URL in prod
         self.api_client.set_default_header("Authorization", f"Bearer {settings.DOCUSIGN_API_KEY}")
         self.templates = self._initialize_templates()
+        self.render_workers = settings.DOCUMENT_RENDER_WORKERS
+        self.render_chunk_size = settings.DOCUMENT_RENDER_CHUNK_SIZE
+        self._render_pool: Optional[ProcessPoolExecutor] = None
 
     def _initialize_templates(self) -> Dict[str, DocumentTemplate]:
         """
@@ -113,22 +242,73 @@ class DocumentService:
             )
         }
 
-    async def generate_document(self, template_name: str, context: Dict) -> str:
-        """
-        Generate a document from a template.
-        """
+    def _get_template(self, template_name: str, context: Dict) -> DocumentTemplate:
         template = self.templates.get(template_name)
         if not template:
             raise ValueError(f"Template {template_name} not found")
 
         # Validate all required fields are present
-        missing_fields = [field for field in template.fields if field not in context]
+        missing_fields = template.fields.difference(context)
         if missing_fields:
-            raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
+        return template
+
+    async def generate_document(self, template_name: str, context: Dict) -> str:
+        """
+        Generate a document from a template.
+        """
+        template = self._get_template(template_name, context)
 
         # Generate document content
-        document_content = template.content.format(**context)
-        return document_content
+        try:
+            return template.compiled.render(context)
+        except MissingFieldError as e:
+            raise ValueError(f"Missing required fields: {e.field}")
+
+    def _get_render_pool(self) -> ProcessPoolExecutor:
+        if self._render_pool is None:
+            # Spawned, not forked: the parent runs an event loop and other pools' threads
+            self._render_pool = ProcessPoolExecutor(
+                max_workers=self.render_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._render_pool
+
+    async def generate_documents(self, requests: List[Tuple[str, Dict]]) -> List[str]:
+        """
+        Generate many documents, in request order, from (template name, context) pairs.
+
+        Every request is validated before anything renders, so one bad context
+        fails the batch up front. Rendering is pure CPU: a batch of up to one
+        chunk renders on a worker thread so the event loop keeps serving;
+        larger batches are split across a process pool, which only pays for
+        its pickling once there is enough work per chunk.
+        """
+        sources = {}
+        for index, (template_name, context) in enumerate(requests):
+            try:
+                sources[template_name] = self._get_template(template_name, context).content
+            except ValueError as e:
+                raise ValueError(f"Document {index}: {e}")
+
+        try:
+            if len(requests) <= self.render_chunk_size or self.render_workers <= 1:
+                return await asyncio.to_thread(render_many, sources, requests)
+
+            loop = asyncio.get_running_loop()
+            pool = self._get_render_pool()
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(pool, render_many, sources, requests[start:start + self.render_chunk_size])
+                for start in range(0, len(requests), self.render_chunk_size)
+            ))
+        except MissingFieldError as e:
+            raise ValueError(f"Missing required fields: {e.field}")
+        return [content for chunk in chunks for content in chunk]
+
+    def shutdown(self) -> None:
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
 
     async def send_for_signature(self, 
                                document_content: str,
@@ -192,22 +372,37 @@ class DocumentService:
         """
         try:
             envelopes_api = EnvelopesApi(self.api_client)
-            envelope = envelopes_api.get_envelope(
+            envelope = await asyncio.to_thread(
+                envelopes_api.get_envelope,
                 account_id=settings.DOCUSIGN_ACCOUNT_ID,
                 envelope_id=envelope_id
             )
 
             return {
                 "status": envelope.status,
-                "sent_datetime": envelope.sent_datetime,
-                "completed_datetime": envelope.completed_datetime,
-                "last_modified_datetime": envelope.last_modified_datetime
+                "sent_datetime": envelope.sent_date_time,
+                "completed_datetime": envelope.completed_date_time,
+                "last_modified_datetime": envelope.last_modified_date_time
             }
 
         except Exception as e:
             print(f"Error getting signature status: {str(e)}")
             raise
 
+    async def list_status_changes(self, envelope_ids: List[str], since: datetime) -> List[Dict]:
+        """
+        Fetch a batch of envelopes that changed since a timestamp, in one call.
+        """
+        envelopes_api = EnvelopesApi(self.api_client)
+        result = await asyncio.to_thread(
+            envelopes_api.list_status_changes,
+            account_id=settings.DOCUSIGN_ACCOUNT_ID,
+            envelope_ids=",".join(envelope_ids),
+            from_date=since.isoformat(),
+            include="recipients"
+        )
+        return [envelope_to_update(envelope) for envelope in result.envelopes or []]
+
     def add_template(self, name: str, content: str, fields: List[str]) -> None:
         """
         Add a new document template.
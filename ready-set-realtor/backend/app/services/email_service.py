@@ -1,15 +1,18 @@
-from typing import List, Optional
-import smtplib
+from typing import List, Optional, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from ..core.config import settings
+from ..core.smtp import SMTPConnectionPool
+from ..core.templating import compile_template
 
 class EmailTemplate:
     def __init__(self, subject: str, body: str, is_html: bool = True):
         self.subject = subject
         self.body = body
         self.is_html = is_html
+        self.compiled_subject = compile_template(subject)
+        self.compiled_body = compile_template(body)
 
 class EmailService:
     def __init__(self):
@@ -17,6 +20,17 @@ class EmailService:
         self.port = settings.SMTP_PORT
         self.username = settings.SMTP_USERNAME
         self.password = settings.SMTP_PASSWORD
+        self.transport = SMTPConnectionPool(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            size=settings.SMTP_POOL_SIZE,
+            start_tls=settings.SMTP_START_TLS,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+            idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT,
+        )
         self.templates = self._initialize_templates()
 
     def _initialize_templates(self) -> dict:
@@ -83,6 +97,39 @@ class EmailService:
             )
         }
 
+    def _build_message(self,
+                       to_email: str,
+                       subject: str,
+                       body: str,
+                       is_html: bool = True,
+                       cc: Optional[List[str]] = None,
+                       bcc: Optional[List[str]] = None) -> Tuple[MIMEMultipart, List[str]]:
+        """
+        Build a MIME message and its full recipient list.
+        """
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.username
+        msg['To'] = to_email
+        
+        if cc:
+            msg['Cc'] = ", ".join(cc)
+        if bcc:
+            msg['Bcc'] = ", ".join(bcc)
+
+        if is_html:
+            msg.attach(MIMEText(body, 'html'))
+        else:
+            msg.attach(MIMEText(body, 'plain'))
+
+        recipients = [to_email]
+        if cc:
+            recipients.extend(cc)
+        if bcc:
+            recipients.extend(bcc)
+
+        return msg, recipients
+
     async def send_email(self, 
                         to_email: str, 
                         template_name: str, 
@@ -97,37 +144,15 @@ class EmailService:
             raise ValueError(f"Template {template_name} not found")
 
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = template.subject.format(**context)
-            msg['From'] = self.username
-            msg['To'] = to_email
-            
-            if cc:
-                msg['Cc'] = ", ".join(cc)
-            if bcc:
-                msg['Bcc'] = ", ".join(bcc)
-
-            # Add body
-            body = template.body.format(**context)
-            if template.is_html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
-
-            # Send email
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-                
-                server.sendmail(self.username, recipients, msg.as_string())
-
+            msg, recipients = self._build_message(
+                to_email,
+                template.compiled_subject.render(context),
+                template.compiled_body.render(context),
+                template.is_html,
+                cc,
+                bcc,
+            )
+            await self.transport.send(msg, self.username, recipients)
             return True
 
         except Exception as e:
@@ -146,39 +171,20 @@ class EmailService:
         Send a custom email without using a template.
         """
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.username
-            msg['To'] = to_email
-            
-            if cc:
-                msg['Cc'] = ", ".join(cc)
-            if bcc:
-                msg['Bcc'] = ", ".join(bcc)
-
-            if is_html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
-
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-                
-                server.sendmail(self.username, recipients, msg.as_string())
-
+            msg, recipients = self._build_message(to_email, subject, body, is_html, cc, bcc)
+            await self.transport.send(msg, self.username, recipients)
             return True
 
         except Exception as e:
             print(f"Error sending custom email: {str(e)}")
             return False
 
+    async def close(self) -> None:
+        """
+        Close pooled SMTP connections; called from the app lifespan.
+        """
+        await self.transport.close()
+
     def add_template(self, name: str, subject: str, body: str, is_html: bool = True) -> None:
         """
         Add a new email template.
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.document import Document, DocumentStatus
+from .document_service import (
+    apply_envelope_update,
+    document_service,
+    parse_docusign_datetime,
+)
+
+class EnvelopeSyncService:
+    def __init__(self):
+        self.batch_size = settings.DOCUSIGN_SYNC_BATCH_SIZE
+        self.concurrency = settings.DOCUSIGN_SYNC_CONCURRENCY
+
+    def _last_change(self, document: Document) -> datetime:
+        docusign = (document.metadata or {}).get("docusign") or {}
+        return parse_docusign_datetime(docusign.get("status_changed_at")) or document.created_at
+
+    async def sync_pending(self, session_factory: async_sessionmaker = AsyncSessionLocal) -> Dict:
+        """
+        Refresh every document awaiting signature from DocuSign in bulk.
+
+        Envelope ids are sent in batches to listStatusChanges, each batch
+        asking only for changes since the oldest status it already has, with
+        at most `concurrency` calls in flight. All changes are written in one
+        transaction.
+        """
+        async with session_factory() as db:
+            result = await db.execute(
+                select(Document).where(
+                    Document.status == DocumentStatus.PENDING_SIGNATURE,
+                    Document.docusign_id.isnot(None),
+                )
+            )
+            documents = {document.docusign_id: document for document in result.scalars().all()}
+            if not documents:
+                return {"checked": 0, "batches": 0, "failed_batches": 0, "updated": 0}
+
+            envelope_ids = list(documents)
+            batches = [
+                envelope_ids[i:i + self.batch_size]
+                for i in range(0, len(envelope_ids), self.batch_size)
+            ]
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def fetch(batch: List[str]) -> List[Dict]:
+                since = min(self._last_change(documents[envelope_id]) for envelope_id in batch)
+                async with semaphore:
+                    return await document_service.list_status_changes(batch, since)
+
+            updated = 0
+            failed_batches = 0
+            results = await asyncio.gather(*(fetch(batch) for batch in batches), return_exceptions=True)
+            for updates in results:
+                # A failed batch is retried on the next run; the rest still land
+                if isinstance(updates, Exception):
+                    print(f"Error syncing envelope batch: {str(updates)}")
+                    failed_batches += 1
+                    continue
+                for update in updates:
+                    document = documents.get(update["envelope_id"])
+                    if document is not None and apply_envelope_update(document, update):
+                        updated += 1
+
+            await db.commit()
+
+        return {
+            "checked": len(documents),
+            "batches": len(batches),
+            "failed_batches": failed_batches,
+            "updated": updated,
+        }
+
+# Create a singleton instance
+envelope_sync_service = EnvelopeSyncService()
+
+if __name__ == "__main__":
+    print(asyncio.run(envelope_sync_service.sync_pending()))
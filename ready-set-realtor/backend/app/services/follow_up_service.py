@@ -0,0 +1,208 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.communication import Communication, CommunicationDirection, CommunicationStatus, CommunicationType
+from ..models.follow_up_schedule import FollowUpSchedule, FollowUpScheduleStatus
+from ..models.lead import Lead
+from ..mcp.core import AgentType
+from ..mcp.pool import agent_pool
+from .email_service import email_service
+from .twilio_service import twilio_service
+
+class FollowUpService:
+    """
+    Persisted follow-up schedules, and the dispatcher that sends them when due.
+
+    The dispatcher claims due schedules a batch at a time with
+    SELECT ... FOR UPDATE SKIP LOCKED over the (status, next_contact) index,
+    so several dispatchers can poll at once without claiming the same row,
+    and a poll reads only the rows it claims however many schedules exist.
+    Claiming pushes next_contact out by a lease; a schedule whose send never
+    finishes becomes due again once the lease runs out.
+    """
+
+    def __init__(self):
+        self.batch_size = settings.FOLLOW_UP_DISPATCH_BATCH_SIZE
+        self.lease = timedelta(seconds=settings.FOLLOW_UP_LEASE_SECONDS)
+        self.max_attempts = settings.FOLLOW_UP_MAX_ATTEMPTS
+        self.retry_delay = timedelta(minutes=settings.FOLLOW_UP_RETRY_MINUTES)
+
+    def due_query(self, now: datetime, limit: int):
+        """
+        Active schedules due by `now`, oldest first.
+        """
+        return select(FollowUpSchedule.id, FollowUpSchedule.step).where(
+            FollowUpSchedule.status == FollowUpScheduleStatus.ACTIVE,
+            FollowUpSchedule.next_contact <= now,
+        ).order_by(FollowUpSchedule.next_contact).limit(limit)
+
+    async def create_schedule(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        lead_id: UUID,
+        stage: str,
+        context: Optional[Dict] = None,
+    ) -> FollowUpSchedule:
+        """
+        Schedule the FollowUpAgent templates for a lead's stage, replacing any active schedule.
+
+        Raises ValueError if no template applies to the stage.
+        """
+        async with agent_pool.acquire(AgentType.FOLLOW_UP) as agent:
+            plan = await agent.create_follow_up_schedule(lead_id, {"stage": stage})
+        if not plan.templates:
+            raise ValueError(f"No follow-up templates for stage {stage!r}")
+
+        await db.execute(
+            update(FollowUpSchedule).where(
+                FollowUpSchedule.lead_id == lead_id,
+                FollowUpSchedule.status == FollowUpScheduleStatus.ACTIVE,
+            ).values(status=FollowUpScheduleStatus.CANCELLED, next_contact=None)
+        )
+        schedule = FollowUpSchedule(
+            user_id=user_id,
+            lead_id=lead_id,
+            stage=stage,
+            template_ids=[template.template_id for template in plan.templates],
+            step=0,
+            context=context or {},
+            status=FollowUpScheduleStatus.ACTIVE,
+            next_contact=datetime.now(timezone.utc) + timedelta(days=plan.templates[0].delay or 0),
+            attempts=0,
+        )
+        db.add(schedule)
+        await db.commit()
+        await db.refresh(schedule)
+        return schedule
+
+    async def cancel_schedule(self, db: AsyncSession, schedule: FollowUpSchedule) -> FollowUpSchedule:
+        schedule.status = FollowUpScheduleStatus.CANCELLED
+        schedule.next_contact = None
+        await db.commit()
+        await db.refresh(schedule)
+        return schedule
+
+    async def claim_due(self, db: AsyncSession, now: Optional[datetime] = None) -> List[Tuple[UUID, int]]:
+        """
+        Claim up to a batch of due schedules, returning their ids and the step each is on.
+        """
+        now = now or datetime.now(timezone.utc)
+        result = await db.execute(self.due_query(now, self.batch_size).with_for_update(skip_locked=True))
+        claimed = [(schedule_id, step) for schedule_id, step in result]
+        if claimed:
+            await db.execute(
+                update(FollowUpSchedule).where(
+                    FollowUpSchedule.id.in_([schedule_id for schedule_id, _ in claimed])
+                ).values(next_contact=now + self.lease)
+            )
+        await db.commit()
+        return claimed
+
+    async def dispatch_due(
+        self,
+        enqueue: Callable[[UUID, int], None],
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+    ) -> int:
+        """
+        Claim every due schedule and hand each to `enqueue`, returning how many were claimed.
+
+        Each batch commits its claim before it is enqueued, so a dispatcher
+        that dies in between only delays those schedules by the lease.
+        """
+        dispatched = 0
+        while True:
+            async with session_factory() as db:
+                claimed = await self.claim_due(db)
+            for schedule_id, step in claimed:
+                enqueue(schedule_id, step)
+            dispatched += len(claimed)
+            if len(claimed) < self.batch_size:
+                return dispatched
+
+    async def _deliver(self, lead: Lead, channel: str, content: str) -> None:
+        if channel == CommunicationType.EMAIL.value and lead.email:
+            sent = await email_service.send_custom_email(lead.email, "Following up", content, is_html=False)
+            if not sent:
+                raise RuntimeError("Email delivery failed")
+        elif channel == CommunicationType.TEXT.value and lead.phone:
+            await twilio_service.send_sms(lead.phone, content)
+        else:
+            raise ValueError(f"Lead has no address for {channel} follow-ups")
+
+    async def send(self, schedule_id: UUID, step: int, session_factory: async_sessionmaker = AsyncSessionLocal) -> Dict:
+        """
+        Generate and send a claimed schedule's next message, then move it to the following template.
+
+        Skips the schedule if another worker holds it or it has moved past
+        `step`, so a redelivered task never sends the same message twice.
+        Failures back off and retry until `max_attempts`, then mark it failed.
+        """
+        async with session_factory() as db:
+            result = await db.execute(
+                select(FollowUpSchedule).where(FollowUpSchedule.id == schedule_id).with_for_update(skip_locked=True)
+            )
+            schedule = result.scalars().first()
+            if schedule is None or schedule.status != FollowUpScheduleStatus.ACTIVE or schedule.step != step:
+                return {"status": "skipped"}
+
+            lead = await db.get(Lead, schedule.lead_id)
+            template_id = schedule.template_ids[step]
+            now = datetime.now(timezone.utc)
+            try:
+                async with agent_pool.acquire(AgentType.FOLLOW_UP) as agent:
+                    await agent.create_follow_up_schedule(lead.id, {"stage": schedule.stage})
+                    template = agent.templates[template_id]
+                    message = await agent.generate_follow_up_message(lead.id, template_id, {
+                        **(schedule.context or {}),
+                        "lead_name": f"{lead.first_name} {lead.last_name}",
+                        "stage": schedule.stage,
+                    })
+                    next_template = (
+                        agent.templates[schedule.template_ids[step + 1]]
+                        if step + 1 < len(schedule.template_ids) else None
+                    )
+                await self._deliver(lead, template.channel, message["content"])
+            except Exception as e:
+                schedule.attempts += 1
+                schedule.last_error = str(e)
+                if schedule.attempts >= self.max_attempts:
+                    schedule.status = FollowUpScheduleStatus.FAILED
+                    schedule.next_contact = None
+                else:
+                    schedule.next_contact = now + self.retry_delay * schedule.attempts
+                await db.commit()
+                return {"status": "failed", "attempts": schedule.attempts}
+
+            communication = Communication(
+                user_id=schedule.user_id,
+                lead_id=lead.id,
+                type=CommunicationType(template.channel),
+                direction=CommunicationDirection.OUTBOUND,
+                status=CommunicationStatus.COMPLETED,
+                content=message["content"],
+                sent_at=now,
+                metadata={"follow_up_schedule_id": str(schedule.id), "template_id": template_id}
+            )
+            db.add(communication)
+            lead.last_contacted = now
+            schedule.last_contact = now
+            schedule.attempts = 0
+            schedule.last_error = None
+            schedule.step = step + 1
+            if next_template is not None:
+                schedule.next_contact = now + timedelta(days=next_template.delay or 0)
+            else:
+                schedule.status = FollowUpScheduleStatus.COMPLETED
+                schedule.next_contact = None
+            await db.commit()
+            return {"status": "sent", "communication_id": str(communication.id)}
+
+# Create a singleton instance
+follow_up_service = FollowUpService()
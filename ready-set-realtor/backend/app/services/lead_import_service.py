@@ -0,0 +1,195 @@
+import codecs
+import csv
+import json
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.lead import Lead
+from ..schemas.lead import LeadCreate
+
+SUPPORTED_FORMATS = ("csv", "ndjson")
+
+FORMAT_BY_SUFFIX = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+FORMAT_BY_CONTENT_TYPE = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# (row number, parsed row or None, parse error or None)
+ParsedRow = Tuple[int, Optional[Dict], Optional[str]]
+
+# (validated leads, failed row count, per-row errors) for one batch
+ParsedBatch = Tuple[List[Dict], int, List[Dict]]
+
+def decode_lines(file: BinaryIO, bad_lines: List[int]) -> Iterator[str]:
+    """
+    Decode an upload line by line, skipping lines that are not valid UTF-8.
+
+    The number of each skipped line is appended to `bad_lines` so the caller
+    can report it as a row error instead of failing the whole import.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for line_number, raw_line in enumerate(file, start=1):
+        try:
+            yield decoder.decode(raw_line)
+        except UnicodeDecodeError:
+            decoder.reset()
+            bad_lines.append(line_number)
+            yield "\n"
+
+class LeadImportService:
+    def __init__(self):
+        self.batch_size = settings.LEAD_IMPORT_BATCH_SIZE
+        self.max_errors = settings.LEAD_IMPORT_MAX_ERRORS
+
+    def detect_format(self, filename: Optional[str], content_type: Optional[str]) -> str:
+        """
+        Work out the file format from the upload's filename or content type.
+        """
+        for suffix, file_format in FORMAT_BY_SUFFIX.items():
+            if filename and filename.lower().endswith(suffix):
+                return file_format
+
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if media_type in FORMAT_BY_CONTENT_TYPE:
+            return FORMAT_BY_CONTENT_TYPE[media_type]
+
+        raise ValueError(f"Cannot detect import format; pass one of: {', '.join(SUPPORTED_FORMATS)}")
+
+    def iter_rows(self, file: BinaryIO, file_format: str) -> Iterator[ParsedRow]:
+        """
+        Lazily parse rows from an uploaded file, one line at a time.
+        """
+        if file_format == "csv":
+            yield from self._iter_csv(file)
+        elif file_format == "ndjson":
+            yield from self._iter_ndjson(file)
+        else:
+            raise ValueError(f"Unsupported import format: {file_format}")
+
+    def _iter_csv(self, file: BinaryIO) -> Iterator[ParsedRow]:
+        bad_lines: List[int] = []
+        reader = csv.DictReader(decode_lines(file, bad_lines))
+        for record in reader:
+            # Undecodable lines read as blank and are skipped by the reader
+            while bad_lines:
+                yield bad_lines.pop(0), None, "Invalid UTF-8"
+            # Blank cells fall back to the schema defaults
+            row = {
+                key.strip(): value.strip()
+                for key, value in record.items()
+                if key and value is not None and value.strip() != ""
+            }
+            yield reader.line_num, row, None
+        for line_number in bad_lines:
+            yield line_number, None, "Invalid UTF-8"
+
+    def _iter_ndjson(self, file: BinaryIO) -> Iterator[ParsedRow]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        for line_number, raw_line in enumerate(file, start=1):
+            try:
+                line = decoder.decode(raw_line).strip()
+            except UnicodeDecodeError:
+                decoder.reset()
+                yield line_number, None, "Invalid UTF-8"
+                continue
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Each line must be a JSON object"
+                continue
+            yield line_number, row, None
+
+    def _parse_batch(self, rows: Iterator[ParsedRow], batch_size: int, user_id: UUID) -> Optional[ParsedBatch]:
+        """
+        Read and validate the next batch of rows, or return None once the file is exhausted.
+        """
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            return None
+
+        leads = []
+        failed = 0
+        errors: List[Dict] = []
+        for row_number, row, parse_error in chunk:
+            if parse_error is not None:
+                row_errors = [{"field": None, "message": parse_error}]
+            else:
+                try:
+                    lead = LeadCreate.model_validate({**row, "user_id": user_id})
+                    leads.append(lead.model_dump())
+                    continue
+                except ValidationError as e:
+                    row_errors = [
+                        {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+                        for error in e.errors()
+                    ]
+
+            failed += 1
+            errors.append({"row": row_number, "errors": row_errors})
+        return leads, failed, errors
+
+    async def import_leads(
+        self,
+        db: AsyncSession,
+        file: BinaryIO,
+        file_format: str,
+        user_id: UUID,
+        batch_size: Optional[int] = None,
+    ) -> Dict:
+        """
+        Validate and insert leads from a CSV or NDJSON file in batches.
+
+        Only one batch of rows is held in memory at a time. Each batch is
+        parsed and validated on a worker thread, so a large upload does not
+        block the event loop, then written with a single multi-row INSERT and
+        committed, so a bad row never rolls back rows imported before it.
+        """
+        batch_size = batch_size or self.batch_size
+        rows = self.iter_rows(file, file_format)
+        imported = 0
+        failed = 0
+        errors: List[Dict] = []
+
+        while True:
+            batch = await run_in_threadpool(self._parse_batch, rows, batch_size, user_id)
+            if batch is None:
+                break
+
+            leads, batch_failed, batch_errors = batch
+            failed += batch_failed
+            errors.extend(batch_errors[:self.max_errors - len(errors)])
+
+            if leads:
+                await db.execute(insert(Lead), leads)
+                await db.commit()
+                imported += len(leads)
+
+        return {
+            "imported": imported,
+            "failed": failed,
+            "errors": errors,
+            "errors_truncated": failed > len(errors),
+        }
+
+# Create a singleton instance
+lead_import_service = LeadImportService()
@@ -0,0 +1,207 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+
+import openai
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..core.rate_limit import TokenBucket
+
+# Rough prompt size: about four characters per token plus per-message framing
+CHARS_PER_TOKEN = 4
+TOKENS_PER_MESSAGE = 4
+
+def estimate_tokens(messages: List[Dict[str, str]], max_tokens: Optional[int]) -> int:
+    """
+    Upper-bound guess of a request's token cost, charged before the call.
+    """
+    prompt = sum(len(message.get("content") or "") // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE for message in messages)
+    return prompt + (max_tokens or 0)
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Delay requested by a 429, from retry-after-ms or retry-after (seconds or HTTP date).
+    """
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+class OpenAIService:
+    """
+    One AsyncOpenAI client shared by every agent, with org-wide throttling.
+
+    Calls take a request from the RPM bucket and their estimated tokens from
+    the TPM bucket, then a slot from the concurrency semaphore. A 429 pauses
+    both buckets for its Retry-After, so every caller backs off together
+    instead of each retrying into the limit. The client's own retries are
+    off so all waiting goes through here.
+    """
+
+    def __init__(self):
+        self.api_key = settings.OPENAI_API_KEY
+        self.max_retries = settings.OPENAI_MAX_RETRIES
+        self.in_flight = 0
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self.semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        burst = settings.OPENAI_BURST_SECONDS / 60
+        self.request_bucket = TokenBucket(settings.OPENAI_RPM, capacity=max(settings.OPENAI_RPM * burst, 1))
+        self.token_bucket = TokenBucket(settings.OPENAI_TPM, capacity=max(settings.OPENAI_TPM * burst, 1))
+
+        metrics.gauge("openai_requests_in_flight", "OpenAI calls currently running", lambda: self.in_flight)
+        self.throttle_wait_seconds = metrics.histogram(
+            "openai_throttle_wait_seconds",
+            "Time calls waited for RPM/TPM budget and a concurrency slot",
+        )
+        self.rate_limited = metrics.counter("openai_rate_limited_total", "429 responses from OpenAI")
+        self.tokens_used = metrics.counter("openai_tokens_total", "Tokens reported used by OpenAI")
+        self.first_token_seconds = metrics.histogram(
+            "openai_stream_first_token_seconds",
+            "Time from a streamed call being made to its first token",
+        )
+
+    def _build_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=settings.OPENAI_TIMEOUT,
+            max_retries=0,
+        )
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """
+        The shared client, created on first use outside the app lifespan.
+        """
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    async def start(self) -> None:
+        """
+        Create the shared client; called from the app lifespan.
+        """
+        if self._client is None:
+            self._client = self._build_client()
+
+    async def close(self) -> None:
+        """
+        Close pooled connections; called from the app lifespan.
+        """
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _backoff(self, error: openai.RateLimitError, attempt: int) -> float:
+        delay = retry_after_seconds(error.response.headers)
+        if delay is None:
+            # Full jitter so callers released together do not retry together
+            delay = random.uniform(0, min(2 ** attempt, 60))
+        return delay
+
+    def _rate_limited(self, error: openai.RateLimitError, attempt: int) -> None:
+        """
+        Pause every caller for a 429's Retry-After, or re-raise if retrying won't help.
+        """
+        self.rate_limited.inc()
+        # Out of credit is not a rate limit; waiting will not help
+        if error.code == "insufficient_quota" or attempt == self.max_retries:
+            raise error
+        delay = self._backoff(error, attempt)
+        self.request_bucket.pause(delay)
+        self.token_bucket.pause(delay)
+
+    async def chat_completion(self, **request):
+        """
+        Create a chat completion within the configured RPM, TPM and concurrency limits.
+        """
+        estimate = estimate_tokens(request.get("messages", []), request.get("max_tokens"))
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            await self.request_bucket.acquire(1)
+            await self.token_bucket.acquire(estimate)
+
+            async with self.semaphore:
+                self.throttle_wait_seconds.observe(time.perf_counter() - started)
+                self.in_flight += 1
+                try:
+                    response = await self.client.chat.completions.create(**request)
+                except openai.RateLimitError as e:
+                    self._rate_limited(e, attempt)
+                    continue
+                finally:
+                    self.in_flight -= 1
+
+            if response.usage is not None:
+                self.tokens_used.inc(response.usage.total_tokens)
+                # Settle the estimate against what the call really cost
+                self.token_bucket.adjust(response.usage.total_tokens - estimate)
+            return response
+
+    async def stream_chat_completion(self, **request) -> AsyncIterator[str]:
+        """
+        Stream a chat completion's text as it is generated, within the same limits.
+
+        The concurrency slot is held until the stream ends. 429s arrive before
+        the first token, so a retry never repeats text already yielded.
+        Streamed responses carry no usage, so the token estimate is settled
+        from the length of the text received.
+        """
+        messages = request.get("messages", [])
+        estimate = estimate_tokens(messages, request.get("max_tokens"))
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            await self.request_bucket.acquire(1)
+            await self.token_bucket.acquire(estimate)
+
+            async with self.semaphore:
+                self.throttle_wait_seconds.observe(time.perf_counter() - started)
+                self.in_flight += 1
+                try:
+                    called = time.perf_counter()
+                    try:
+                        stream = await self.client.chat.completions.create(stream=True, **request)
+                    except openai.RateLimitError as e:
+                        self._rate_limited(e, attempt)
+                        continue
+
+                    characters = 0
+                    try:
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                if not characters:
+                                    self.first_token_seconds.observe(time.perf_counter() - called)
+                                characters += len(delta)
+                                yield delta
+                    finally:
+                        # Release the connection if the caller stopped reading early
+                        await stream.response.aclose()
+                finally:
+                    self.in_flight -= 1
+
+            used = estimate_tokens(messages, None) + characters // CHARS_PER_TOKEN
+            self.token_bucket.adjust(used - estimate)
+            return
+
+# Create a singleton instance
+openai_service = OpenAIService()
@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.lead import Lead, LeadStatus
+from ..models.qualification_job import QualificationJob, QualificationJobStatus
+from ..agents.lead_generation_agent import LeadGenerationAgent
+from ..mcp.core import AgentType
+from ..mcp.pool import agent_pool
+
+# Leads still worth re-qualifying; later stages are past qualification
+ACTIVE_STATUSES = [
+    LeadStatus.NEW,
+    LeadStatus.CONTACTED,
+    LeadStatus.QUALIFIED,
+    LeadStatus.APPOINTMENT_SET,
+    LeadStatus.NEGOTIATING,
+]
+
+# Stages a qualification result may move a lead between
+PRE_QUALIFICATION_STATUSES = {LeadStatus.NEW, LeadStatus.CONTACTED, LeadStatus.QUALIFIED}
+
+def next_status(current: LeadStatus, qualification_result: Dict) -> LeadStatus:
+    """
+    Lead status after a qualification, never moving a lead back from a later stage.
+    """
+    if current not in PRE_QUALIFICATION_STATUSES:
+        return current
+    if qualification_result.get("qualification_status") == "Qualified":
+        return LeadStatus.QUALIFIED
+    return LeadStatus.CONTACTED
+
+class QualificationService:
+    def __init__(self):
+        self.batch_size = settings.QUALIFICATION_BATCH_SIZE
+
+    def _lead_query(self, job: QualificationJob):
+        query = select(Lead)
+        if job.user_id is not None:
+            query = query.where(Lead.user_id == job.user_id)
+        if job.lead_ids is not None:
+            query = query.where(Lead.id.in_([UUID(lead_id) for lead_id in job.lead_ids]))
+        else:
+            query = query.where(Lead.status.in_([LeadStatus(status) for status in job.lead_statuses]))
+        return query
+
+    async def create_job(
+        self,
+        db: AsyncSession,
+        user_id: Optional[UUID],
+        lead_ids: Optional[List[UUID]] = None,
+        statuses: Optional[List[LeadStatus]] = None,
+        criteria: Optional[Dict] = None,
+    ) -> QualificationJob:
+        """
+        Record a queued job and count the leads it covers.
+        """
+        job = QualificationJob(
+            user_id=user_id,
+            lead_ids=[str(lead_id) for lead_id in lead_ids] if lead_ids is not None else None,
+            lead_statuses=None if lead_ids is not None else [
+                status.value for status in (statuses or ACTIVE_STATUSES)
+            ],
+            criteria=criteria or {},
+            status=QualificationJobStatus.QUEUED,
+            processed=0,
+            qualified=0,
+            failed=0,
+        )
+        count = await db.execute(select(func.count()).select_from(self._lead_query(job).subquery()))
+        job.total = count.scalar_one()
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def _qualify(self, agent: LeadGenerationAgent, lead: Lead, criteria: Dict) -> Dict:
+        metadata = lead.metadata or {}
+        conversation_history = list(metadata.get("conversation_history", []))
+        if lead.notes:
+            conversation_history.append(lead.notes)
+        return await agent.qualify_lead({
+            "conversation_history": conversation_history,
+            "criteria": criteria or metadata.get("criteria", {}),
+        })
+
+    async def run_job(self, job_id: UUID, session_factory: async_sessionmaker = AsyncSessionLocal) -> Dict:
+        """
+        Qualify every lead in a job, writing results back one batch at a time.
+
+        Each batch is qualified concurrently; the shared OpenAI service keeps
+        the calls within the org rate limit. Lead updates and the job's
+        progress counters commit together per batch, and the job remembers the
+        last lead written, so a retried task picks up where it stopped.
+        """
+        async with agent_pool.acquire(AgentType.LEAD_GENERATION) as agent, session_factory() as db:
+            job = await db.get(QualificationJob, job_id)
+            if job is None or job.status == QualificationJobStatus.COMPLETED:
+                return {"status": "ignored"}
+
+            job.status = QualificationJobStatus.RUNNING
+            job.started_at = job.started_at or datetime.now(timezone.utc)
+            await db.commit()
+
+            try:
+                while True:
+                    query = self._lead_query(job)
+                    if job.last_lead_id is not None:
+                        query = query.where(Lead.id > job.last_lead_id)
+                    result = await db.execute(query.order_by(Lead.id).limit(self.batch_size))
+                    leads = result.scalars().all()
+                    if not leads:
+                        break
+
+                    results = await asyncio.gather(
+                        *(self._qualify(agent, lead, job.criteria) for lead in leads),
+                        return_exceptions=True,
+                    )
+                    for lead, qualification_result in zip(leads, results):
+                        # A failed lead is counted and left as it was
+                        if isinstance(qualification_result, Exception):
+                            print(f"Error qualifying lead {lead.id}: {str(qualification_result)}")
+                            job.failed += 1
+                            continue
+                        lead.status = next_status(lead.status, qualification_result)
+                        lead.metadata = {
+                            **(lead.metadata or {}),
+                            "qualification_result": qualification_result,
+                            "qualified_at": qualification_result.get("qualified_at"),
+                        }
+                        if qualification_result.get("qualification_status") == "Qualified":
+                            job.qualified += 1
+
+                    job.processed += len(leads)
+                    job.last_lead_id = leads[-1].id
+                    await db.commit()
+
+                job.status = QualificationJobStatus.COMPLETED
+            except Exception as e:
+                await db.rollback()
+                await db.refresh(job)
+                job.status = QualificationJobStatus.FAILED
+                job.error = str(e)
+                raise
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                await db.commit()
+
+            return {
+                "status": job.status.value,
+                "total": job.total,
+                "processed": job.processed,
+                "qualified": job.qualified,
+                "failed": job.failed,
+            }
+
+# Create a singleton instance
+qualification_service = QualificationService()
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.transaction import MilestoneStatus, Transaction, TransactionMilestone
+from ..mcp.core import AgentType
+from ..mcp.pool import agent_pool
+
+# Milestones that still need doing; completed and waived ones never come due
+OPEN_STATUSES = (MilestoneStatus.PENDING, MilestoneStatus.IN_PROGRESS)
+
+class TransactionService:
+    """
+    Persisted transactions and the deadline views over their milestones.
+
+    The Transaction Coordinator agent still decides which milestones a deal
+    gets; they are stored so that due, overdue and at-risk questions across
+    every deal are index range scans on (status, due_date), optionally
+    prefixed by user_id, rather than walks over in-memory transactions.
+    """
+
+    def __init__(self):
+        self.due_soon = timedelta(hours=settings.MILESTONE_DUE_SOON_HOURS)
+        self.limit = settings.MILESTONE_QUERY_LIMIT
+
+    def _deadline_query(self, statuses, user_id: Optional[UUID], limit: Optional[int], *conditions):
+        query = select(TransactionMilestone).where(TransactionMilestone.status.in_(statuses), *conditions)
+        if user_id is not None:
+            query = query.where(TransactionMilestone.user_id == user_id)
+        return query.order_by(TransactionMilestone.due_date).limit(limit or self.limit)
+
+    def due_query(
+        self,
+        now: datetime,
+        within: Optional[timedelta] = None,
+        user_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+    ):
+        """
+        Open milestones due between now and `within` from now, soonest first.
+        """
+        return self._deadline_query(
+            OPEN_STATUSES, user_id, limit,
+            TransactionMilestone.due_date >= now,
+            TransactionMilestone.due_date < now + (within or self.due_soon),
+        )
+
+    def overdue_query(self, now: datetime, user_id: Optional[UUID] = None, limit: Optional[int] = None):
+        """
+        Open milestones whose due date has passed, most overdue first.
+        """
+        return self._deadline_query(OPEN_STATUSES, user_id, limit, TransactionMilestone.due_date < now)
+
+    def at_risk_query(
+        self,
+        now: datetime,
+        within: Optional[timedelta] = None,
+        user_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+    ):
+        """
+        Milestones due within the window that nobody has started yet.
+        """
+        return self._deadline_query(
+            (MilestoneStatus.PENDING,), user_id, limit,
+            TransactionMilestone.due_date >= now,
+            TransactionMilestone.due_date < now + (within or self.due_soon),
+        )
+
+    def milestone_query(self, transaction_id: UUID, key: str):
+        return select(TransactionMilestone).where(
+            TransactionMilestone.transaction_id == transaction_id,
+            TransactionMilestone.key == key,
+        )
+
+    async def create_transaction(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        property_address: str,
+        lead_id: Optional[UUID] = None,
+        closing_date: Optional[datetime] = None,
+        details: Optional[dict] = None,
+    ) -> Tuple[Transaction, List[TransactionMilestone]]:
+        """
+        Store a transaction with the milestones the Transaction Coordinator agent plans for it.
+        """
+        transaction = Transaction(
+            id=uuid4(),
+            user_id=user_id,
+            lead_id=lead_id,
+            property_address=property_address,
+            closing_date=closing_date,
+            details=details or {},
+        )
+        async with agent_pool.acquire(AgentType.TRANSACTION_COORDINATOR) as agent:
+            planned = await agent.create_transaction({
+                **transaction.details,
+                "transaction_id": str(transaction.id),
+                "property_address": property_address,
+            })
+
+        milestones = [
+            TransactionMilestone(
+                transaction_id=transaction.id,
+                user_id=user_id,
+                key=milestone.key,
+                name=milestone.name,
+                description=milestone.description,
+                # The agent plans in naive local time
+                due_date=milestone.due_date.astimezone(timezone.utc),
+                status=MilestoneStatus(milestone.status),
+                assigned_to=milestone.assigned_to,
+            )
+            for milestone in planned["milestones"]
+        ]
+        db.add(transaction)
+        await db.flush()
+        db.add_all(milestones)
+        await db.commit()
+        await db.refresh(transaction)
+        for milestone in milestones:
+            await db.refresh(milestone)
+        return transaction, milestones
+
+    async def get_milestones(self, db: AsyncSession, transaction_id: UUID) -> List[TransactionMilestone]:
+        result = await db.execute(
+            select(TransactionMilestone).where(
+                TransactionMilestone.transaction_id == transaction_id
+            ).order_by(TransactionMilestone.due_date)
+        )
+        return result.scalars().all()
+
+    async def update_milestone(
+        self, db: AsyncSession, milestone: TransactionMilestone, changes: dict
+    ) -> TransactionMilestone:
+        """
+        Apply changes to a milestone, stamping completed_at when it is completed.
+        """
+        for field, value in changes.items():
+            setattr(milestone, field, value)
+        if "status" in changes:
+            milestone.completed_at = (
+                datetime.now(timezone.utc) if milestone.status == MilestoneStatus.COMPLETED else None
+            )
+        await db.commit()
+        await db.refresh(milestone)
+        return milestone
+
+# Create a singleton instance
+transaction_service = TransactionService()
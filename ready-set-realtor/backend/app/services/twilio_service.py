@@ -1,13 +1,85 @@
+import asyncio
+from typing import Awaitable, Dict, List, Optional, TypeVar
+
+from aiohttp import ClientSession, TCPConnector
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.rest import Client
-from typing import Dict, Optional
+
 from ..core.config import settings
 
+T = TypeVar("T")
+
 class TwilioService:
     def __init__(self):
         self.account_sid = settings.TWILIO_ACCOUNT_SID
         self.auth_token = settings.TWILIO_AUTH_TOKEN
         self.from_number = settings.TWILIO_PHONE_NUMBER
-        self.client = Client(self.account_sid, self.auth_token)
+        self.send_concurrency = settings.TWILIO_SEND_CONCURRENCY
+        self.timeout = settings.TWILIO_TIMEOUT
+        self._http_client: Optional[AsyncTwilioHttpClient] = None
+        self._client: Optional[Client] = None
+
+    def _build_session(self) -> ClientSession:
+        # No session timeout: AsyncTwilioHttpClient passes timeout=None on
+        # every request, which overrides it. Calls are bounded by _call instead.
+        return ClientSession(
+            connector=TCPConnector(
+                limit=settings.TWILIO_MAX_CONNECTIONS,
+                keepalive_timeout=settings.TWILIO_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    def _connect(self) -> None:
+        self._http_client = AsyncTwilioHttpClient(pool_connections=False)
+        self._http_client.session = self._build_session()
+        self._client = Client(self.account_sid, self.auth_token, http_client=self._http_client)
+
+    @property
+    def client(self) -> Client:
+        """
+        Twilio client on a shared aiohttp session, created on first use.
+
+        The session must be created inside the running event loop, so this
+        cannot happen at import time.
+        """
+        if self._client is None or self._http_client.session.closed:
+            self._connect()
+        return self._client
+
+    async def start(self) -> None:
+        """
+        Open the shared connection pool; called from the app lifespan.
+        """
+        if self._client is None or self._http_client.session.closed:
+            self._connect()
+
+    async def close(self) -> None:
+        """
+        Close pooled connections; called from the app lifespan.
+        """
+        if self._http_client is not None:
+            await self._http_client.close()
+            self._http_client = None
+            self._client = None
+
+    async def _call(self, request: Awaitable[T]) -> T:
+        """
+        Await a Twilio request, raising asyncio.TimeoutError after TWILIO_TIMEOUT seconds.
+        """
+        return await asyncio.wait_for(request, self.timeout)
+
+    def _message_to_dict(self, message) -> Dict:
+        return {
+            "id": message.sid,
+            "status": message.status,
+            "to": message.to,
+            "from": message.from_,
+            "body": message.body,
+            "date_created": message.date_created,
+            "date_sent": message.date_sent,
+            "price": message.price,
+            "price_unit": message.price_unit,
+        }
 
     async def send_sms(
         self,
@@ -26,35 +98,39 @@ class TwilioService:
         if media_url:
             params["media_url"] = [media_url]
 
-        message = self.client.messages.create(**params)
-        return {
-            "id": message.sid,
-            "status": message.status,
-            "to": message.to,
-            "from": message.from_,
-            "body": message.body,
-            "date_created": message.date_created,
-            "date_sent": message.date_sent,
-            "price": message.price,
-            "price_unit": message.price_unit,
-        }
+        message = await self._call(self.client.messages.create_async(**params))
+        return self._message_to_dict(message)
+
+    async def send_sms_many(
+        self,
+        messages: List[Dict],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Send many SMS messages concurrently, at most `concurrency` in flight.
+
+        Each item takes the same keys as send_sms. Results come back in input
+        order; a failed send is reported in its result instead of raising.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.send_concurrency)
+
+        async def send_one(item: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    sent = await self.send_sms(**item)
+                    return {"to": item["to_number"], "success": True, "message": sent, "error": None}
+                except Exception as e:
+                    # Others in the batch may already be sent, so one failure must not abort it
+                    return {"to": item["to_number"], "success": False, "message": None, "error": str(e) or type(e).__name__}
+
+        return await asyncio.gather(*(send_one(item) for item in messages))
 
     async def get_message(self, message_id: str) -> Dict:
         """
         Get message details by ID.
         """
-        message = self.client.messages(message_id).fetch()
-        return {
-            "id": message.sid,
-            "status": message.status,
-            "to": message.to,
-            "from": message.from_,
-            "body": message.body,
-            "date_created": message.date_created,
-            "date_sent": message.date_sent,
-            "price": message.price,
-            "price_unit": message.price_unit,
-        }
+        message = await self._call(self.client.messages(message_id).fetch_async())
+        return self._message_to_dict(message)
 
     async def get_messages(
         self,
@@ -76,28 +152,14 @@ class TwilioService:
         if date_sent_before:
             params["date_sent_before"] = date_sent_before
 
-        messages = self.client.messages.list(**params)
-        return [
-            {
-                "id": message.sid,
-                "status": message.status,
-                "to": message.to,
-                "from": message.from_,
-                "body": message.body,
-                "date_created": message.date_created,
-                "date_sent": message.date_sent,
-                "price": message.price,
-                "price_unit": message.price_unit,
-            }
-            for message in messages
-        ]
+        messages = await self._call(self.client.messages.list_async(**params))
+        return [self._message_to_dict(message) for message in messages]
 
     async def get_message_media(self, message_id: str) -> Dict:
         """
         Get media associated with a message.
         """
-        message = self.client.messages(message_id).fetch()
-        media_list = self.client.messages(message_id).media.list()
+        media_list = await self._call(self.client.messages(message_id).media.list_async())
         return [
             {
                 "id": media.sid,
@@ -108,4 +170,4 @@ class TwilioService:
         ]
 
 # Create a singleton instance
-twilio_service = TwilioService() 
\ No newline at end of file
+twilio_service = TwilioService()
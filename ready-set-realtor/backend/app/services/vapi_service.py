@@ -5,11 +5,54 @@ from ..core.config import settings
 class VapiService:
     def __init__(self):
         self.api_key = settings.VAPI_API_KEY
-        self.base_url = "https://api.vapi.ai/v1"
+        self.base_url = settings.VAPI_BASE_URL
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=settings.VAPI_HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.VAPI_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.VAPI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.VAPI_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.VAPI_CONNECT_TIMEOUT,
+                read=settings.VAPI_READ_TIMEOUT,
+                write=settings.VAPI_WRITE_TIMEOUT,
+                pool=settings.VAPI_POOL_TIMEOUT,
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The shared client, created on first use outside the app lifespan.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    async def start(self) -> None:
+        """
+        Open the shared connection pool; called from the app lifespan.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+
+    async def close(self) -> None:
+        """
+        Close pooled connections; called from the app lifespan.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def create_call(
         self,
@@ -21,43 +64,33 @@ class VapiService:
         """
         Create a new outbound call using Vapi.ai.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/call",
-                headers=self.headers,
-                json={
-                    "phone_number": phone_number,
-                    "assistant_id": assistant_id,
-                    "initial_message": initial_message,
-                    "metadata": metadata or {},
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post(
+            "/call",
+            json={
+                "phone_number": phone_number,
+                "assistant_id": assistant_id,
+                "initial_message": initial_message,
+                "metadata": metadata or {},
+            },
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_call(self, call_id: str) -> Dict:
         """
         Get call details by ID.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/call/{call_id}",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"/call/{call_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def end_call(self, call_id: str) -> Dict:
         """
         End an ongoing call.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/call/{call_id}/end",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post(f"/call/{call_id}/end")
+        response.raise_for_status()
+        return response.json()
 
     async def create_assistant(
         self,
@@ -69,31 +102,25 @@ class VapiService:
         """
         Create a new Vapi assistant.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/assistant",
-                headers=self.headers,
-                json={
-                    "name": name,
-                    "instructions": instructions,
-                    "voice_id": voice_id,
-                    "model": model,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post(
+            "/assistant",
+            json={
+                "name": name,
+                "instructions": instructions,
+                "voice_id": voice_id,
+                "model": model,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_assistant(self, assistant_id: str) -> Dict:
         """
         Get assistant details by ID.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/assistant/{assistant_id}",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"/assistant/{assistant_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def update_assistant(
         self,
@@ -116,38 +143,28 @@ class VapiService:
         if model is not None:
             update_data["model"] = model
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/assistant/{assistant_id}",
-                headers=self.headers,
-                json=update_data,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.patch(
+            f"/assistant/{assistant_id}",
+            json=update_data,
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_call_transcript(self, call_id: str) -> Dict:
         """
         Get the transcript of a call.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/call/{call_id}/transcript",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"/call/{call_id}/transcript")
+        response.raise_for_status()
+        return response.json()
 
     async def get_call_recording(self, call_id: str) -> Dict:
         """
         Get the recording URL of a call.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/call/{call_id}/recording",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"/call/{call_id}/recording")
+        response.raise_for_status()
+        return response.json()
 
 # Create a singleton instance
 vapi_service = VapiService() 
\ No newline at end of file
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Dict
+from uuid import UUID
+
+from .core.celery_app import celery_app
+from .core.database import AsyncSessionLocal
+from .services.envelope_sync_service import envelope_sync_service
+from .services.follow_up_service import follow_up_service
+from .services.qualification_service import ACTIVE_STATUSES, qualification_service
+
+# One loop per worker process: the shared OpenAI service's semaphore and
+# rate-limit buckets bind to the loop they are first used on
+_loop = asyncio.new_event_loop()
+
+def run(coroutine):
+    return _loop.run_until_complete(coroutine)
+
+@celery_app.task(name="app.tasks.qualify_leads")
+def qualify_leads(job_id: str) -> Dict:
+    """
+    Run a queued qualification job.
+    """
+    return run(qualification_service.run_job(UUID(job_id)))
+
+@celery_app.task(name="app.tasks.requalify_active_leads")
+def requalify_active_leads() -> str:
+    """
+    Queue a job re-qualifying every active lead; scheduled nightly by beat.
+    """
+    async def create_job():
+        async with AsyncSessionLocal() as db:
+            return await qualification_service.create_job(db, None, statuses=ACTIVE_STATUSES)
+
+    job = run(create_job())
+    qualify_leads.delay(str(job.id))
+    return str(job.id)
+
+@celery_app.task(name="app.tasks.dispatch_follow_ups")
+def dispatch_follow_ups() -> int:
+    """
+    Claim due follow-up schedules and queue a send for each; run by beat every few seconds.
+    """
+    return run(follow_up_service.dispatch_due(
+        lambda schedule_id, step: send_follow_up.delay(str(schedule_id), step)
+    ))
+
+@celery_app.task(name="app.tasks.send_follow_up")
+def send_follow_up(schedule_id: str, step: int) -> Dict:
+    """
+    Generate and send one claimed follow-up.
+    """
+    return run(follow_up_service.send(UUID(schedule_id), step))
+
+@celery_app.task(name="app.tasks.sync_envelopes")
+def sync_envelopes() -> Dict:
+    """
+    Refresh documents awaiting signature from DocuSign; run by beat as a Connect backstop.
+    """
+    return run(envelope_sync_service.sync_pending())
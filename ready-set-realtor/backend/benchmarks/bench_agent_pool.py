@@ -0,0 +1,70 @@
+"""
+Benchmark: building agents per request versus checking them out of the AgentPool.
+
+Usage:
+    python -m benchmarks.bench_agent_pool --requests 10000
+
+"new" builds an AgentContext and agent per request, as the lead and draft
+routes used to; "pool" is agent_pool.checkout followed by release. The
+openai.OpenAI() line is what each agent also built before calls went
+through the shared OpenAIService, not counting the TLS handshake on its
+first request. Only getting an agent ready to call is measured, and
+allocations are the memory a request holds at its peak, as tracemalloc
+sees it.
+"""
+import argparse
+import time
+import tracemalloc
+
+import openai
+
+from app.mcp.core import AgentContext, AgentType
+from app.mcp.pool import AGENT_CAPABILITIES, AGENT_CLASSES, AgentPool
+
+def build(agent_type: AgentType):
+    return AGENT_CLASSES[agent_type](AgentContext(
+        agent_type=agent_type,
+        capabilities=AGENT_CAPABILITIES[agent_type],
+        tools=[]
+    ))
+
+def measure(requests: int, request) -> tuple:
+    started = time.perf_counter()
+    for _ in range(requests):
+        request()
+    elapsed = time.perf_counter() - started
+
+    # Memory a single request holds at its peak, averaged over a sample
+    tracemalloc.start()
+    sample = min(requests, 1000)
+    allocated = 0
+    for _ in range(sample):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        request()
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return elapsed / requests * 1e6, allocated / sample
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--client-requests", type=int, default=20)
+    args = parser.parse_args()
+
+    # Building a client loads certificates and takes tens of milliseconds, so it gets a short run
+    micros, allocated = measure(args.client_requests, lambda: openai.OpenAI(api_key="sk-bench"))
+    print(f"openai.OpenAI(): {micros:10.2f} µs/request, {allocated / 1024:7.2f} KiB allocated/request")
+
+    pool = AgentPool(warm=1, max_idle=1)
+    for agent_type in AgentType:
+        def pooled(agent_type=agent_type):
+            pool.release(pool.checkout(agent_type))
+
+        print(f"{agent_type.value}:")
+        for label, request in (("new", lambda agent_type=agent_type: build(agent_type)), ("pool", pooled)):
+            micros, allocated = measure(args.requests, request)
+            print(f"  {label:>5}: {micros:8.2f} µs/request, {allocated / 1024:7.2f} KiB allocated/request")
+
+if __name__ == "__main__":
+    main()
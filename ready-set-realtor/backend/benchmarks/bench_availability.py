@@ -0,0 +1,125 @@
+"""
+Benchmark: availability queries over one agent's calendar, scanning the
+appointment list versus the sorted IntervalIndex.
+
+Usage:
+    python -m benchmarks.bench_availability --appointments 5000
+
+The calendar is filled with non-overlapping 30 to 120 minute bookings on
+30-minute boundaries during working hours. "scan" checks each candidate slot
+against every appointment, which is what answering these questions from an
+unindexed list (or the agent's old per-step slot dict, once overlaps are
+taken into account) costs; "index" is SchedulerAgent and AvailabilityService
+today.
+"""
+import argparse
+import random
+import time as clock
+from datetime import datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from app.core.intervals import IntervalIndex, daily_windows, working_slots
+
+OPENS, CLOSES = time(9), time(17)
+STEP = timedelta(minutes=30)
+START = datetime(2024, 1, 1)
+
+def build_calendar(appointments: int, rng: random.Random) -> List[Tuple[datetime, datetime]]:
+    """
+    Pack bookings into working days until there are enough.
+    """
+    bookings = []
+    day = START
+    while len(bookings) < appointments:
+        cursor = datetime.combine(day.date(), OPENS)
+        closes = datetime.combine(day.date(), CLOSES)
+        while len(bookings) < appointments:
+            cursor += STEP * rng.randint(0, 2)
+            end = cursor + STEP * rng.randint(1, 4)
+            if end > closes:
+                break
+            bookings.append((cursor, end))
+            cursor = end
+        day += timedelta(days=1)
+    return bookings
+
+def scan_is_free(bookings, start: datetime, end: datetime) -> bool:
+    return all(not (booked_start < end and start < booked_end) for booked_start, booked_end in bookings)
+
+def scan_free_slots(bookings, start: datetime, end: datetime, duration: timedelta) -> List[Tuple[datetime, datetime]]:
+    slots = []
+    for window_start, window_end, opening in daily_windows(start, end, OPENS, CLOSES):
+        slot_start = opening
+        while slot_start + duration <= window_end:
+            if slot_start >= window_start and scan_is_free(bookings, slot_start, slot_start + duration):
+                slots.append((slot_start, slot_start + duration))
+            slot_start += STEP
+    return slots
+
+def scan_next_available(bookings, after: datetime, duration: timedelta, days: int = 30) -> Optional[Tuple[datetime, datetime]]:
+    for window_start, window_end, opening in daily_windows(after, after + timedelta(days=days), OPENS, CLOSES):
+        slot_start = opening
+        while slot_start + duration <= window_end:
+            if slot_start >= window_start and scan_is_free(bookings, slot_start, slot_start + duration):
+                return slot_start, slot_start + duration
+            slot_start += STEP
+    return None
+
+def timed(label: str, function, queries) -> list:
+    started = clock.perf_counter()
+    results = [function(*query) for query in queries]
+    elapsed = clock.perf_counter() - started
+    print(f"  {label:>6}: {elapsed / len(queries) * 1e6:10.1f} µs/query")
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--appointments", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bookings = build_calendar(args.appointments, rng)
+    rng.shuffle(bookings)
+    span_days = (max(end for _, end in bookings) - START).days
+
+    index = IntervalIndex()
+    for key, (start, end) in enumerate(bookings):
+        index.add(start, end, key)
+    print(f"{len(bookings)} appointments over {span_days} days")
+
+    def random_time() -> datetime:
+        return START + timedelta(days=rng.randrange(span_days), minutes=30 * rng.randrange(48))
+
+    overlap_queries = [(start, start + timedelta(hours=1)) for start in (random_time() for _ in range(args.queries))]
+    week_queries = [(start, start + timedelta(days=7), timedelta(hours=1)) for start in (random_time() for _ in range(args.queries))]
+    next_queries = [(random_time(), timedelta(hours=2)) for _ in range(args.queries)]
+
+    print("overlap check (1 hour):")
+    scanned = timed("scan", lambda start, end: scan_is_free(bookings, start, end), overlap_queries)
+    indexed = timed("index", index.is_free, overlap_queries)
+    assert scanned == indexed
+
+    print("free 1-hour slots in a week:")
+    scanned = timed("scan", lambda start, end, duration: scan_free_slots(bookings, start, end, duration), week_queries)
+    indexed = timed(
+        "index",
+        lambda start, end, duration: list(working_slots(index, start, end, duration, STEP, OPENS, CLOSES)),
+        week_queries,
+    )
+    assert scanned == indexed
+
+    print("next free 2-hour slot:")
+    scanned = timed("scan", lambda after, duration: scan_next_available(bookings, after, duration), next_queries)
+    indexed = timed(
+        "index",
+        lambda after, duration: next(
+            working_slots(index, after, after + timedelta(days=30), duration, STEP, OPENS, CLOSES), None
+        ),
+        next_queries,
+    )
+    assert scanned == indexed
+
+if __name__ == "__main__":
+    main()
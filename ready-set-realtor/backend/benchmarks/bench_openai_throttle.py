@@ -0,0 +1,106 @@
+"""
+Simulation: agent traffic against a rate-limited model endpoint, with and
+without the shared OpenAIService throttle.
+
+Usage:
+    python -m benchmarks.bench_openai_throttle --calls 1000 --rpm 300
+
+The fake endpoint allows `rpm` requests per rolling minute (scaled down by
+--time-scale so the run takes seconds) and answers 429 with Retry-After past
+that. "naive" is what the agents did before: every caller fires at once and
+retries with exponential backoff like the SDK default. "throttled" routes the
+same calls through OpenAIService.
+"""
+import argparse
+import asyncio
+import collections
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from app.core.rate_limit import TokenBucket
+from app.services.openai_service import OpenAIService
+
+class FakeEndpoint:
+    def __init__(self, rpm: int, window: float, latency: float):
+        self.rpm = rpm
+        self.window = window
+        self.latency = latency
+        self.accepted = collections.deque()
+        self.rejected = 0
+
+    async def create(self, **request):
+        now = time.perf_counter()
+        while self.accepted and now - self.accepted[0] > self.window:
+            self.accepted.popleft()
+        if len(self.accepted) >= self.rpm:
+            self.rejected += 1
+            retry_after = self.window - (now - self.accepted[0])
+            response = httpx.Response(
+                429,
+                headers={"retry-after-ms": str(int(retry_after * 1000))},
+                request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+            )
+            raise openai.RateLimitError("Rate limit reached", response=response, body=None)
+        self.accepted.append(now)
+        await asyncio.sleep(self.latency)
+        message = SimpleNamespace(content="ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=SimpleNamespace(total_tokens=50))
+
+async def naive_call(endpoint: FakeEndpoint, time_scale: float, retries: int = 6):
+    for attempt in range(retries + 1):
+        try:
+            return await endpoint.create(model="gpt-4", messages=[])
+        except openai.RateLimitError:
+            if attempt == retries:
+                raise
+            # The SDK's default: exponential backoff, ignoring how long the limit lasts
+            await asyncio.sleep(min(0.5 * 2 ** attempt, 8) * random.uniform(0.75, 1.0) / time_scale)
+
+async def run(name: str, calls: int, endpoint: FakeEndpoint, call) -> None:
+    async def timed():
+        started = time.perf_counter()
+        try:
+            await call()
+            return time.perf_counter() - started, True
+        except openai.RateLimitError:
+            return time.perf_counter() - started, False
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(timed() for _ in range(calls)))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for latency, _ in results)
+    failed = sum(1 for _, ok in results if not ok)
+    print(
+        f"{name:>9}: {elapsed:5.2f} s total   p50 {statistics.median(latencies):5.2f} s   "
+        f"max {latencies[-1]:5.2f} s   429s {endpoint.rejected:4d}   failed {failed}"
+    )
+
+async def compare(calls: int, rpm: int, time_scale: float) -> None:
+    window = 60 / time_scale
+
+    endpoint = FakeEndpoint(rpm, window, latency=0.05)
+    await run("naive", calls, endpoint, lambda: naive_call(endpoint, time_scale))
+
+    endpoint = FakeEndpoint(rpm, window, latency=0.05)
+    service = OpenAIService()
+    service._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=endpoint.create)))
+    # Same limits as the endpoint, on the compressed clock
+    service.request_bucket = TokenBucket(rpm * time_scale, capacity=rpm * 10 / 60)
+    service.token_bucket = TokenBucket(1e12)
+    await run("throttled", calls, endpoint, lambda: service.chat_completion(model="gpt-4", messages=[]))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--rpm", type=int, default=300)
+    parser.add_argument("--time-scale", type=float, default=20, help="how many times faster than real time")
+    args = parser.parse_args()
+    asyncio.run(compare(args.calls, args.rpm, args.time_scale))
+
+if __name__ == "__main__":
+    main()
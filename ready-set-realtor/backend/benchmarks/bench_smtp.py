@@ -0,0 +1,113 @@
+"""
+Throughput for 1,000 emails: blocking smtplib with a connect + login per
+message vs the pooled async transport EmailService now uses.
+
+Runs against a local aiosmtpd stand-in that requires AUTH, so both sides
+pay for authentication. There is no TLS and no network round-trip here, so
+against a real provider the gap is wider.
+
+Usage:
+    python -m benchmarks.bench_smtp --messages 1000 --pool-size 4
+"""
+import argparse
+import asyncio
+import logging
+import smtplib
+import socket
+import time
+from email.mime.text import MIMEText
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from app.core.smtp import SMTPConnectionPool
+
+USERNAME = "agent@example.com"
+PASSWORD = "secret"
+
+class CountingHandler:
+    def __init__(self):
+        self.delivered = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.delivered += 1
+        return "250 OK"
+
+def authenticate(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=auth_data.password == PASSWORD.encode())
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def make_message(i: int) -> MIMEText:
+    msg = MIMEText(f"<p>Hello lead {i}, here is your market update.</p>", "html")
+    msg["Subject"] = f"Market update {i}"
+    msg["From"] = USERNAME
+    msg["To"] = f"lead{i}@example.com"
+    return msg
+
+async def per_message_smtplib(port: int, messages: int) -> None:
+    # The old EmailService path: blocking, one session per message
+    for i in range(messages):
+        with smtplib.SMTP("127.0.0.1", port) as server:
+            server.login(USERNAME, PASSWORD)
+            server.sendmail(USERNAME, [f"lead{i}@example.com"], make_message(i).as_string())
+
+async def pooled(port: int, messages: int, pool_size: int) -> None:
+    pool = SMTPConnectionPool(
+        host="127.0.0.1",
+        port=port,
+        username=USERNAME,
+        password=PASSWORD,
+        size=pool_size,
+        start_tls=False,
+    )
+    await asyncio.gather(*[
+        pool.send(make_message(i), USERNAME, [f"lead{i}@example.com"])
+        for i in range(messages)
+    ])
+    await pool.close()
+
+def run(name: str, handler: CountingHandler, messages: int, coro) -> float:
+    handler.delivered = 0
+    start = time.perf_counter()
+    asyncio.run(coro)
+    elapsed = time.perf_counter() - start
+    assert handler.delivered == messages, f"{name}: delivered {handler.delivered}/{messages}"
+    print(f"{name:>16}: {elapsed:6.2f} s   {messages / elapsed:7.0f} msg/s")
+    return elapsed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    # aiosmtpd logs a deprecation warning on every AUTH
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+
+    handler = CountingHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=free_port(),
+        authenticator=authenticate,
+        auth_require_tls=False,
+    )
+    controller.start()
+    try:
+        baseline = run("smtplib/message", handler, args.messages, per_message_smtplib(controller.port, args.messages))
+        pooled_time = run(
+            f"pooled (size {args.pool_size})",
+            handler,
+            args.messages,
+            pooled(controller.port, args.messages, args.pool_size),
+        )
+        print(f"speedup: {baseline / pooled_time:.1f}x")
+    finally:
+        controller.stop()
+
+if __name__ == "__main__":
+    main()
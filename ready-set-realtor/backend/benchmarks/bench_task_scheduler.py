@@ -0,0 +1,107 @@
+"""
+Benchmark: dispatching MCP tasks from a plain list versus the TaskScheduler heap.
+
+Usage:
+    python -m benchmarks.bench_task_scheduler --tasks 100000
+
+Tasks get random deadlines (a tenth have none) and priorities, and a fifth
+depend on one or two earlier tasks. Each dispatched task completes at once.
+"list" appends on submit and scans the whole queue for the most urgent task
+whose dependencies are done, which is what picking work from the old
+`task_queue` list would take; only the first `--sample` dispatches are timed
+since draining it is quadratic. "heap" is MCPController.task_queue.
+"""
+import argparse
+import random
+import time as clock
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+
+from app.mcp.core import AgentTask
+from app.mcp.scheduler import TaskScheduler, deadline_key
+
+START = datetime(2024, 1, 1)
+
+def build_tasks(count: int, rng: random.Random) -> List[AgentTask]:
+    tasks = []
+    for position in range(count):
+        dependencies = []
+        if position and rng.random() < 0.2:
+            dependencies = [str(tasks[rng.randrange(position)].task_id) for _ in range(rng.randint(1, 2))]
+        deadline = None if rng.random() < 0.1 else START + timedelta(minutes=rng.randrange(7 * 24 * 60))
+        tasks.append(AgentTask(
+            task_type="follow_up",
+            priority=rng.randint(1, 5),
+            context={},
+            dependencies=dependencies,
+            deadline=deadline,
+        ))
+    return tasks
+
+class ListQueue:
+    def __init__(self):
+        self.queue: List[AgentTask] = []
+        self.completed: Set[str] = set()
+
+    def submit(self, task: AgentTask) -> None:
+        self.queue.append(task)
+
+    def pop(self) -> Optional[AgentTask]:
+        best, best_key = None, None
+        for position, task in enumerate(self.queue):
+            if not all(dependency in self.completed for dependency in task.dependencies):
+                continue
+            key = (deadline_key(task.deadline), -task.priority, position)
+            if best_key is None or key < best_key:
+                best, best_key = task, key
+        if best is not None:
+            del self.queue[best_key[-1]]
+        return best
+
+    def complete(self, task: AgentTask) -> None:
+        self.completed.add(str(task.task_id))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.tasks, random.Random(args.seed))
+    print(f"{len(tasks)} tasks, {sum(bool(task.dependencies) for task in tasks)} with dependencies")
+
+    queue = ListQueue()
+    started = clock.perf_counter()
+    for task in tasks:
+        queue.submit(task)
+    submitted = clock.perf_counter() - started
+    started = clock.perf_counter()
+    list_order = []
+    for _ in range(args.sample):
+        task = queue.pop()
+        queue.complete(task)
+        list_order.append(task.task_id)
+    dispatched = clock.perf_counter() - started
+    print(f"  {'list':>5}: submit {submitted / len(tasks) * 1e6:8.2f} µs/task, "
+          f"dispatch {dispatched / args.sample * 1e6:10.1f} µs/task (first {args.sample})")
+
+    scheduler = TaskScheduler()
+    started = clock.perf_counter()
+    for task in tasks:
+        scheduler.submit(task)
+    submitted = clock.perf_counter() - started
+    started = clock.perf_counter()
+    heap_order = []
+    while (task := scheduler.pop()) is not None:
+        scheduler.complete(task.task_id)
+        heap_order.append(task.task_id)
+    dispatched = clock.perf_counter() - started
+    print(f"  {'heap':>5}: submit {submitted / len(tasks) * 1e6:8.2f} µs/task, "
+          f"dispatch {dispatched / len(heap_order) * 1e6:10.1f} µs/task (all {len(heap_order)})")
+
+    assert len(heap_order) == len(tasks)
+    assert heap_order[:args.sample] == list_order
+
+if __name__ == "__main__":
+    main()
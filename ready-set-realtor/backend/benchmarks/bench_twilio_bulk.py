@@ -0,0 +1,103 @@
+"""
+Text blast: the old blocking Twilio client, one message at a time, vs
+TwilioService.send_sms_many on the shared async session.
+
+Runs against a local aiohttp stand-in for the Twilio Messages API that
+answers each request after --latency seconds, roughly a real round-trip.
+
+Usage:
+    python -m benchmarks.bench_twilio_bulk --messages 500 --latency 0.05
+"""
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+from aiohttp import web
+from twilio.rest import Client
+
+from app.services.twilio_service import TwilioService
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_stand_in(port: int, latency: float) -> None:
+    counter = {"sent": 0}
+
+    async def create_message(request: web.Request) -> web.Response:
+        form = await request.post()
+        await asyncio.sleep(latency)
+        counter["sent"] += 1
+        return web.json_response({
+            "sid": f"SM{counter['sent']:032d}",
+            "status": "queued",
+            "to": form["To"],
+            "from": form["From"],
+            "body": form["Body"],
+            "date_created": "Mon, 01 Jan 2024 00:00:00 +0000",
+            "date_sent": None,
+            "price": None,
+            "price_unit": "USD",
+        }, status=201)
+
+    app = web.Application()
+    app.router.add_post("/2010-04-01/Accounts/{account_sid}/Messages.json", create_message)
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    time.sleep(0.2)
+
+def blocking_sequential(base_url: str, numbers: list, account_sid: str, from_number: str) -> None:
+    # What send_sms used to do: a blocking HTTP call per message
+    client = Client(account_sid, "token")
+    client.api.base_url = base_url
+    for number in numbers:
+        client.messages.create(to=number, from_=from_number, body="Open house this Saturday!")
+
+async def concurrent(service: TwilioService, base_url: str, numbers: list, concurrency: int) -> list:
+    await service.start()
+    service.client.api.base_url = base_url
+    try:
+        return await service.send_sms_many(
+            [{"to_number": number, "message": "Open house this Saturday!"} for number in numbers],
+            concurrency=concurrency,
+        )
+    finally:
+        await service.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    port = free_port()
+    start_stand_in(port, args.latency)
+    base_url = f"http://127.0.0.1:{port}"
+    numbers = [f"+1555{i:07d}" for i in range(args.messages)]
+    service = TwilioService()
+
+    start = time.perf_counter()
+    blocking_sequential(base_url, numbers, service.account_sid, service.from_number)
+    baseline = time.perf_counter() - start
+    print(f"  blocking, sequential: {baseline:6.2f} s")
+
+    start = time.perf_counter()
+    results = asyncio.run(concurrent(service, base_url, numbers, args.concurrency))
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for result in results if not result["success"])
+    print(f"send_sms_many (x{args.concurrency}): {elapsed:6.2f} s   ({failed} failed)")
+    print(f"speedup: {baseline / elapsed:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Per-call latency: a fresh httpx.AsyncClient per request vs the shared
+VapiService client.
+
+Starts a local stand-in for api.vapi.ai (uvicorn, optionally over TLS with a
+throwaway self-signed certificate) and fetches call transcripts from it both
+ways.
+
+Usage:
+    python -m benchmarks.bench_vapi_client --requests 500 --tls
+
+The stand-in only speaks HTTP/1.1, so the shared client falls back from
+HTTP/2 here; the gain measured is connection and TLS session reuse.
+"""
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def write_self_signed_cert(directory: str) -> tuple:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+    return cert_path, key_path
+
+def start_stand_in(port: int, cert_path: str = None, key_path: str = None) -> uvicorn.Server:
+    stand_in = FastAPI()
+
+    @stand_in.get("/v1/call/{call_id}/transcript")
+    async def transcript(call_id: str):
+        return {"call_id": call_id, "transcript": "Hello, this is a test call."}
+
+    config = uvicorn.Config(
+        stand_in,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        ssl_certfile=cert_path,
+        ssl_keyfile=key_path,
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+async def per_call_client(service, requests: int) -> list:
+    # The old behaviour: a new client, connection and handshake per call
+    timings = []
+    for i in range(requests):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{service.base_url}/call/call-{i}/transcript",
+                headers=service.headers,
+            )
+            response.raise_for_status()
+            response.json()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+async def shared_client(service, requests: int) -> list:
+    await service.start()
+    timings = []
+    try:
+        for i in range(requests):
+            start = time.perf_counter()
+            await service.get_call_transcript(f"call-{i}")
+            timings.append(time.perf_counter() - start)
+    finally:
+        await service.close()
+    return timings
+
+def report(name: str, timings: list) -> float:
+    mean_ms = statistics.mean(timings) * 1000
+    p95_ms = sorted(timings)[int(len(timings) * 0.95) - 1] * 1000
+    print(f"{name:>10}: mean {mean_ms:6.2f} ms   p95 {p95_ms:6.2f} ms   ({len(timings)} calls)")
+    return mean_ms
+
+async def compare(args) -> None:
+    from app.services.vapi_service import VapiService
+
+    service = VapiService()
+    service.base_url = args.base_url
+
+    fresh = report("per-call", await per_call_client(service, args.requests))
+    shared = report("shared", await shared_client(service, args.requests))
+    print(f"speedup: {fresh / shared:.1f}x")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--tls", action="store_true", help="serve the stand-in over HTTPS")
+    args = parser.parse_args()
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path = key_path = None
+        if args.tls:
+            cert_path, key_path = write_self_signed_cert(directory)
+            # httpx trusts SSL_CERT_FILE, so both clients verify the stand-in
+            os.environ["SSL_CERT_FILE"] = cert_path
+
+        server = start_stand_in(port, cert_path, key_path)
+        scheme = "https" if args.tls else "http"
+        args.base_url = f"{scheme}://127.0.0.1:{port}/v1"
+        try:
+            asyncio.run(compare(args))
+        finally:
+            server.should_exit = True
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ from uuid import UUID, uuid4
 from datetime import datetime
 from enum import Enum
 
+from .scheduler import TaskScheduler, TaskStatus
+
 class AgentType(str, Enum):
     LEAD_GENERATION = "lead_generation"
     TRANSACTION_COORDINATOR = "transaction_coordinator"
@@ -28,11 +30,13 @@ class AgentContext(BaseModel):
 class AgentTask(BaseModel):
     task_id: UUID = Field(default_factory=uuid4)
     task_type: str
+    # Higher runs first among tasks with the same deadline
     priority: int = 1
     context: Dict
+    # task_ids of tasks that must complete first
     dependencies: List[str] = Field(default_factory=list)
     deadline: Optional[datetime] = None
-    status: str = "pending"
+    status: str = TaskStatus.PENDING
 
 class AgentTeam(BaseModel):
     team_id: UUID = Field(default_factory=uuid4)
@@ -44,7 +48,9 @@ class MCPController:
     def __init__(self):
         self.agents: Dict[UUID, AgentContext] = {}
         self.teams: Dict[UUID, AgentTeam] = {}
-        self.task_queue: List[AgentTask] = []
+        self.task_queue = TaskScheduler()
+        # Agent each assigned task is reserved for, freed once the task finishes
+        self.assignments: Dict[UUID, UUID] = {}
 
     async def create_agent(self, agent_type: AgentType, capabilities: List[str]) -> AgentContext:
         agent = AgentContext(
@@ -74,11 +80,58 @@ class MCPController:
         if agent.state != AgentState.READY:
             return False
 
+        try:
+            self.task_queue.submit(task)
+        except ValueError:
+            return False
+
         agent.state = AgentState.BUSY
         agent.last_active = datetime.now()
-        self.task_queue.append(task)
+        self.assignments[task.task_id] = agent_id
         return True
 
+    async def _release_agents(self, task_ids: List[UUID]) -> None:
+        for task_id in task_ids:
+            agent_id = self.assignments.pop(task_id, None)
+            if agent_id is not None:
+                await self.update_agent_state(agent_id, AgentState.READY)
+
+    async def submit_task(self, task: AgentTask) -> TaskStatus:
+        """
+        Queue a task; it becomes READY once its dependencies have completed.
+        """
+        return self.task_queue.submit(task)
+
+    async def next_task(self) -> Optional[AgentTask]:
+        """
+        Claim the ready task with the earliest deadline, then highest priority.
+        """
+        return self.task_queue.pop()
+
+    async def complete_task(self, task_id: UUID) -> List[AgentTask]:
+        """
+        Mark a task completed, returning the dependents that became ready.
+        """
+        released = self.task_queue.complete(task_id)
+        await self._release_agents([task_id])
+        return released
+
+    async def fail_task(self, task_id: UUID) -> List[AgentTask]:
+        """
+        Mark a task failed, returning the dependents cancelled with it.
+        """
+        cancelled = self.task_queue.fail(task_id)
+        await self._release_agents([task_id, *(task.task_id for task in cancelled)])
+        return cancelled
+
+    async def cancel_task(self, task_id: UUID) -> List[AgentTask]:
+        """
+        Cancel a task and everything waiting on it.
+        """
+        cancelled = self.task_queue.cancel(task_id)
+        await self._release_agents([task.task_id for task in cancelled])
+        return cancelled
+
     async def update_agent_state(self, agent_id: UUID, state: AgentState) -> bool:
         if agent_id not in self.agents:
             return False
@@ -0,0 +1,269 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from .core import AgentState, AgentTask, AgentType, MCPController
+from .pool import AGENT_CLASSES
+from .scheduler import TaskStatus
+from ..core.config import settings
+from ..core.metrics import metrics
+
+# A task's type names the agent method that runs it; its context holds the keyword arguments.
+# Each worker has its own agent, so a task may land on a different agent from the one that ran
+# its dependency: only methods that need nothing an earlier task left on the agent are routed.
+# Follow-up messages, documents and milestone updates need the schedule or transaction an earlier
+# call created, and the scheduler's methods all read a calendar loaded into the agent.
+TASK_ROUTES = {
+    "qualify_lead": AgentType.LEAD_GENERATION,
+    "create_follow_up_schedule": AgentType.FOLLOW_UP,
+    "create_transaction": AgentType.TRANSACTION_COORDINATOR,
+}
+
+class QueueFullError(RuntimeError):
+    """
+    The agent type already has its maximum number of tasks queued.
+    """
+
+class AgentTypeStats:
+    def __init__(self, agent_type: AgentType):
+        name = agent_type.value
+        self.started_at = time.monotonic()
+        self.completed = metrics.counter(f"mcp_{name}_tasks_completed_total", f"Tasks the {name} workers completed")
+        self.failed = metrics.counter(f"mcp_{name}_tasks_failed_total", f"Tasks that raised in the {name} workers")
+        self.rejected = metrics.counter(
+            f"mcp_{name}_tasks_rejected_total", f"Tasks refused because the {name} queue was full"
+        )
+        self.queue_latency_seconds = metrics.histogram(
+            f"mcp_{name}_queue_latency_seconds", f"Time ready {name} tasks waited for a free worker"
+        )
+        self.duration_seconds = metrics.histogram(
+            f"mcp_{name}_task_duration_seconds", f"Time {name} workers spent per task"
+        )
+
+    def snapshot(self, queued: int, waiting: int) -> Dict:
+        latency = self.queue_latency_seconds
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "queued": queued,
+            "waiting_for_worker": waiting,
+            "completed": self.completed.value,
+            "failed": self.failed.value,
+            "rejected": self.rejected.value,
+            "throughput_per_second": self.completed.value / elapsed if elapsed else 0.0,
+            "mean_queue_latency_seconds": latency.sum / latency.count if latency.count else 0.0,
+        }
+
+class TaskExecutor:
+    """
+    Runs MCPController tasks on a fixed set of asyncio workers per agent type.
+
+    Tasks go through the controller's TaskScheduler, so dependencies, deadlines
+    and priorities decide what runs next; as tasks become ready they are
+    handed to a FIFO per agent type and picked up by that type's workers,
+    each with its own registered agent. The work is IO-bound (model and API
+    calls), so concurrency comes from the number of workers rather than threads.
+
+    Admission is bounded per agent type: once `max_queued` tasks of a type
+    are unfinished, `submit` either waits for room or raises QueueFullError.
+    """
+
+    def __init__(self, controller: MCPController, workers: int, max_queued: int):
+        self.controller = controller
+        self.workers = workers
+        self.max_queued = max_queued
+        self.stats = {agent_type: AgentTypeStats(agent_type) for agent_type in AgentType}
+        self._queued: Dict[AgentType, int] = {agent_type: 0 for agent_type in AgentType}
+        self._admitted: Dict[UUID, AgentType] = {}
+        self._futures: Dict[UUID, asyncio.Future] = {}
+        self._queues: Dict[AgentType, asyncio.Queue] = {}
+        self._room: Dict[AgentType, asyncio.Condition] = {}
+        self._workers: List[asyncio.Task] = []
+        # The event loop only keeps weak references to tasks, so hold these until they finish
+        self._failing: Set[asyncio.Task] = set()
+
+        for agent_type in AgentType:
+            metrics.gauge(
+                f"mcp_{agent_type.value}_queued_tasks",
+                f"Unfinished {agent_type.value} tasks, waiting on dependencies or a worker",
+                lambda agent_type=agent_type: self._queued[agent_type],
+            )
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        for agent_type, agent_class in AGENT_CLASSES.items():
+            if agent_type not in TASK_ROUTES.values():
+                continue
+            self._queues[agent_type] = asyncio.Queue()
+            self._room[agent_type] = asyncio.Condition()
+            capabilities = [task_type for task_type, routed in TASK_ROUTES.items() if routed == agent_type]
+            for _ in range(self.workers):
+                context = await self.controller.create_agent(agent_type, capabilities)
+                await self.controller.update_agent_state(context.agent_id, AgentState.READY)
+                self._workers.append(asyncio.create_task(self._work(agent_type, agent_class(context))))
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+    async def submit(self, task: AgentTask, wait: bool = True, timeout: Optional[float] = None) -> asyncio.Future:
+        """
+        Queue a task and return a future for its result.
+
+        When the agent type's queue is full, waits up to `timeout` for room if
+        `wait` is set, otherwise raises QueueFullError straight away. The
+        future is cancelled if the task, or one it depends on, is cancelled.
+        """
+        if not self._workers:
+            raise RuntimeError("TaskExecutor is not running")
+        agent_type = TASK_ROUTES.get(task.task_type)
+        if agent_type is None:
+            raise ValueError(f"No agent handles {task.task_type!r} tasks")
+
+        room = self._room[agent_type]
+        async with room:
+            if self._queued[agent_type] >= self.max_queued:
+                if not wait:
+                    self.stats[agent_type].rejected.inc()
+                    raise QueueFullError(f"{agent_type.value} queue is full")
+                try:
+                    await asyncio.wait_for(
+                        room.wait_for(lambda: self._queued[agent_type] < self.max_queued), timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.stats[agent_type].rejected.inc()
+                    raise QueueFullError(f"{agent_type.value} queue is full") from None
+
+            await self.controller.submit_task(task)
+            self._queued[agent_type] += 1
+            self._admitted[task.task_id] = agent_type
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[task.task_id] = future
+        self._dispatch()
+        return future
+
+    async def run(self, task: AgentTask, wait: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Queue a task and wait for its result.
+        """
+        return await (await self.submit(task, wait, timeout))
+
+    async def cancel(self, task_id: UUID) -> List[AgentTask]:
+        """
+        Cancel a task and its dependents; a task already running finishes but its result is dropped.
+        """
+        cancelled = await self.controller.cancel_task(task_id)
+        await self._finish(cancelled)
+        return cancelled
+
+    def _dispatch(self) -> None:
+        # Hand every ready task to its agent type's workers, most urgent first
+        now = time.perf_counter()
+        while (task := self.controller.task_queue.pop()) is not None:
+            agent_type = TASK_ROUTES.get(task.task_type)
+            if agent_type is None:
+                # Submitted to the controller directly with nothing to run it
+                failing = asyncio.create_task(self._fail(task, ValueError(f"No agent handles {task.task_type!r} tasks")))
+                self._failing.add(failing)
+                failing.add_done_callback(self._failing.discard)
+                continue
+            self._queues[agent_type].put_nowait((task, now))
+
+    async def _work(self, agent_type: AgentType, agent: Any) -> None:
+        queue = self._queues[agent_type]
+        stats = self.stats[agent_type]
+        agent_id = agent.context.agent_id
+        while True:
+            task, ready_at = await queue.get()
+            try:
+                if task.status != TaskStatus.RUNNING:
+                    # Cancelled while it waited for a worker
+                    continue
+
+                started = time.perf_counter()
+                stats.queue_latency_seconds.observe(started - ready_at)
+                await self.controller.update_agent_state(agent_id, AgentState.BUSY)
+                try:
+                    result = await getattr(agent, task.task_type)(**task.context)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    stats.failed.inc()
+                    await self._fail(task, e)
+                else:
+                    stats.completed.inc()
+                    await self._complete(task, result)
+                finally:
+                    stats.duration_seconds.observe(time.perf_counter() - started)
+                    # Workers keep their agent, so nothing from this task may leak into the next;
+                    # routed methods never depend on what an earlier task left behind
+                    agent.reset()
+                    agent.context.memory.clear()
+                    await self.controller.update_agent_state(agent_id, AgentState.READY)
+            finally:
+                queue.task_done()
+
+    async def _complete(self, task: AgentTask, result: Any) -> None:
+        if task.status == TaskStatus.CANCELLED:
+            return
+        await self.controller.complete_task(task.task_id)
+        future = self._futures.get(task.task_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+        await self._finish([task])
+        self._dispatch()
+
+    async def _fail(self, task: AgentTask, error: Exception) -> None:
+        if task.status == TaskStatus.CANCELLED:
+            return
+        cancelled = await self.controller.fail_task(task.task_id)
+        future = self._futures.get(task.task_id)
+        if future is not None and not future.done():
+            future.set_exception(error)
+        await self._finish([task, *cancelled])
+
+    async def _finish(self, tasks: List[AgentTask]) -> None:
+        # Free each task's admission slot and settle any future still open
+        freed: Dict[AgentType, int] = {}
+        for task in tasks:
+            future = self._futures.pop(task.task_id, None)
+            if future is not None and not future.done():
+                future.cancel()
+            agent_type = self._admitted.pop(task.task_id, None)
+            if agent_type is not None:
+                freed[agent_type] = freed.get(agent_type, 0) + 1
+
+        for agent_type, count in freed.items():
+            self._queued[agent_type] -= count
+            async with self._room[agent_type]:
+                self._room[agent_type].notify(count)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Per agent type: queue depth, completed/failed/rejected counts, throughput and mean queue latency.
+        """
+        return {
+            agent_type.value: stats.snapshot(
+                self._queued[agent_type],
+                self._queues[agent_type].qsize() if agent_type in self._queues else 0,
+            )
+            for agent_type, stats in self.stats.items()
+        }
+
+# Create a singleton instance
+task_executor = TaskExecutor(
+    MCPController(),
+    workers=settings.MCP_WORKERS_PER_AGENT_TYPE,
+    max_queued=settings.MCP_MAX_QUEUED_TASKS,
+)
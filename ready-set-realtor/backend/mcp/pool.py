@@ -0,0 +1,115 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+from .core import AgentContext, AgentState, AgentType
+from ..agents.follow_up_agent import FollowUpAgent
+from ..agents.lead_generation_agent import LeadGenerationAgent
+from ..agents.scheduler_agent import SchedulerAgent
+from ..agents.transaction_coordinator_agent import TransactionCoordinatorAgent
+from ..core.config import settings
+from ..core.metrics import metrics
+
+AGENT_CLASSES = {
+    AgentType.LEAD_GENERATION: LeadGenerationAgent,
+    AgentType.FOLLOW_UP: FollowUpAgent,
+    AgentType.SCHEDULER: SchedulerAgent,
+    AgentType.TRANSACTION_COORDINATOR: TransactionCoordinatorAgent,
+}
+
+AGENT_CAPABILITIES = {
+    AgentType.LEAD_GENERATION: ["lead_qualification"],
+    AgentType.FOLLOW_UP: ["follow_up"],
+    AgentType.SCHEDULER: ["scheduling"],
+    AgentType.TRANSACTION_COORDINATOR: ["document_generation"],
+}
+
+class AgentPool:
+    """
+    Reusable agent instances per AgentType, so requests skip construction.
+
+    Agents share the process-wide OpenAI service and LLM cache; what each
+    instance builds for itself (compiled follow-up templates, availability
+    settings) is built once. A checked-out agent belongs to one caller until
+    it is released, when its per-task state and context memory are cleared
+    so nothing carries over to the next task. Up to `max_idle` agents per
+    type are kept; extra ones built under a burst are dropped on release.
+    """
+
+    def __init__(self, warm: int, max_idle: int):
+        self.warm = warm
+        self.max_idle = max_idle
+        self._idle: Dict[AgentType, List[Any]] = {agent_type: [] for agent_type in AgentType}
+        self.checked_out = 0
+
+        self.created = metrics.counter("agent_pool_created_total", "Agent instances constructed")
+        self.reused = metrics.counter("agent_pool_reused_total", "Checkouts served by an idle pooled agent")
+        metrics.gauge("agent_pool_checked_out", "Agents currently handed out", lambda: self.checked_out)
+        metrics.gauge(
+            "agent_pool_idle",
+            "Pooled agents waiting to be handed out",
+            lambda: sum(len(idle) for idle in self._idle.values()),
+        )
+
+    def _create(self, agent_type: AgentType) -> Any:
+        self.created.inc()
+        context = AgentContext(
+            agent_type=agent_type,
+            capabilities=AGENT_CAPABILITIES[agent_type],
+            tools=[],
+            state=AgentState.READY
+        )
+        return AGENT_CLASSES[agent_type](context)
+
+    async def start(self) -> None:
+        """
+        Build `warm` agents of every type ahead of the first request.
+        """
+        for agent_type, idle in self._idle.items():
+            while len(idle) < min(self.warm, self.max_idle):
+                idle.append(self._create(agent_type))
+
+    def close(self) -> None:
+        for idle in self._idle.values():
+            idle.clear()
+
+    def checkout(self, agent_type: AgentType) -> Any:
+        """
+        Take an agent for the caller's exclusive use; hand it back with `release`.
+        """
+        idle = self._idle[agent_type]
+        if idle:
+            agent = idle.pop()
+            self.reused.inc()
+        else:
+            agent = self._create(agent_type)
+        self.checked_out += 1
+        return agent
+
+    def release(self, agent: Any) -> None:
+        self.checked_out -= 1
+        agent.reset()
+        agent.context.memory.clear()
+        idle = self._idle[agent.context.agent_type]
+        if len(idle) < self.max_idle:
+            idle.append(agent)
+
+    @asynccontextmanager
+    async def acquire(self, agent_type: AgentType) -> AsyncIterator[Any]:
+        agent = self.checkout(agent_type)
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    async def hold(self, agent: Any, items: AsyncIterator) -> AsyncIterator:
+        """
+        Relay a stream produced by `agent`, releasing the agent once it ends or is abandoned.
+        """
+        try:
+            async for item in items:
+                yield item
+        finally:
+            self.release(agent)
+
+# Create a singleton instance
+agent_pool = AgentPool(warm=settings.AGENT_POOL_WARM, max_idle=settings.AGENT_POOL_MAX_IDLE)
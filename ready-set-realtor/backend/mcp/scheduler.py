@@ -0,0 +1,266 @@
+import heapq
+from collections import Counter
+from datetime import datetime, timezone
+from enum import Enum
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from .core import AgentTask
+
+class TaskStatus(str, Enum):
+    PENDING = "pending"
+    READY = "ready"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+FINISHED = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+
+def deadline_key(deadline: Optional[datetime]) -> float:
+    """
+    Sort key for a deadline; naive datetimes are taken as UTC, and no deadline sorts last.
+    """
+    if deadline is None:
+        return float("inf")
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return deadline.timestamp()
+
+class TaskScheduler:
+    """
+    Ready queue and dependency graph for AgentTasks.
+
+    Tasks whose prerequisites have all completed sit in a heap ordered by
+    deadline, then priority (higher first), then submission order, so
+    submit and pop are O(log n). Tasks still waiting keep a count of
+    unfinished prerequisites and are pushed when it reaches zero; completing
+    a task only visits its own dependents. Prerequisites must be submitted
+    first, so the graph cannot contain a cycle.
+
+    Cancelled tasks are left in the heap and skipped when popped; the heap is
+    rebuilt once they make up half of it.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, int, UUID]] = []
+        self._sequence = count()
+        self._stale = 0
+        self._tasks: Dict[UUID, "AgentTask"] = {}
+        self._waiting: Dict[UUID, int] = {}
+        self._dependents: Dict[UUID, Set[UUID]] = {}
+        self._counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        """
+        Tasks that have not finished.
+        """
+        return len(self._tasks) - sum(self._counts[status] for status in FINISHED)
+
+    def __contains__(self, task_id: UUID) -> bool:
+        return task_id in self._tasks
+
+    def _set_status(self, task: "AgentTask", status: TaskStatus) -> None:
+        self._counts[task.status] -= 1
+        self._counts[status] += 1
+        task.status = status
+
+    def _push(self, task: "AgentTask") -> None:
+        self._set_status(task, TaskStatus.READY)
+        heapq.heappush(
+            self._heap,
+            (deadline_key(task.deadline), -task.priority, next(self._sequence), task.task_id),
+        )
+
+    def _task(self, task_id: UUID) -> "AgentTask":
+        try:
+            return self._tasks[task_id]
+        except KeyError:
+            raise KeyError(f"Unknown task {task_id}") from None
+
+    def submit(self, task: "AgentTask") -> TaskStatus:
+        """
+        Queue a task, returning READY or, if prerequisites are unfinished, PENDING.
+
+        Raises ValueError for a duplicate task, or a dependency that is unknown,
+        the task itself, or has already failed or been cancelled.
+        """
+        if task.task_id in self._tasks:
+            raise ValueError(f"Task {task.task_id} is already scheduled")
+
+        waiting = set()
+        for dependency in task.dependencies:
+            dependency_id = UUID(str(dependency))
+            if dependency_id == task.task_id:
+                raise ValueError("A task cannot depend on itself")
+            if dependency_id not in self._tasks:
+                raise ValueError(f"Unknown dependency {dependency_id}")
+            status = self._tasks[dependency_id].status
+            if status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+                raise ValueError(f"Dependency {dependency_id} is {status.value}")
+            if status != TaskStatus.COMPLETED:
+                waiting.add(dependency_id)
+
+        self._tasks[task.task_id] = task
+        task.status = TaskStatus.PENDING
+        self._counts[TaskStatus.PENDING] += 1
+        if not waiting:
+            self._push(task)
+            return TaskStatus.READY
+
+        self._waiting[task.task_id] = len(waiting)
+        for dependency_id in waiting:
+            self._dependents.setdefault(dependency_id, set()).add(task.task_id)
+        return TaskStatus.PENDING
+
+    def peek(self) -> Optional["AgentTask"]:
+        """
+        The task `pop` would return, without claiming it.
+        """
+        while self._heap:
+            task = self._tasks.get(self._heap[0][-1])
+            if task is not None and task.status == TaskStatus.READY:
+                return task
+            heapq.heappop(self._heap)
+            self._stale -= 1
+        return None
+
+    def pop(self) -> Optional["AgentTask"]:
+        """
+        Claim the most urgent ready task and mark it RUNNING; None if nothing is ready.
+        """
+        task = self.peek()
+        if task is None:
+            return None
+        heapq.heappop(self._heap)
+        self._set_status(task, TaskStatus.RUNNING)
+        return task
+
+    def complete(self, task_id: UUID) -> List["AgentTask"]:
+        """
+        Mark a running task completed and return the dependents it released.
+
+        Completing a task cancelled while it ran is a no-op.
+        """
+        task = self._task(task_id)
+        if task.status == TaskStatus.CANCELLED:
+            return []
+        if task.status != TaskStatus.RUNNING:
+            raise ValueError(f"Task {task_id} is {task.status.value}, not running")
+
+        self._set_status(task, TaskStatus.COMPLETED)
+        released = []
+        for dependent_id in self._dependents.pop(task_id, ()):
+            # Dependents cancelled since they were submitted are skipped
+            if dependent_id not in self._waiting:
+                continue
+            self._waiting[dependent_id] -= 1
+            if self._waiting[dependent_id] == 0:
+                del self._waiting[dependent_id]
+                dependent = self._tasks[dependent_id]
+                self._push(dependent)
+                released.append(dependent)
+        return released
+
+    def fail(self, task_id: UUID) -> List["AgentTask"]:
+        """
+        Mark a running task failed and cancel everything that depends on it, returning those.
+        """
+        task = self._task(task_id)
+        if task.status == TaskStatus.CANCELLED:
+            return []
+        if task.status != TaskStatus.RUNNING:
+            raise ValueError(f"Task {task_id} is {task.status.value}, not running")
+
+        self._set_status(task, TaskStatus.FAILED)
+        return self._cancel_dependents(task_id)
+
+    def cancel(self, task_id: UUID) -> List["AgentTask"]:
+        """
+        Cancel a task and, transitively, its dependents, returning every task cancelled.
+
+        A running task is only marked; whoever runs it should drop the result.
+        """
+        task = self._task(task_id)
+        if task.status in FINISHED:
+            return []
+
+        self._drop(task)
+        return [task] + self._cancel_dependents(task_id)
+
+    def _drop(self, task: "AgentTask") -> None:
+        if task.status == TaskStatus.READY:
+            self._stale += 1
+        self._waiting.pop(task.task_id, None)
+        self._set_status(task, TaskStatus.CANCELLED)
+
+    def _cancel_dependents(self, task_id: UUID) -> List["AgentTask"]:
+        cancelled = []
+        stack = [task_id]
+        while stack:
+            for dependent_id in self._dependents.pop(stack.pop(), ()):
+                dependent = self._tasks.get(dependent_id)
+                if dependent is not None and dependent.status not in FINISHED:
+                    self._drop(dependent)
+                    cancelled.append(dependent)
+                    stack.append(dependent_id)
+
+        if self._stale > len(self._heap) // 2:
+            self._compact()
+        return cancelled
+
+    def _compact(self) -> None:
+        self._heap = [
+            entry for entry in self._heap
+            if entry[-1] in self._tasks and self._tasks[entry[-1]].status == TaskStatus.READY
+        ]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def get(self, task_id: UUID) -> Optional["AgentTask"]:
+        return self._tasks.get(task_id)
+
+    def blocked_on(self, task_id: UUID) -> List[UUID]:
+        """
+        The prerequisites a task is still waiting for.
+        """
+        task = self._task(task_id)
+        dependencies = (UUID(str(dependency)) for dependency in task.dependencies)
+        # Pruned prerequisites had completed, or this task would have been cancelled too
+        return [
+            dependency_id for dependency_id in dependencies
+            if dependency_id in self._tasks and self._tasks[dependency_id].status != TaskStatus.COMPLETED
+        ]
+
+    def dependents(self, task_id: UUID) -> List[UUID]:
+        """
+        Tasks waiting on this one.
+        """
+        self._task(task_id)
+        return list(self._dependents.get(task_id, ()))
+
+    def tasks(self, status: Optional[TaskStatus] = None) -> Iterator["AgentTask"]:
+        for task in self._tasks.values():
+            if status is None or task.status == status:
+                yield task
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Number of tasks in each status.
+        """
+        return {status.value: self._counts[status] for status in TaskStatus}
+
+    def prune(self) -> int:
+        """
+        Forget finished tasks, returning how many were removed.
+
+        Later tasks can no longer name them as dependencies.
+        """
+        finished = [task_id for task_id, task in self._tasks.items() if task.status in FINISHED]
+        for task_id in finished:
+            self._counts[self._tasks.pop(task_id).status] -= 1
+        if self._stale:
+            self._compact()
+        return len(finished)
@@ -0,0 +1,34 @@
+"""Composite indexes for per-user listings and lead lookups
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-01-15 00:00:00
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_leads_user_id_created_at_id", "leads", ["user_id", "created_at", "id"]),
+    ("ix_communications_user_id_created_at_id", "communications", ["user_id", "created_at", "id"]),
+    ("ix_communications_user_id_lead_id_created_at_id", "communications", ["user_id", "lead_id", "created_at", "id"]),
+    ("ix_communications_lead_id_created_at", "communications", ["lead_id", "created_at"]),
+    ("ix_documents_user_id_created_at_id", "documents", ["user_id", "created_at", "id"]),
+    ("ix_documents_user_id_lead_id_created_at_id", "documents", ["user_id", "lead_id", "created_at", "id"]),
+    ("ix_documents_lead_id_created_at", "documents", ["lead_id", "created_at"]),
+]
+
+def upgrade() -> None:
+    # Build concurrently so large tables stay writable; that cannot run
+    # inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,26 @@
+"""Index documents by DocuSign envelope id
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-01-22 00:00:00
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_documents_docusign_id", "documents", ["docusign_id"],
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_documents_docusign_id", table_name="documents",
+            if_exists=True, postgresql_concurrently=True,
+        )
@@ -0,0 +1,20 @@
+"""Store generated document content
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-02-05 00:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Nullable with no default, so this is a catalog-only change
+    op.add_column("documents", sa.Column("content", sa.Text(), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column("documents", "content")
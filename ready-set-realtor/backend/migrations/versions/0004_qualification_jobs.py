@@ -0,0 +1,49 @@
+"""Background lead qualification jobs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-02-12 00:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+STATUSES = ("queued", "running", "completed", "failed")
+
+def upgrade() -> None:
+    op.create_table(
+        "qualification_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id")),
+        sa.Column(
+            "status",
+            sa.Enum(*[status.upper() for status in STATUSES], name="qualificationjobstatus"),
+            nullable=False,
+        ),
+        sa.Column("lead_ids", sa.JSON()),
+        sa.Column("lead_statuses", sa.JSON()),
+        sa.Column("criteria", sa.JSON()),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("qualified", sa.Integer(), nullable=False),
+        sa.Column("failed", sa.Integer(), nullable=False),
+        sa.Column("last_lead_id", postgresql.UUID(as_uuid=True)),
+        sa.Column("error", sa.String()),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("finished_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index(
+        "ix_qualification_jobs_user_id_created_at", "qualification_jobs", ["user_id", "created_at"]
+    )
+
+def downgrade() -> None:
+    op.drop_index("ix_qualification_jobs_user_id_created_at", table_name="qualification_jobs")
+    op.drop_table("qualification_jobs")
+    sa.Enum(name="qualificationjobstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,45 @@
+"""Persisted appointments for agent availability
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-02-19 00:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+STATUSES = ("scheduled", "completed", "cancelled")
+
+def upgrade() -> None:
+    op.create_table(
+        "appointments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("leads.id")),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("location", sa.String()),
+        sa.Column(
+            "status",
+            sa.Enum(*[status.upper() for status in STATUSES], name="appointmentstatus"),
+            nullable=False,
+        ),
+        sa.Column("notes", sa.String()),
+        sa.CheckConstraint("end_time > start_time", name="ck_appointments_end_after_start"),
+    )
+    op.create_index("ix_appointments_user_id_start_time", "appointments", ["user_id", "start_time"])
+    op.create_index("ix_appointments_lead_id_start_time", "appointments", ["lead_id", "start_time"])
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_lead_id_start_time", table_name="appointments")
+    op.drop_index("ix_appointments_user_id_start_time", table_name="appointments")
+    op.drop_table("appointments")
+    sa.Enum(name="appointmentstatus").drop(op.get_bind(), checkfirst=True)
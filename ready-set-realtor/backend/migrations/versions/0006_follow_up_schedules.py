@@ -0,0 +1,49 @@
+"""Persisted follow-up schedules with a due-time index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-02-26 00:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+STATUSES = ("active", "completed", "failed", "cancelled")
+
+def upgrade() -> None:
+    op.create_table(
+        "follow_up_schedules",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("leads.id"), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("template_ids", sa.JSON(), nullable=False),
+        sa.Column("step", sa.Integer(), nullable=False),
+        sa.Column("context", sa.JSON()),
+        sa.Column(
+            "status",
+            sa.Enum(*[status.upper() for status in STATUSES], name="followupschedulestatus"),
+            nullable=False,
+        ),
+        sa.Column("next_contact", sa.DateTime(timezone=True)),
+        sa.Column("last_contact", sa.DateTime(timezone=True)),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String()),
+    )
+    op.create_index(
+        "ix_follow_up_schedules_status_next_contact", "follow_up_schedules", ["status", "next_contact"]
+    )
+    op.create_index("ix_follow_up_schedules_lead_id", "follow_up_schedules", ["lead_id"])
+
+def downgrade() -> None:
+    op.drop_index("ix_follow_up_schedules_lead_id", table_name="follow_up_schedules")
+    op.drop_index("ix_follow_up_schedules_status_next_contact", table_name="follow_up_schedules")
+    op.drop_table("follow_up_schedules")
+    sa.Enum(name="followupschedulestatus").drop(op.get_bind(), checkfirst=True)
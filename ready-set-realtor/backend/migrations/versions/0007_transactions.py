@@ -0,0 +1,84 @@
+"""Persisted transactions and milestones with deadline indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-03-04 00:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+TRANSACTION_STATUSES = ("active", "closed", "cancelled")
+MILESTONE_STATUSES = ("pending", "in_progress", "completed", "waived")
+
+def upgrade() -> None:
+    op.create_table(
+        "transactions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("leads.id")),
+        sa.Column("property_address", sa.String(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(*[status.upper() for status in TRANSACTION_STATUSES], name="transactionstatus"),
+            nullable=False,
+        ),
+        sa.Column("closing_date", sa.DateTime(timezone=True)),
+        sa.Column("details", sa.JSON()),
+    )
+    op.create_index("ix_transactions_user_id_created_at", "transactions", ["user_id", "created_at"])
+    op.create_index("ix_transactions_lead_id", "transactions", ["lead_id"])
+
+    op.create_table(
+        "transaction_milestones",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column(
+            "transaction_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("transactions.id"), nullable=False
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String()),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(*[status.upper() for status in MILESTONE_STATUSES], name="milestonestatus"),
+            nullable=False,
+        ),
+        sa.Column("assigned_to", sa.String()),
+        sa.Column("completed_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index(
+        "ix_transaction_milestones_status_due_date", "transaction_milestones", ["status", "due_date"]
+    )
+    op.create_index(
+        "ix_transaction_milestones_user_id_status_due_date",
+        "transaction_milestones",
+        ["user_id", "status", "due_date"],
+    )
+    op.create_index(
+        "uq_transaction_milestones_transaction_id_key",
+        "transaction_milestones",
+        ["transaction_id", "key"],
+        unique=True,
+    )
+
+def downgrade() -> None:
+    op.drop_index("uq_transaction_milestones_transaction_id_key", table_name="transaction_milestones")
+    op.drop_index("ix_transaction_milestones_user_id_status_due_date", table_name="transaction_milestones")
+    op.drop_index("ix_transaction_milestones_status_due_date", table_name="transaction_milestones")
+    op.drop_table("transaction_milestones")
+    op.drop_index("ix_transactions_lead_id", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_created_at", table_name="transactions")
+    op.drop_table("transactions")
+    sa.Enum(name="milestonestatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="transactionstatus").drop(op.get_bind(), checkfirst=True)
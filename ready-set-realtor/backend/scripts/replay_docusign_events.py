@@ -0,0 +1,124 @@
+"""
+Replay DocuSign Connect envelope events against a local API.
+
+Either replays recorded Connect payloads (one JSON object per line) or
+synthesises an envelope's lifecycle. Every request is signed with the
+Connect HMAC key, exactly as DocuSign would sign it.
+
+Usage:
+    python -m scripts.replay_docusign_events --envelope-id <id> \\
+        --statuses sent,delivered,completed --signer agent@example.com
+
+    python -m scripts.replay_docusign_events --file connect_events.ndjson --shuffle
+
+The key defaults to DOCUSIGN_CONNECT_HMAC_KEY from the environment.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+def build_event(
+    envelope_id: str,
+    status: str,
+    changed_at: datetime,
+    signers: Optional[List[str]] = None,
+) -> Dict:
+    """
+    A Connect JSON (SIM) envelope event with envelope data included.
+    """
+    timestamp = changed_at.strftime("%Y-%m-%dT%H:%M:%S.%f0Z")
+    return {
+        "event": f"envelope-{status}",
+        "apiVersion": "v2.1",
+        "uri": f"/restapi/v2.1/accounts/local/envelopes/{envelope_id}",
+        "retryCount": 0,
+        "configurationId": 1,
+        "generatedDateTime": timestamp,
+        "data": {
+            "accountId": "local",
+            "envelopeId": envelope_id,
+            "envelopeSummary": {
+                "status": status,
+                "envelopeId": envelope_id,
+                "statusChangedDateTime": timestamp,
+                "completedDateTime": timestamp if status == "completed" else None,
+                "recipients": {
+                    "signers": [
+                        {
+                            "name": email.split("@")[0],
+                            "email": email,
+                            "recipientId": str(i),
+                            "status": status,
+                            "signedDateTime": timestamp if status == "completed" else None,
+                        }
+                        for i, email in enumerate(signers or [], 1)
+                    ]
+                },
+            },
+        },
+    }
+
+def sign(body: bytes, key: str) -> str:
+    return base64.b64encode(hmac.new(key.encode(), body, hashlib.sha256).digest()).decode()
+
+def lifecycle(envelope_id: str, statuses: List[str], signers: List[str]) -> List[Dict]:
+    start = datetime.now(timezone.utc)
+    return [
+        build_event(envelope_id, status, start + timedelta(seconds=i), signers)
+        for i, status in enumerate(statuses)
+    ]
+
+def replay(url: str, key: str, events: List[Dict]) -> None:
+    with httpx.Client(timeout=10) as client:
+        for event in events:
+            body = json.dumps(event).encode()
+            response = client.post(
+                url,
+                content=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-DocuSign-Signature-1": sign(body, key),
+                },
+            )
+            print(f"{event['event']:<22} -> {response.status_code} {response.text}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000/webhooks/docusign")
+    parser.add_argument("--key", default=os.getenv("DOCUSIGN_CONNECT_HMAC_KEY"))
+    parser.add_argument("--file", help="recorded Connect payloads, one JSON object per line")
+    parser.add_argument("--envelope-id")
+    parser.add_argument("--statuses", default="sent,delivered,completed")
+    parser.add_argument("--signer", action="append", default=[])
+    parser.add_argument("--shuffle", action="store_true", help="deliver out of order, as Connect may")
+    parser.add_argument("--duplicate", action="store_true", help="deliver every event twice, as Connect retries may")
+    args = parser.parse_args()
+
+    if not args.key:
+        parser.error("--key or DOCUSIGN_CONNECT_HMAC_KEY is required")
+
+    if args.file:
+        with open(args.file) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+    elif args.envelope_id:
+        events = lifecycle(args.envelope_id, args.statuses.split(","), args.signer)
+    else:
+        parser.error("pass --file or --envelope-id")
+
+    if args.duplicate:
+        events = [event for event in events for _ in range(2)]
+    if args.shuffle:
+        random.shuffle(events)
+
+    replay(args.url, args.key, events)
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,38 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_async_database_url, get_sessionmaker
 from app.main import app
-from app.core.security import create_access_token
+from app.core.security import create_access_token, get_password_hash
+from app.models.document import Document, DocumentStatus, DocumentType
+from app.models.lead import Lead
+from app.models.user import User
 
-# Create test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Create test database. The app talks to it through aiosqlite while fixtures
+# seed it synchronously, so it lives in a file both engines can open.
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 @pytest.fixture(scope="function")
 def db():
     Base.metadata.create_all(bind=engine)
@@ -28,17 +43,21 @@ def db():
         db.close()
         Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture
+def async_session_factory(db):
+    return TestingAsyncSessionLocal
+
 @pytest.fixture(scope="function")
 def client(db):
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            db.close()
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: TestingAsyncSessionLocal
     yield TestClient(app)
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_sessionmaker]
 
 @pytest.fixture
 def test_user():
@@ -67,4 +86,31 @@ def authorized_client(client, test_user_token):
         **client.headers,
         "Authorization": f"Bearer {test_user_token}",
     }
-    return client 
\ No newline at end of file
+    return client
+
+@pytest.fixture
+def test_document(db, test_user):
+    user = User(
+        id=test_user["id"],
+        email=test_user["email"],
+        full_name=test_user["full_name"],
+        hashed_password=get_password_hash("testpassword123"),
+        role=test_user["role"],
+    )
+    lead = Lead(user_id=user.id, first_name="John", last_name="Doe")
+    db.add_all([user, lead])
+    db.flush()
+
+    document = Document(
+        user_id=user.id,
+        lead_id=lead.id,
+        title="Purchase Agreement - 123 Main St",
+        type=DocumentType.PURCHASE_AGREEMENT,
+        status=DocumentStatus.PENDING_SIGNATURE,
+        docusign_id="5f1c2b6e-0000-4000-8000-000000000001",
+        metadata={"signers": [{"name": "John Doe", "email": "john@example.com"}]},
+    )
+    db.add(document)
+    db.commit()
+    db.refresh(document)
+    return document
@@ -0,0 +1,49 @@
+import asyncio
+from uuid import uuid4
+
+from app.mcp.core import AgentType
+from app.mcp.pool import AgentPool
+
+def test_released_agents_are_reused_clean():
+    async def scenario():
+        pool = AgentPool(warm=1, max_idle=2)
+        await pool.start()
+
+        async with pool.acquire(AgentType.FOLLOW_UP) as agent:
+            await agent.create_follow_up_schedule(uuid4(), {"stage": "viewed"})
+            agent.context.memory["lead"] = "ann"
+
+        async with pool.acquire(AgentType.FOLLOW_UP) as reused:
+            assert reused is agent
+            assert reused.follow_up_schedules == {}
+            assert reused.context.memory == {}
+
+    asyncio.run(scenario())
+
+def test_concurrent_checkouts_get_separate_agents():
+    pool = AgentPool(warm=0, max_idle=1)
+    first = pool.checkout(AgentType.TRANSACTION_COORDINATOR)
+    second = pool.checkout(AgentType.TRANSACTION_COORDINATOR)
+    assert first is not second
+    assert pool.checked_out == 2
+
+    # Only max_idle agents are kept once the burst is over
+    pool.release(first)
+    pool.release(second)
+    assert pool.checkout(AgentType.TRANSACTION_COORDINATOR) is first
+    assert pool.checkout(AgentType.TRANSACTION_COORDINATOR) is not second
+
+def test_hold_releases_after_the_stream():
+    async def scenario():
+        pool = AgentPool(warm=0, max_idle=1)
+        agent = pool.checkout(AgentType.SCHEDULER)
+
+        async def deltas():
+            yield "Hi"
+            yield " there"
+
+        assert [delta async for delta in pool.hold(agent, deltas())] == ["Hi", " there"]
+        assert pool.checked_out == 0
+        assert pool.checkout(AgentType.SCHEDULER) is agent
+
+    asyncio.run(scenario())
@@ -0,0 +1,85 @@
+from fastapi import status
+
+def book(client, lead_id, start, end):
+    return client.post(
+        "/appointments",
+        json={"lead_id": str(lead_id), "start_time": start, "end_time": end, "type": "viewing", "location": "123 Main St"},
+    )
+
+def test_overlapping_booking_is_rejected(authorized_client, test_document):
+    response = book(authorized_client, test_document.lead_id, "2024-03-04T10:00:00+00:00", "2024-03-04T11:00:00+00:00")
+    assert response.status_code == status.HTTP_200_OK
+    appointment_id = response.json()["id"]
+
+    response = book(authorized_client, test_document.lead_id, "2024-03-04T10:30:00+00:00", "2024-03-04T11:30:00+00:00")
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    # Back to back is fine
+    response = book(authorized_client, test_document.lead_id, "2024-03-04T11:00:00+00:00", "2024-03-04T12:00:00+00:00")
+    assert response.status_code == status.HTTP_200_OK
+
+    # Cancelling frees the slot
+    response = authorized_client.delete(f"/appointments/{appointment_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = book(authorized_client, test_document.lead_id, "2024-03-04T10:00:00+00:00", "2024-03-04T11:00:00+00:00")
+    assert response.status_code == status.HTTP_200_OK
+
+def test_availability_excludes_bookings(authorized_client, test_document):
+    book(authorized_client, test_document.lead_id, "2024-03-04T09:00:00+00:00", "2024-03-04T16:00:00+00:00")
+
+    response = authorized_client.get(
+        "/appointments/availability",
+        params={"start": "2024-03-04T00:00:00+00:00", "end": "2024-03-05T00:00:00+00:00", "duration": 60},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [slot["start_time"] for slot in response.json()] == ["2024-03-04T16:00:00Z"]
+
+    response = authorized_client.get(
+        "/appointments/availability/next",
+        params={"after": "2024-03-04T08:00:00+00:00", "duration": 120},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["start_time"] == "2024-03-05T09:00:00Z"
+
+def test_reschedule_checks_the_rest_of_the_calendar(authorized_client, test_document):
+    first = book(authorized_client, test_document.lead_id, "2024-03-04T10:00:00+00:00", "2024-03-04T11:00:00+00:00").json()
+    book(authorized_client, test_document.lead_id, "2024-03-04T13:00:00+00:00", "2024-03-04T14:00:00+00:00")
+
+    response = authorized_client.patch(
+        f"/appointments/{first['id']}",
+        json={"start_time": "2024-03-04T13:30:00+00:00", "end_time": "2024-03-04T14:30:00+00:00"},
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    # Moving within its own slot does not clash with itself
+    response = authorized_client.patch(
+        f"/appointments/{first['id']}",
+        json={"start_time": "2024-03-04T10:30:00+00:00", "end_time": "2024-03-04T11:30:00+00:00"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+def test_reopening_a_cancelled_appointment_checks_the_calendar(authorized_client, test_document):
+    first = book(authorized_client, test_document.lead_id, "2024-03-04T10:00:00+00:00", "2024-03-04T11:00:00+00:00").json()
+    authorized_client.delete(f"/appointments/{first['id']}")
+    second = book(authorized_client, test_document.lead_id, "2024-03-04T10:30:00+00:00", "2024-03-04T11:30:00+00:00").json()
+
+    response = authorized_client.patch(f"/appointments/{first['id']}", json={"status": "scheduled"})
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    # While cancelled it holds no slot, so moving it cannot clash
+    response = authorized_client.patch(
+        f"/appointments/{first['id']}",
+        json={"start_time": "2024-03-04T11:00:00+00:00", "end_time": "2024-03-04T12:00:00+00:00"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = authorized_client.patch(
+        f"/appointments/{first['id']}",
+        json={"start_time": "2024-03-04T10:00:00+00:00", "end_time": "2024-03-04T11:00:00+00:00"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Once the slot is free again it can be reopened
+    authorized_client.delete(f"/appointments/{second['id']}")
+    response = authorized_client.patch(f"/appointments/{first['id']}", json={"status": "scheduled"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "scheduled"
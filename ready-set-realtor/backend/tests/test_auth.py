@@ -105,4 +105,28 @@ def test_login_user_not_found(client):
         },
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    assert "Incorrect email or password" in response.json()["detail"] 
\ No newline at end of file
+    assert "Incorrect email or password" in response.json()["detail"]
+
+
+def test_login_returns_503_when_hashing_pool_is_full(client, db, monkeypatch):
+    from app.core.hashing import password_hasher
+
+    user = User(
+        email="test@example.com",
+        full_name="Test User",
+        hashed_password=get_password_hash("testpassword123"),
+        role="agent",
+    )
+    db.add(user)
+    db.commit()
+
+    monkeypatch.setattr(password_hasher, "in_flight", password_hasher.workers + password_hasher.max_queue)
+    response = client.post(
+        "/auth/login",
+        data={
+            "username": user.email,
+            "password": "testpassword123",
+        },
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == str(password_hasher.retry_after)
@@ -1,6 +1,6 @@
 import pytest
 from fastapi import status
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.models.communication import Communication, CommunicationType, CommunicationDirection, CommunicationStatus
 from app.models.user import User
 from app.models.lead import Lead
@@ -104,9 +104,52 @@ def test_get_communications(authorized_client, db, test_lead, test_user):
     response = authorized_client.get("/communications")
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert len(data) == 2
-    assert data[0]["type"] == CommunicationType.EMAIL.value
-    assert data[1]["type"] == CommunicationType.SMS.value
+    assert len(data["items"]) == 2
+    assert data["next_cursor"] is None
+    assert {item["type"] for item in data["items"]} == {
+        CommunicationType.EMAIL.value,
+        CommunicationType.SMS.value,
+    }
+
+def test_get_communications_cursor_pagination(authorized_client, db, test_lead, test_user):
+    # Two rows share a timestamp so the id tie-breaker is exercised
+    base_time = datetime(2024, 1, 1)
+    db.add_all([
+        Communication(
+            user_id=test_user["id"],
+            lead_id=test_lead.id,
+            type=CommunicationType.EMAIL,
+            direction=CommunicationDirection.OUTBOUND,
+            content=f"Test email {i}",
+            status=CommunicationStatus.COMPLETED,
+            created_at=base_time + timedelta(minutes=min(i, 3)),
+        )
+        for i in range(5)
+    ])
+    db.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = authorized_client.get("/communications", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["items"]) <= 2
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+def test_get_communications_invalid_cursor(authorized_client):
+    response = authorized_client.get("/communications", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 def test_get_call_transcript(authorized_client):
     call_id = "test_call_id"
@@ -116,4 +159,39 @@ def test_get_call_transcript(authorized_client):
 def test_get_call_recording(authorized_client):
     call_id = "test_call_id"
     response = authorized_client.get(f"/communications/call/{call_id}/recording")
-    assert response.status_code == status.HTTP_200_OK 
\ No newline at end of file
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_send_sms_bulk(authorized_client, db, test_lead, test_user, monkeypatch):
+    from app.services.twilio_service import twilio_service
+
+    no_phone = Lead(user_id=test_user["id"], first_name="Jane", last_name="Doe")
+    db.add(no_phone)
+    db.commit()
+    db.refresh(no_phone)
+
+    async def fake_send_sms_many(messages, concurrency=None):
+        return [
+            {"to": item["to_number"], "success": True, "message": {"id": "SM123"}, "error": None}
+            for item in messages
+        ]
+
+    monkeypatch.setattr(twilio_service, "send_sms_many", fake_send_sms_many)
+
+    missing_id = "00000000-0000-0000-0000-000000000000"
+    response = authorized_client.post("/communications/sms/bulk", json={
+        "lead_ids": [str(test_lead.id), str(no_phone.id), missing_id],
+        "message": "Open house this Saturday!",
+    })
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["sent"] == 1
+    assert data["failed"] == 2
+    assert [item["lead_id"] for item in data["results"]] == [str(test_lead.id), str(no_phone.id), missing_id]
+    assert data["results"][0]["communication_id"] is not None
+    assert data["results"][1]["error"] == "Lead has no phone number"
+    assert data["results"][2]["error"] == "Lead not found"
+
+    communication = db.query(Communication).filter(Communication.lead_id == test_lead.id).one()
+    assert communication.type == CommunicationType.TEXT
+    assert communication.status == CommunicationStatus.COMPLETED
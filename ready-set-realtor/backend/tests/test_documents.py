@@ -0,0 +1,128 @@
+import io
+import json
+import zipfile
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from app.core.config import settings
+from app.models.document import Document, DocumentStatus
+from app.models.lead import Lead
+from app.services.document_service import document_service
+from scripts.replay_docusign_events import lifecycle, sign
+
+HMAC_KEY = "test-connect-key"
+
+@pytest.fixture
+def connect_key(monkeypatch):
+    monkeypatch.setattr(settings, "DOCUSIGN_CONNECT_HMAC_KEY", HMAC_KEY)
+    return HMAC_KEY
+
+def post_event(client, event, key=HMAC_KEY):
+    body = json.dumps(event).encode()
+    return client.post(
+        "/webhooks/docusign",
+        content=body,
+        headers={"Content-Type": "application/json", "X-DocuSign-Signature-1": sign(body, key)},
+    )
+
+def test_connect_event_updates_document(client, db, test_document, connect_key):
+    sent, completed = lifecycle(test_document.docusign_id, ["sent", "completed"], ["john@example.com"])
+
+    assert post_event(client, sent).json() == {"status": "updated"}
+    assert post_event(client, completed).json() == {"status": "updated"}
+    # Connect retries and reorders deliveries; older events are ignored
+    assert post_event(client, sent).json() == {"status": "stale"}
+
+    db.refresh(test_document)
+    assert test_document.status == DocumentStatus.SIGNED
+    assert test_document.metadata["docusign"]["envelope_status"] == "completed"
+    assert test_document.metadata["signers"] == [{"name": "John Doe", "email": "john@example.com"}]
+
+def test_connect_event_rejects_bad_signature(client, db, test_document, connect_key):
+    (completed,) = lifecycle(test_document.docusign_id, ["completed"], ["john@example.com"])
+
+    response = post_event(client, completed, key="wrong-key")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    db.refresh(test_document)
+    assert test_document.status == DocumentStatus.PENDING_SIGNATURE
+
+def test_connect_event_for_unknown_envelope_is_acknowledged(client, connect_key):
+    (sent,) = lifecycle("unknown-envelope", ["sent"], [])
+
+    response = post_event(client, sent)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "ignored"}
+
+def test_signature_status_is_served_from_database(authorized_client, test_document, connect_key, monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("signature status should not call DocuSign")
+
+    monkeypatch.setattr(document_service, "get_signature_status", fail)
+    (completed,) = lifecycle(test_document.docusign_id, ["completed"], ["john@example.com"])
+    post_event(authorized_client, completed)
+
+    response = authorized_client.get(f"/documents/{test_document.id}/signature-status")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == DocumentStatus.SIGNED.value
+    assert data["signed_by"] == ["john@example.com"]
+    assert datetime.fromisoformat(data["signed_at"]) <= datetime.now(timezone.utc)
+
+def listing_agreements(lead_id, count):
+    fields = document_service.templates["listing_agreement"].fields
+    return [
+        {
+            "template_name": "listing_agreement",
+            "context": {**{field: f"{field} {i}" for field in fields}, "lead_id": str(lead_id)},
+        }
+        for i in range(count)
+    ]
+
+def test_generate_documents_batch(authorized_client, db, test_document):
+    batch = listing_agreements(test_document.lead_id, 3)
+
+    response = authorized_client.post("/documents/generate/batch", json={"documents": batch})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["title"] for item in data] == [f"listing_agreement - property_address {i}" for i in range(3)]
+    assert "seller_name 2" in data[2]["content"]
+    assert db.query(Document).filter(Document.type == "listing_agreement").count() == 3
+
+def test_generate_documents_batch_as_zip(authorized_client, test_document):
+    batch = listing_agreements(test_document.lead_id, 3)
+
+    response = authorized_client.post(
+        "/documents/generate/batch", params={"archive": True}, json={"documents": batch}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        names = archive.namelist()
+        assert len(names) == 3
+        assert names[0].startswith("001-listing_agreement-")
+        assert "broker_name 1" in archive.read(names[1]).decode()
+
+def test_generate_documents_batch_rejects_whole_batch(authorized_client, db, test_document):
+    batch = listing_agreements(test_document.lead_id, 3)
+    del batch[1]["context"]["seller_name"]
+
+    response = authorized_client.post("/documents/generate/batch", json={"documents": batch})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Document 1: Missing required fields: seller_name"
+    assert db.query(Document).filter(Document.type == "listing_agreement").count() == 0
+
+def test_generate_documents_batch_rejects_other_users_leads(authorized_client, db, test_document):
+    # Another agent's lead
+    lead = Lead(user_id=uuid4(), first_name="Jane", last_name="Roe")
+    db.add(lead)
+    db.commit()
+    batch = listing_agreements(test_document.lead_id, 2) + listing_agreements(lead.id, 1)
+
+    response = authorized_client.post("/documents/generate/batch", json={"documents": batch})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Document 2: lead not found"
+    assert db.query(Document).filter(Document.type == "listing_agreement").count() == 0
@@ -0,0 +1,76 @@
+import json
+import pytest
+from fastapi import status
+from app.core.llm_cache import llm_cache
+from app.models.communication import Communication
+from app.models.document import Document, DocumentStatus
+from app.services.openai_service import openai_service
+
+def parse_events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+@pytest.fixture
+def model_stream(monkeypatch):
+    """
+    Replace the model with a canned stream; set `fail` to break it midway.
+    """
+    state = {"deltas": ["Hi John,", "\nThanks for ", "visiting!"], "fail": False}
+
+    async def stream_chat_completion(**request):
+        for delta in state["deltas"]:
+            yield delta
+            if state["fail"]:
+                raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(openai_service, "stream_chat_completion", stream_chat_completion)
+    monkeypatch.setattr(llm_cache, "enabled", False)
+    return state
+
+def test_follow_up_draft_streams_then_saves(authorized_client, db, test_document, model_stream):
+    response = authorized_client.post(
+        "/drafts/follow-up",
+        json={
+            "lead_id": str(test_document.lead_id),
+            "template_id": "viewing_followup",
+            "context": {"property_address": "123 Main St", "stage": "viewed"},
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_events(response.text)
+    assert [data["text"] for event, data in events if event == "token"] == model_stream["deltas"]
+    event, data = events[-1]
+    assert event == "done"
+
+    communication = db.get(Communication, data["id"])
+    assert communication.content == "Hi John,\nThanks for visiting!"
+    assert communication.metadata["template_id"] == "viewing_followup"
+
+def test_failed_stream_saves_nothing(authorized_client, db, test_document, model_stream):
+    model_stream["fail"] = True
+
+    response = authorized_client.post(
+        "/drafts/document",
+        json={
+            "lead_id": str(test_document.lead_id),
+            "title": "Amendment - 123 Main St",
+            "type": "amendment",
+            "context": {"property_address": "123 Main St"},
+        },
+    )
+    events = parse_events(response.text)
+    assert events[0] == ("token", {"text": "Hi John,"})
+    assert events[-1][0] == "error"
+    assert db.query(Document).filter(Document.status == DocumentStatus.DRAFT).count() == 0
+
+def test_unknown_template_is_rejected_before_streaming(authorized_client, test_document, model_stream):
+    response = authorized_client.post(
+        "/drafts/follow-up",
+        json={"lead_id": str(test_document.lead_id), "template_id": "missing"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
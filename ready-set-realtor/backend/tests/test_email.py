@@ -0,0 +1,94 @@
+import asyncio
+import socket
+from email.mime.text import MIMEText
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from app.core.smtp import SMTPConnectionPool
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+        self.logins = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        self.logins += 1
+        return AuthResult(success=auth_data.password == b"secret")
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=handler.authenticate,
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+def make_pool(port: int, **kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        host="127.0.0.1",
+        port=port,
+        username="agent@example.com",
+        password="secret",
+        start_tls=False,
+        **kwargs,
+    )
+
+def make_message(i: int) -> MIMEText:
+    msg = MIMEText(f"Message {i}")
+    msg["Subject"] = f"Test {i}"
+    return msg
+
+def test_pool_reuses_authenticated_connections(smtp_server):
+    handler, port = smtp_server
+    pool = make_pool(port, size=2)
+
+    async def scenario():
+        await asyncio.gather(*[
+            pool.send(make_message(i), "agent@example.com", [f"lead{i}@example.com"])
+            for i in range(20)
+        ])
+        await pool.close()
+
+    asyncio.run(scenario())
+    assert len(handler.messages) == 20
+    assert handler.logins <= 2
+
+def test_pool_reconnects_after_dropped_connection(smtp_server):
+    handler, port = smtp_server
+    pool = make_pool(port, size=1)
+    reconnects_before = pool.reconnects.value
+
+    async def scenario():
+        await pool.send(make_message(1), "agent@example.com", ["lead@example.com"])
+
+        # The server hung up while the connection sat idle
+        client, _ = pool._idle[0]
+
+        async def dropped(*args, **kwargs):
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+
+        client.send_message = dropped
+        await pool.send(make_message(2), "agent@example.com", ["lead@example.com"])
+        await pool.close()
+
+    asyncio.run(scenario())
+    assert len(handler.messages) == 2
+    assert handler.logins == 2
+    assert pool.reconnects.value - reconnects_before == 1
@@ -0,0 +1,76 @@
+import asyncio
+
+from app.models.document import Document, DocumentStatus, DocumentType
+from app.services.document_service import document_service
+from app.services.envelope_sync_service import envelope_sync_service
+
+def make_documents(db, test_document, count):
+    documents = [
+        Document(
+            user_id=test_document.user_id,
+            lead_id=test_document.lead_id,
+            title=f"Listing Agreement {i}",
+            type=DocumentType.LISTING_AGREEMENT,
+            status=DocumentStatus.PENDING_SIGNATURE,
+            docusign_id=f"envelope-{i}",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+    db.add_all(documents)
+    db.commit()
+    return documents
+
+def test_sync_pending_batches_calls_and_commits_changes(
+    db, test_document, async_session_factory, monkeypatch
+):
+    make_documents(db, test_document, 5)
+    calls = []
+
+    async def fake_list_status_changes(envelope_ids, since):
+        calls.append(list(envelope_ids))
+        return [
+            {
+                "envelope_id": envelope_id,
+                "status": "completed" if envelope_id == "envelope-3" else "delivered",
+                "status_changed_at": "2024-01-02T10:00:00.0000000Z",
+                "sent_at": "2024-01-01T10:00:00.0000000Z",
+                "completed_at": "2024-01-02T10:00:00.0000000Z" if envelope_id == "envelope-3" else None,
+                "signers": [],
+            }
+            for envelope_id in envelope_ids
+        ]
+
+    monkeypatch.setattr(document_service, "list_status_changes", fake_list_status_changes)
+    monkeypatch.setattr(envelope_sync_service, "batch_size", 2)
+
+    summary = asyncio.run(envelope_sync_service.sync_pending(async_session_factory))
+
+    # The fixture document plus five more, two envelopes per call
+    assert summary == {"checked": 6, "batches": 3, "failed_batches": 0, "updated": 6}
+    assert sorted(len(batch) for batch in calls) == [2, 2, 2]
+
+    signed = db.query(Document).filter(Document.status == DocumentStatus.SIGNED).all()
+    assert [document.docusign_id for document in signed] == ["envelope-3"]
+
+def test_sync_pending_keeps_going_when_a_batch_fails(
+    db, test_document, async_session_factory, monkeypatch
+):
+    make_documents(db, test_document, 3)
+
+    async def flaky_list_status_changes(envelope_ids, since):
+        if "envelope-0" in envelope_ids:
+            raise RuntimeError("quota exceeded")
+        return [
+            {"envelope_id": envelope_id, "status": "completed", "status_changed_at": None, "signers": []}
+            for envelope_id in envelope_ids
+        ]
+
+    monkeypatch.setattr(document_service, "list_status_changes", flaky_list_status_changes)
+    monkeypatch.setattr(envelope_sync_service, "batch_size", 1)
+
+    summary = asyncio.run(envelope_sync_service.sync_pending(async_session_factory))
+
+    assert summary["failed_batches"] == 1
+    assert summary["updated"] == 3
+    assert db.query(Document).filter(Document.status == DocumentStatus.PENDING_SIGNATURE).count() == 1
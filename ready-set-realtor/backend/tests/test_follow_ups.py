@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from fastapi import status
+
+from app.agents.follow_up_agent import FollowUpAgent
+from app.models.communication import Communication
+from app.models.follow_up_schedule import FollowUpSchedule, FollowUpScheduleStatus
+from app.models.lead import Lead
+from app.services.email_service import email_service
+from app.services.follow_up_service import follow_up_service
+
+def add_lead(db, test_user, **fields) -> Lead:
+    lead = Lead(user_id=test_user["id"], first_name="John", last_name="Doe", email="john@example.com", **fields)
+    db.add(lead)
+    db.commit()
+    return lead
+
+def add_schedule(db, lead, template_ids, next_contact, step=0) -> FollowUpSchedule:
+    schedule = FollowUpSchedule(
+        user_id=lead.user_id,
+        lead_id=lead.id,
+        stage="initial_contact",
+        template_ids=template_ids,
+        step=step,
+        context={},
+        status=FollowUpScheduleStatus.ACTIVE,
+        next_contact=next_contact,
+        attempts=0,
+    )
+    db.add(schedule)
+    db.commit()
+    return schedule
+
+def fake_delivery(monkeypatch, sent=True):
+    outbox = []
+
+    async def generate_follow_up_message(self, lead_id, template_id, context):
+        return {"content": f"{template_id} for {context['lead_name']}"}
+
+    async def send_custom_email(to_email, subject, body, is_html=True):
+        outbox.append((to_email, body))
+        return sent
+
+    monkeypatch.setattr(FollowUpAgent, "generate_follow_up_message", generate_follow_up_message)
+    monkeypatch.setattr(email_service, "send_custom_email", send_custom_email)
+    return outbox
+
+def test_create_and_cancel_schedule(authorized_client, db, test_user):
+    lead = add_lead(db, test_user)
+
+    response = authorized_client.post(
+        "/follow-ups", json={"lead_id": str(lead.id), "stage": "initial_contact"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    first = response.json()
+    assert first["template_ids"] == ["initial_thank_you"]
+    assert first["status"] == "active"
+    assert first["next_contact"] is not None
+
+    # A new schedule for the lead replaces the active one
+    response = authorized_client.post(
+        "/follow-ups", json={"lead_id": str(lead.id), "stage": "viewed"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = authorized_client.get(f"/follow-ups/{first['id']}")
+    assert response.json()["status"] == "cancelled"
+
+    response = authorized_client.get("/follow-ups", params={"lead_id": str(lead.id)})
+    statuses = {schedule["stage"]: schedule["status"] for schedule in response.json()}
+    assert statuses == {"viewed": "active", "initial_contact": "cancelled"}
+
+    active = next(schedule for schedule in response.json() if schedule["status"] == "active")
+    response = authorized_client.delete(f"/follow-ups/{active['id']}")
+    assert response.json()["status"] == "cancelled"
+    assert response.json()["next_contact"] is None
+
+def test_create_schedule_rejects_unknown_stage_and_lead(authorized_client, db, test_user):
+    lead = add_lead(db, test_user)
+    response = authorized_client.post("/follow-ups", json={"lead_id": str(lead.id), "stage": "closing"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = authorized_client.post(
+        "/follow-ups", json={"lead_id": "123e4567-e89b-12d3-a456-426614174001", "stage": "viewed"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_dispatch_claims_each_due_schedule_once(db, async_session_factory, test_user, monkeypatch):
+    monkeypatch.setattr(follow_up_service, "batch_size", 2)
+    lead = add_lead(db, test_user)
+    now = datetime.now(timezone.utc)
+    due = [add_schedule(db, lead, ["initial_thank_you"], now - timedelta(minutes=minutes)) for minutes in (1, 2, 3)]
+    later = add_schedule(db, lead, ["initial_thank_you"], now + timedelta(days=1))
+
+    async def run():
+        enqueued = []
+        first = await follow_up_service.dispatch_due(
+            lambda schedule_id, step: enqueued.append(schedule_id), session_factory=async_session_factory
+        )
+        # Claimed rows are leased, so a second poll finds nothing
+        second = await follow_up_service.dispatch_due(
+            lambda schedule_id, step: enqueued.append(schedule_id), session_factory=async_session_factory
+        )
+        return first, second, enqueued
+
+    first, second, enqueued = asyncio.run(run())
+    assert (first, second) == (3, 0)
+    assert enqueued == [schedule.id for schedule in reversed(due)]
+    assert later.id not in enqueued
+
+def test_send_advances_then_completes(db, async_session_factory, test_user, monkeypatch):
+    outbox = fake_delivery(monkeypatch)
+    lead = add_lead(db, test_user)
+    schedule = add_schedule(db, lead, ["initial_thank_you", "market_update"], datetime.now(timezone.utc))
+
+    async def run():
+        results = [await follow_up_service.send(schedule.id, 0, session_factory=async_session_factory)]
+        # A redelivered task for a step already sent is skipped
+        results.append(await follow_up_service.send(schedule.id, 0, session_factory=async_session_factory))
+        results.append(await follow_up_service.send(schedule.id, 1, session_factory=async_session_factory))
+        return results
+
+    results = asyncio.run(run())
+    assert [result["status"] for result in results] == ["sent", "skipped", "sent"]
+    assert outbox == [
+        ("john@example.com", "initial_thank_you for John Doe"),
+        ("john@example.com", "market_update for John Doe"),
+    ]
+
+    db.expire_all()
+    schedule = db.get(FollowUpSchedule, schedule.id)
+    assert schedule.status == FollowUpScheduleStatus.COMPLETED
+    assert schedule.step == 2
+    assert schedule.next_contact is None
+    assert db.query(Communication).filter(Communication.lead_id == lead.id).count() == 2
+    assert db.get(Lead, lead.id).last_contacted is not None
+
+def test_send_failure_backs_off_then_fails(db, async_session_factory, test_user, monkeypatch):
+    fake_delivery(monkeypatch, sent=False)
+    monkeypatch.setattr(follow_up_service, "max_attempts", 2)
+    lead = add_lead(db, test_user)
+    schedule = add_schedule(db, lead, ["initial_thank_you"], datetime.now(timezone.utc))
+
+    results = [
+        asyncio.run(follow_up_service.send(schedule.id, 0, session_factory=async_session_factory))
+        for _ in range(2)
+    ]
+    assert results == [{"status": "failed", "attempts": 1}, {"status": "failed", "attempts": 2}]
+
+    db.expire_all()
+    schedule = db.get(FollowUpSchedule, schedule.id)
+    assert schedule.status == FollowUpScheduleStatus.FAILED
+    assert schedule.last_error == "Email delivery failed"
+    assert schedule.next_contact is None
+    assert db.query(Communication).count() == 0
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from app.core.hashing import PasswordHasher
+
+def test_hashing_does_not_block_event_loop():
+    hasher = PasswordHasher(workers=2, max_queue=2, retry_after=1)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        hashed = await hasher.hash("testpassword123")
+        elapsed = time.perf_counter() - start
+        assert await hasher.verify("testpassword123", hashed)
+        task.cancel()
+        return ticks, elapsed
+
+    try:
+        ticks, elapsed = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    # The loop kept ticking while bcrypt ran
+    assert ticks >= int(elapsed / 0.01) // 2
+
+def test_saturated_pool_rejects_with_503():
+    hasher = PasswordHasher(workers=1, max_queue=1, retry_after=3)
+    rejected_before = hasher.rejected.value
+
+    async def scenario():
+        return await asyncio.gather(
+            *[hasher.hash("testpassword123") for _ in range(4)],
+            return_exceptions=True,
+        )
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    errors = [result for result in results if isinstance(result, HTTPException)]
+    assert len(errors) == 2
+    assert errors[0].status_code == 503
+    assert errors[0].headers["Retry-After"] == "3"
+    assert hasher.rejected.value - rejected_before == 2
+    assert hasher.in_flight == 0
@@ -0,0 +1,49 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from app.core.intervals import IntervalIndex, working_slots
+
+DAY = datetime(2024, 3, 4)
+HOUR = timedelta(hours=1)
+STEP = timedelta(minutes=30)
+
+def at(hour: float) -> datetime:
+    return DAY + timedelta(hours=hour)
+
+def test_overlap_is_half_open():
+    index = IntervalIndex()
+    index.add(at(10), at(11), "a")
+    index.add(at(13), at(14), "b")
+
+    assert index.is_free(at(11), at(13))
+    assert not index.is_free(at(10.5), at(11.5))
+    assert [key for _, _, key in index.overlapping(at(9), at(15))] == ["a", "b"]
+    with pytest.raises(ValueError):
+        index.add(at(13.5), at(15), "c")
+
+def test_remove_frees_the_interval():
+    index = IntervalIndex()
+    index.add(at(10), at(11), "a")
+    assert index.remove("a") == (at(10), at(11))
+    assert index.is_free(at(10), at(11))
+    assert "a" not in index
+
+def test_gaps_clip_to_window():
+    index = IntervalIndex()
+    index.add(at(8), at(9.5), "early")
+    index.add(at(12), at(13), "lunch")
+    assert list(index.gaps(at(9), at(17))) == [(at(9.5), at(12)), (at(13), at(17))]
+
+def test_working_slots_step_from_opening_time():
+    index = IntervalIndex()
+    index.add(at(9), at(10.25), "a")
+    slots = working_slots(index, DAY, DAY + timedelta(days=1), HOUR, STEP, time(9), time(12))
+    # The first boundary after 10:15 is 10:30, counted from the 9:00 opening
+    assert list(slots) == [(at(10.5), at(11.5)), (at(11), at(12))]
+
+def test_next_slot_skips_full_days():
+    index = IntervalIndex()
+    index.add(at(9), at(17), "all day")
+    slots = working_slots(index, at(8), at(8) + timedelta(days=3), 2 * HOUR, STEP, time(9), time(17))
+    assert next(slots) == (at(24 + 9), at(24 + 11))
@@ -0,0 +1,99 @@
+import json
+from fastapi import status
+from app.models.lead import Lead, LeadSource
+
+def test_import_leads_csv(authorized_client, db, test_user):
+    csv_data = (
+        "first_name,last_name,email,phone,source\n"
+        "John,Doe,john@example.com,+1234567890,zillow\n"
+        "Jane,Smith,,,\n"
+        ",Missing,missing@example.com,,\n"
+        "Bad,Source,,,carrier_pigeon\n"
+    )
+
+    response = authorized_client.post(
+        "/leads/import",
+        files={"file": ("leads.csv", csv_data, "text/csv")},
+        params={"batch_size": 2},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["failed"] == 2
+    assert [error["row"] for error in data["errors"]] == [4, 5]
+    assert data["errors"][0]["errors"][0]["field"] == "first_name"
+
+    leads = db.query(Lead).filter(Lead.user_id == test_user["id"]).all()
+    assert {lead.first_name for lead in leads} == {"John", "Jane"}
+    assert {lead.source for lead in leads} == {LeadSource.ZILLOW, LeadSource.OTHER}
+
+def test_import_leads_ndjson(authorized_client, db, test_user):
+    lines = [
+        json.dumps({"first_name": "John", "last_name": "Doe"}),
+        "not json",
+        json.dumps({"first_name": "Jane", "last_name": "Smith", "user_id": "00000000-0000-0000-0000-000000000000"}),
+    ]
+
+    response = authorized_client.post(
+        "/leads/import",
+        files={"file": ("leads.ndjson", "\n".join(lines), "application/x-ndjson")},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["failed"] == 1
+    assert data["errors"][0]["row"] == 2
+
+    # Imported leads always belong to the caller
+    assert db.query(Lead).filter(Lead.user_id == test_user["id"]).count() == 2
+
+def test_import_leads_reports_invalid_utf8_rows(authorized_client, db, test_user):
+    csv_data = b"first_name,last_name\nJohn,Doe\nJ\xffne,Smith\nJack,Doe\n"
+    response = authorized_client.post(
+        "/leads/import",
+        files={"file": ("leads.csv", csv_data, "text/csv")},
+        params={"batch_size": 1},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["errors"] == [{"row": 3, "errors": [{"field": None, "message": "Invalid UTF-8"}]}]
+
+    ndjson_data = b'{"first_name": "Jill", "last_name": "Doe"}\n{"first_name": "J\xffm"}\n'
+    response = authorized_client.post(
+        "/leads/import",
+        files={"file": ("leads.ndjson", ndjson_data, "application/x-ndjson")},
+    )
+    assert response.json()["imported"] == 1
+    assert response.json()["errors"][0]["row"] == 2
+
+def test_import_leads_unknown_format(authorized_client):
+    response = authorized_client.post(
+        "/leads/import",
+        files={"file": ("leads.xlsx", b"binary", "application/octet-stream")},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_export_leads_ndjson(authorized_client, db, test_user):
+    for first_name in ("John", "Jane"):
+        db.add(Lead(first_name=first_name, last_name="Doe", user_id=test_user["id"]))
+    db.add(Lead(first_name="Other", last_name="User", user_id="00000000-0000-0000-0000-000000000000"))
+    db.commit()
+
+    response = authorized_client.get("/leads/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {row["first_name"] for row in rows} == {"John", "Jane"}
+
+def test_export_leads_csv_gzip(authorized_client, db, test_user):
+    db.add(Lead(first_name="John", last_name="Doe", user_id=test_user["id"]))
+    db.commit()
+
+    response = authorized_client.get("/leads/export", params={"format": "csv", "compress": True})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    # The test client transparently decodes gzip bodies
+    header, row = response.text.splitlines()[:2]
+    assert header.split(",")[:2] == ["first_name", "last_name"]
+    assert row.startswith("John,Doe")
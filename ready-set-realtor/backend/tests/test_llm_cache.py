@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.core.llm_cache import LLMCache, completion_key
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **request):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        message = SimpleNamespace(content=f"reply {self.calls} to {request['messages'][-1]['content']}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+def fake_client() -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+def make_cache(**kwargs) -> LLMCache:
+    options = {"redis_url": None, "ttl": 60, "local_max_size": 100, "disabled_agents": []}
+    return LLMCache(**{**options, **kwargs})
+
+def ask(cache, client, prompt, agent="lead_generation", **kwargs):
+    return cache.complete(
+        agent,
+        client.chat.completions.create,
+        model="gpt-4",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=500,
+        **kwargs,
+    )
+
+def test_key_ignores_prompt_indentation():
+    indented = "\n        Qualify this lead:\n        Budget: 500k   \n        "
+    messages = [{"role": "user", "content": "Qualify this lead:\nBudget: 500k"}]
+    assert completion_key("gpt-4", [{"role": "user", "content": indented}], 0.7, 500) == (
+        completion_key("gpt-4", messages, 0.7, 500)
+    )
+    assert completion_key("gpt-4", messages, 0.7, 500) != completion_key("gpt-4", messages, 0.3, 500)
+
+def test_repeat_prompt_is_served_from_cache():
+    cache, client = make_cache(), fake_client()
+
+    async def run():
+        first = await ask(cache, client, "Qualify John")
+        second = await ask(cache, client, "Qualify John")
+        other = await ask(cache, client, "Qualify Jane")
+        return first, second, other
+
+    first, second, other = asyncio.run(run())
+    assert first == second == "reply 1 to Qualify John"
+    assert other == "reply 2 to Qualify Jane"
+    assert client.chat.completions.calls == 2
+    assert cache.hit_ratio() == 1 / 3
+
+def test_concurrent_misses_share_one_call():
+    cache, client = make_cache(), fake_client()
+
+    async def run():
+        return await asyncio.gather(*(ask(cache, client, "Qualify John") for _ in range(5)))
+
+    assert len(set(asyncio.run(run()))) == 1
+    assert client.chat.completions.calls == 1
+
+def test_cancelled_leader_does_not_fail_waiters():
+    cache, client = make_cache(), fake_client()
+
+    async def run():
+        leader = asyncio.create_task(ask(cache, client, "Qualify John"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(ask(cache, client, "Qualify John"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(run()) == "reply 2 to Qualify John"
+    assert client.chat.completions.calls == 2
+
+def test_disabled_agent_bypasses_cache():
+    cache, client = make_cache(disabled_agents=["follow_up"]), fake_client()
+
+    async def run():
+        await ask(cache, client, "Follow up with John", agent="follow_up")
+        await ask(cache, client, "Follow up with John", agent="follow_up")
+
+    asyncio.run(run())
+    assert client.chat.completions.calls == 2
+
+def test_unreachable_redis_falls_back_to_local_cache():
+    cache, client = make_cache(redis_url="redis://127.0.0.1:1/0", redis_timeout=0.1), fake_client()
+    errors = cache.redis_errors.value
+
+    async def run():
+        await ask(cache, client, "Qualify John")
+        await ask(cache, client, "Qualify John")
+        await cache.close()
+
+    asyncio.run(run())
+    assert client.chat.completions.calls == 1
+    # Redis is skipped after the first failure until the retry window passes
+    assert cache.redis_errors.value == errors + 1
+
+def test_finished_stream_is_cached_for_both_paths():
+    cache, client = make_cache(), fake_client()
+    streams = 0
+
+    async def create_stream(**request):
+        nonlocal streams
+        streams += 1
+        for delta in ("Hi ", "John"):
+            yield delta
+
+    async def run():
+        request = {"model": "gpt-4", "messages": [{"role": "user", "content": "Greet John"}], "temperature": 0.7, "max_tokens": 500}
+        first = [delta async for delta in cache.stream("follow_up", create_stream, **request)]
+        second = [delta async for delta in cache.stream("follow_up", create_stream, **request)]
+        completed = await cache.complete("follow_up", client.chat.completions.create, **request)
+        return first, second, completed
+
+    first, second, completed = asyncio.run(run())
+    assert first == ["Hi ", "John"]
+    assert second == ["Hi John"]
+    assert completed == "Hi John"
+    assert streams == 1
+    assert client.chat.completions.calls == 0
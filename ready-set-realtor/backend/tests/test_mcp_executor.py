@@ -0,0 +1,179 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.agents.follow_up_agent import FollowUpAgent
+from app.agents.lead_generation_agent import LeadGenerationAgent
+from app.mcp.core import AgentState, AgentTask, AgentType, MCPController
+from app.mcp.executor import QueueFullError, TaskExecutor
+
+def make_task(task_type: str, dependencies=(), **context) -> AgentTask:
+    return AgentTask(
+        task_type=task_type,
+        context=context,
+        dependencies=[str(task.task_id) for task in dependencies],
+    )
+
+@pytest.fixture
+def agent_calls(monkeypatch):
+    """
+    Replace the agent methods with fakes that record calls and wait on `gate`.
+    """
+    state = {"calls": [], "gate": None}
+
+    async def qualify_lead(self, lead_data):
+        state["calls"].append(("qualify_lead", lead_data["name"]))
+        assert self.context.state == AgentState.BUSY
+        if state["gate"] is not None:
+            await state["gate"].wait()
+        if lead_data.get("fail"):
+            raise RuntimeError("model unavailable")
+        return {"qualification_status": "Qualified"}
+
+    async def create_follow_up_schedule(self, lead_id, lead_data):
+        state["calls"].append(("create_follow_up_schedule", lead_id))
+        return {"lead_id": lead_id, "status": "active"}
+
+    monkeypatch.setattr(LeadGenerationAgent, "qualify_lead", qualify_lead)
+    monkeypatch.setattr(FollowUpAgent, "create_follow_up_schedule", create_follow_up_schedule)
+    return state
+
+def test_runs_tasks_in_dependency_order_across_agent_types(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=2, max_queued=10)
+        await executor.start()
+        try:
+            qualify = make_task("qualify_lead", lead_data={"name": "ann"})
+            follow_up = make_task(
+                "create_follow_up_schedule", dependencies=[qualify],
+                lead_id="ann", lead_data={"status": "qualified"},
+            )
+            futures = [await executor.submit(qualify), await executor.submit(follow_up)]
+            results = await asyncio.gather(*futures)
+        finally:
+            await executor.close()
+
+        assert results == [{"qualification_status": "Qualified"}, {"lead_id": "ann", "status": "active"}]
+        assert agent_calls["calls"] == [("qualify_lead", "ann"), ("create_follow_up_schedule", "ann")]
+        assert all(agent.state == AgentState.READY for agent in executor.controller.agents.values())
+        stats = executor.snapshot()
+        assert stats["lead_generation"]["queued"] == 0
+        assert stats["follow_up"]["queued"] == 0
+
+    asyncio.run(scenario())
+
+def test_full_queue_rejects_or_waits(agent_calls):
+    async def scenario():
+        agent_calls["gate"] = asyncio.Event()
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=2)
+        await executor.start()
+        try:
+            first = await executor.submit(make_task("qualify_lead", lead_data={"name": "ann"}))
+            await executor.submit(make_task("qualify_lead", lead_data={"name": "bob"}))
+            with pytest.raises(QueueFullError):
+                await executor.submit(make_task("qualify_lead", lead_data={"name": "cat"}), wait=False)
+            with pytest.raises(QueueFullError):
+                await executor.submit(make_task("qualify_lead", lead_data={"name": "cat"}), timeout=0.01)
+
+            waiting = asyncio.create_task(executor.run(make_task("qualify_lead", lead_data={"name": "dan"})))
+            await asyncio.sleep(0.01)
+            assert not waiting.done()
+
+            agent_calls["gate"].set()
+            await first
+            assert await waiting == {"qualification_status": "Qualified"}
+        finally:
+            await executor.close()
+
+        assert [name for _, name in agent_calls["calls"]] == ["ann", "bob", "dan"]
+
+    asyncio.run(scenario())
+
+def test_failure_cancels_dependents(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=10)
+        await executor.start()
+        try:
+            qualify = make_task("qualify_lead", lead_data={"name": "ann", "fail": True})
+            follow_up = make_task(
+                "create_follow_up_schedule", dependencies=[qualify],
+                lead_id="ann", lead_data={"status": "qualified"},
+            )
+            failed = await executor.submit(qualify)
+            skipped = await executor.submit(follow_up)
+            with pytest.raises(RuntimeError):
+                await failed
+            with pytest.raises(asyncio.CancelledError):
+                await skipped
+        finally:
+            await executor.close()
+
+        assert executor.snapshot()["follow_up"]["queued"] == 0
+        assert executor.controller.task_queue.counts()["failed"] == 1
+
+    asyncio.run(scenario())
+
+def test_unknown_task_type_is_rejected(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=10)
+        await executor.start()
+        try:
+            with pytest.raises(ValueError):
+                await executor.submit(make_task("paint_house"))
+        finally:
+            await executor.close()
+
+    asyncio.run(scenario())
+
+def test_scheduler_tasks_are_not_routed(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=10)
+        await executor.start()
+        try:
+            # Its methods read a calendar no worker's agent has loaded
+            with pytest.raises(ValueError):
+                await executor.submit(make_task("find_available_slots", date="2024-03-04T00:00:00+00:00"))
+        finally:
+            await executor.close()
+
+        assert AgentType.SCHEDULER not in {context.agent_type for context in executor.controller.agents.values()}
+        assert executor.snapshot()["scheduler"]["waiting_for_worker"] == 0
+
+    asyncio.run(scenario())
+
+def test_tasks_needing_state_from_an_earlier_task_are_not_routed(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=10)
+        await executor.start()
+        try:
+            # The transaction would be gone by then: workers reset their agent after every task
+            create = make_task("create_transaction", transaction_data={"transaction_id": str(uuid4())})
+            await executor.submit(create)
+            with pytest.raises(ValueError):
+                await executor.submit(make_task(
+                    "update_milestone", dependencies=[create],
+                    transaction_id=create.context["transaction_data"]["transaction_id"],
+                    milestone_name="closing", status="completed",
+                ))
+        finally:
+            await executor.close()
+
+    asyncio.run(scenario())
+
+def test_unroutable_task_on_the_controller_is_failed(agent_calls):
+    async def scenario():
+        executor = TaskExecutor(MCPController(), workers=1, max_queued=10)
+        await executor.start()
+        try:
+            await executor.controller.submit_task(make_task("paint_house"))
+            executor._dispatch()
+            assert len(executor._failing) == 1
+            await asyncio.gather(*executor._failing)
+        finally:
+            await executor.close()
+
+        assert executor.controller.task_queue.counts()["failed"] == 1
+        assert not executor._failing
+
+    asyncio.run(scenario())
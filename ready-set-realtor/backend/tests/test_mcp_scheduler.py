@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.mcp.core import AgentState, AgentTask, AgentType, MCPController
+from app.mcp.scheduler import TaskScheduler, TaskStatus
+
+NOW = datetime(2024, 3, 4, 9)
+
+def make_task(priority: int = 1, deadline=None, dependencies=()) -> AgentTask:
+    return AgentTask(
+        task_type="follow_up",
+        priority=priority,
+        context={},
+        dependencies=[str(task.task_id) for task in dependencies],
+        deadline=deadline,
+    )
+
+def drain(scheduler: TaskScheduler):
+    popped = []
+    while (task := scheduler.pop()) is not None:
+        popped.append(task)
+    return popped
+
+def test_pops_by_deadline_then_priority():
+    scheduler = TaskScheduler()
+    late = make_task(deadline=NOW + timedelta(hours=2))
+    whenever = make_task(priority=10)
+    soon = make_task(deadline=NOW + timedelta(hours=1))
+    soon_urgent = make_task(priority=5, deadline=NOW + timedelta(hours=1))
+    for task in (late, whenever, soon, soon_urgent):
+        assert scheduler.submit(task) == TaskStatus.READY
+
+    assert drain(scheduler) == [soon_urgent, soon, late, whenever]
+    assert all(task.status == TaskStatus.RUNNING for task in (late, whenever, soon, soon_urgent))
+
+def test_dependents_wait_for_every_prerequisite():
+    scheduler = TaskScheduler()
+    first, second = make_task(), make_task()
+    scheduler.submit(first)
+    scheduler.submit(second)
+    report = make_task(priority=99, dependencies=[first, second])
+    assert scheduler.submit(report) == TaskStatus.PENDING
+
+    assert drain(scheduler) == [first, second]
+    assert scheduler.blocked_on(report.task_id) == [first.task_id, second.task_id]
+    assert scheduler.complete(first.task_id) == []
+    assert scheduler.complete(second.task_id) == [report]
+    assert scheduler.pop() is report
+
+    # Completed prerequisites no longer hold anything back
+    summary = make_task(dependencies=[first])
+    assert scheduler.submit(summary) == TaskStatus.READY
+
+def test_invalid_dependencies_are_rejected():
+    scheduler = TaskScheduler()
+    with pytest.raises(ValueError):
+        scheduler.submit(make_task(dependencies=[make_task()]))
+
+    task = make_task()
+    task.dependencies = [str(task.task_id)]
+    with pytest.raises(ValueError):
+        scheduler.submit(task)
+
+def test_cancel_and_failure_cascade_to_dependents():
+    scheduler = TaskScheduler()
+    root, other = make_task(), make_task()
+    scheduler.submit(root)
+    scheduler.submit(other)
+    child = make_task(dependencies=[root])
+    grandchild = make_task(dependencies=[child, other])
+    scheduler.submit(child)
+    scheduler.submit(grandchild)
+
+    assert scheduler.cancel(root.task_id) == [root, child, grandchild]
+    assert drain(scheduler) == [other]
+    assert scheduler.complete(other.task_id) == []
+    assert len(scheduler) == 0
+    with pytest.raises(ValueError):
+        scheduler.submit(make_task(dependencies=[root]))
+
+    parent = make_task()
+    scheduler.submit(parent)
+    waiting = make_task(dependencies=[parent])
+    scheduler.submit(waiting)
+    scheduler.pop()
+    assert scheduler.fail(parent.task_id) == [waiting]
+    assert scheduler.counts()["cancelled"] == 4
+    assert scheduler.counts()["failed"] == 1
+
+def test_prune_forgets_finished_tasks():
+    scheduler = TaskScheduler()
+    tasks = [make_task() for _ in range(3)]
+    for task in tasks:
+        scheduler.submit(task)
+    scheduler.cancel(tasks[1].task_id)
+    scheduler.complete(scheduler.pop().task_id)
+
+    assert scheduler.prune() == 2
+    assert tasks[0].task_id not in scheduler
+    assert drain(scheduler) == [tasks[2]]
+
+def test_controller_hands_out_submitted_tasks():
+    async def scenario():
+        controller = MCPController()
+        task = make_task()
+        await controller.submit_task(task)
+
+        assert await controller.next_task() is task
+        assert await controller.complete_task(task.task_id) == []
+        assert await controller.next_task() is None
+
+    asyncio.run(scenario())
+
+def test_finishing_an_assigned_task_frees_its_agent():
+    async def scenario():
+        controller = MCPController()
+        agent = await controller.create_agent(AgentType.FOLLOW_UP, ["generate_follow_up_message"])
+        await controller.update_agent_state(agent.agent_id, AgentState.READY)
+        task = make_task()
+
+        assert await controller.assign_task(agent.agent_id, task)
+        assert agent.state == AgentState.BUSY
+        assert await controller.next_task() is task
+        await controller.complete_task(task.task_id)
+        assert agent.state == AgentState.READY
+
+    asyncio.run(scenario())
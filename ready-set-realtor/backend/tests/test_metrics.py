@@ -0,0 +1,46 @@
+import pytest
+from fastapi import status
+
+from app.core.metrics import MetricsRegistry
+from app.core.security import create_access_token
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("wait_seconds", "Wait time", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    snapshot = registry.snapshot()["wait_seconds"]
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+
+def test_gauge_reads_callback_at_snapshot_time():
+    registry = MetricsRegistry()
+    values = iter([1, 2])
+    registry.gauge("in_use", "Connections in use", lambda: next(values))
+
+    assert registry.snapshot()["in_use"]["value"] == 1
+    assert registry.snapshot()["in_use"]["value"] == 2
+
+def test_register_returns_existing_metric():
+    registry = MetricsRegistry()
+    counter = registry.counter("timeouts_total", "Timeouts")
+    counter.inc()
+
+    assert registry.counter("timeouts_total", "Timeouts") is counter
+    with pytest.raises(ValueError):
+        registry.histogram("timeouts_total", "Timeouts")
+
+def test_metrics_endpoint_requires_an_admin(client, authorized_client):
+    assert client.get("/metrics", headers={"Authorization": ""}).status_code == status.HTTP_401_UNAUTHORIZED
+    # The test user is an agent
+    assert authorized_client.get("/metrics").status_code == status.HTTP_403_FORBIDDEN
+
+def test_metrics_endpoint_reports_pool_wait_time(client, test_user):
+    token = create_access_token(data={"sub": str(test_user["id"]), "email": test_user["email"], "role": "admin"})
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["db_pool_wait_seconds"]["type"] == "histogram"
+    assert data["db_pool_timeouts_total"]["type"] == "counter"
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from app.core.rate_limit import TokenBucket
+from app.services.openai_service import OpenAIService, estimate_tokens, retry_after_seconds
+
+def rate_limit_error(headers) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+def completion(total_tokens: int) -> SimpleNamespace:
+    message = SimpleNamespace(content="ok")
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=SimpleNamespace(total_tokens=total_tokens))
+
+def make_service(create) -> OpenAIService:
+    service = OpenAIService()
+    service._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return service
+
+def test_token_bucket_spaces_out_bursts():
+    # 6,000 per minute with no burst allowance: one token every 10ms
+    bucket = TokenBucket(6000, capacity=1)
+
+    async def run():
+        started = time.perf_counter()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.perf_counter() - started
+
+    assert asyncio.run(run()) >= 0.045
+
+def test_token_bucket_pause_blocks_acquisitions():
+    bucket = TokenBucket(60000)
+    bucket.pause(0.05)
+
+    assert asyncio.run(bucket.acquire()) >= 0.045
+
+def test_retry_after_parsing():
+    assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+    assert retry_after_seconds({"retry-after": "2"}) == 2
+    assert retry_after_seconds({}) is None
+
+def test_estimate_includes_completion_budget():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_tokens(messages, 500) == 100 + 4 + 500
+
+def test_rate_limited_call_waits_for_retry_after():
+    calls = []
+
+    async def create(**request):
+        calls.append(time.perf_counter())
+        if len(calls) == 1:
+            raise rate_limit_error({"retry-after-ms": "50"})
+        return completion(total_tokens=20)
+
+    service = make_service(create)
+    response = asyncio.run(service.chat_completion(
+        model="gpt-4", messages=[{"role": "user", "content": "Hi"}], max_tokens=100
+    ))
+
+    assert response.choices[0].message.content == "ok"
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.045
+
+def test_insufficient_quota_is_not_retried():
+    calls = 0
+
+    async def create(**request):
+        nonlocal calls
+        calls += 1
+        error = rate_limit_error({"retry-after": "1"})
+        error.code = "insufficient_quota"
+        raise error
+
+    service = make_service(create)
+    try:
+        asyncio.run(service.chat_completion(model="gpt-4", messages=[]))
+    except openai.RateLimitError:
+        pass
+    assert calls == 1
+
+def test_concurrency_is_capped(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def create(**request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return completion(total_tokens=10)
+
+    service = make_service(create)
+    service.semaphore = asyncio.Semaphore(3)
+
+    async def run():
+        await asyncio.gather(*(
+            service.chat_completion(model="gpt-4", messages=[{"role": "user", "content": "Hi"}])
+            for _ in range(10)
+        ))
+
+    asyncio.run(run())
+    assert peak == 3
+
+class FakeStream:
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.closed = False
+        self.response = SimpleNamespace(aclose=self.aclose)
+
+    async def aclose(self):
+        self.closed = True
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+def test_stream_retries_rate_limit_before_first_token():
+    calls = 0
+    streams = []
+
+    async def create(stream=False, **request):
+        nonlocal calls
+        calls += 1
+        assert stream
+        if calls == 1:
+            raise rate_limit_error({"retry-after-ms": "10"})
+        streams.append(FakeStream(["Hello", None, " there"]))
+        return streams[-1]
+
+    service = make_service(create)
+
+    async def run():
+        return [delta async for delta in service.stream_chat_completion(model="gpt-4", messages=[])]
+
+    assert asyncio.run(run()) == ["Hello", " there"]
+    assert calls == 2
+    assert streams[0].closed
+    assert service.in_flight == 0
+
+def test_abandoned_stream_releases_connection():
+    stream = FakeStream(["a", "b", "c"])
+
+    async def create(**request):
+        return stream
+
+    service = make_service(create)
+
+    async def run():
+        deltas = service.stream_chat_completion(model="gpt-4", messages=[])
+        first = await deltas.__anext__()
+        await deltas.aclose()
+        return first
+
+    assert asyncio.run(run()) == "a"
+    assert stream.closed
+    assert service.in_flight == 0
@@ -0,0 +1,74 @@
+import asyncio
+from uuid import UUID
+from fastapi import status
+from app.agents.lead_generation_agent import LeadGenerationAgent
+from app.models.lead import Lead, LeadStatus
+from app.models.qualification_job import QualificationJob, QualificationJobStatus
+from app.services.qualification_service import next_status, qualification_service
+from app import tasks
+
+def test_next_status_never_demotes_later_stages():
+    qualified = {"qualification_status": "Qualified"}
+    unqualified = {"qualification_status": "Not Qualified"}
+    assert next_status(LeadStatus.NEW, qualified) == LeadStatus.QUALIFIED
+    assert next_status(LeadStatus.QUALIFIED, unqualified) == LeadStatus.CONTACTED
+    assert next_status(LeadStatus.NEGOTIATING, unqualified) == LeadStatus.NEGOTIATING
+
+def test_create_qualification_job(authorized_client, db, test_user, monkeypatch):
+    queued = []
+    monkeypatch.setattr(tasks.qualify_leads, "delay", queued.append)
+    leads = [Lead(first_name=name, last_name="Doe", user_id=test_user["id"]) for name in ("John", "Jane")]
+    db.add_all(leads)
+    db.commit()
+
+    response = authorized_client.post(
+        "/leads/qualification-jobs",
+        json={"lead_ids": [str(lead.id) for lead in leads]},
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["total"] == 2
+    assert data["progress"] == 0
+    assert queued == [data["id"]]
+
+    response = authorized_client.get(f"/leads/qualification-jobs/{data['id']}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == data["id"]
+
+def test_create_qualification_job_rejects_ids_and_statuses(authorized_client):
+    response = authorized_client.post(
+        "/leads/qualification-jobs",
+        json={"lead_ids": ["123e4567-e89b-12d3-a456-426614174001"], "statuses": ["new"]},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_run_job_writes_back_in_batches(db, async_session_factory, test_user, monkeypatch):
+    async def qualify_lead(self, lead_data):
+        if "fail" in lead_data["conversation_history"]:
+            raise RuntimeError("model unavailable")
+        return {"qualification_status": "Qualified", "qualified_at": "2024-01-01T00:00:00"}
+
+    monkeypatch.setattr(LeadGenerationAgent, "qualify_lead", qualify_lead)
+    monkeypatch.setattr(qualification_service, "batch_size", 2)
+
+    for name, notes in (("John", None), ("Jane", None), ("Jack", "fail"), ("Jill", None), ("Jim", None)):
+        db.add(Lead(first_name=name, last_name="Doe", user_id=test_user["id"], notes=notes))
+    db.add(Lead(first_name="Closed", last_name="Doe", user_id=test_user["id"], status=LeadStatus.CLOSED))
+    db.commit()
+
+    async def run():
+        async with async_session_factory() as session:
+            job = await qualification_service.create_job(session, UUID(test_user["id"]), statuses=[LeadStatus.NEW])
+        return job.id, await qualification_service.run_job(job.id, session_factory=async_session_factory)
+
+    job_id, summary = asyncio.run(run())
+    assert summary == {"status": "completed", "total": 5, "processed": 5, "qualified": 4, "failed": 1}
+
+    job = db.get(QualificationJob, job_id)
+    assert job.status == QualificationJobStatus.COMPLETED
+    assert job.finished_at is not None
+    statuses = {lead.first_name: lead.status for lead in db.query(Lead).all()}
+    assert statuses["John"] == LeadStatus.QUALIFIED
+    assert statuses["Jack"] == LeadStatus.NEW
+    assert statuses["Closed"] == LeadStatus.CLOSED
@@ -0,0 +1,136 @@
+"""
+Query-plan regression suite for the per-user router queries.
+
+Each query the routers issue is EXPLAINed and the test fails if the planner
+falls back to a sequential scan. Runs against DATABASE_URL when it points at
+PostgreSQL (as in CI) and against the SQLite test database otherwise.
+"""
+import os
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import bindparam, create_engine, select, text
+
+from app.core.database import Base
+from app.core.pagination import encode_cursor, keyset_query
+from app.models.appointment import Appointment
+from app.models.communication import Communication
+from app.models.document import Document
+from app.models.lead import Lead
+from app.models.transaction import Transaction, TransactionMilestone
+from app.models.user import User
+from app.services.availability_service import availability_service
+from app.services.follow_up_service import follow_up_service
+from app.services.transaction_service import transaction_service
+
+USER_ID = uuid4()
+LEAD_ID = uuid4()
+ROW_ID = uuid4()
+CURSOR = encode_cursor(datetime(2024, 1, 1), uuid4())
+PAGE_SIZE = 100
+
+EXPLAIN_PREFIX = {
+    "postgresql": "EXPLAIN",
+    "sqlite": "EXPLAIN QUERY PLAN",
+}
+
+ROUTER_QUERIES = {
+    "auth.login": select(User).where(User.email == "agent@example.com"),
+    "leads.list": keyset_query(
+        select(Lead).where(Lead.user_id == USER_ID), Lead, None, PAGE_SIZE
+    ),
+    "leads.list_next_page": keyset_query(
+        select(Lead).where(Lead.user_id == USER_ID), Lead, CURSOR, PAGE_SIZE
+    ),
+    "leads.get": select(Lead).where(Lead.id == ROW_ID, Lead.user_id == USER_ID),
+    "communications.list": keyset_query(
+        select(Communication).where(Communication.user_id == USER_ID), Communication, None, PAGE_SIZE
+    ),
+    "communications.list_next_page": keyset_query(
+        select(Communication).where(Communication.user_id == USER_ID), Communication, CURSOR, PAGE_SIZE
+    ),
+    "communications.get": select(Communication).where(
+        Communication.id == ROW_ID, Communication.user_id == USER_ID
+    ),
+    "documents.list": keyset_query(
+        select(Document).where(Document.user_id == USER_ID), Document, None, PAGE_SIZE
+    ),
+    "documents.list_by_lead": keyset_query(
+        select(Document).where(Document.user_id == USER_ID, Document.lead_id == LEAD_ID),
+        Document, CURSOR, PAGE_SIZE
+    ),
+    "documents.get": select(Document).where(Document.id == ROW_ID, Document.user_id == USER_ID),
+    "appointments.availability": availability_service.booked_query(
+        USER_ID, datetime(2024, 1, 1, 9), datetime(2024, 1, 8)
+    ),
+    "appointments.list": select(Appointment).where(
+        Appointment.user_id == USER_ID,
+        Appointment.start_time >= datetime(2024, 1, 1),
+        Appointment.start_time < datetime(2024, 1, 8),
+    ).order_by(Appointment.start_time),
+    "follow_ups.due": follow_up_service.due_query(datetime(2024, 1, 1), PAGE_SIZE),
+    "transactions.get": select(Transaction).where(Transaction.id == ROW_ID, Transaction.user_id == USER_ID),
+    "transactions.milestones": select(TransactionMilestone).where(
+        TransactionMilestone.transaction_id == ROW_ID
+    ).order_by(TransactionMilestone.due_date),
+    "transactions.milestone_by_key": transaction_service.milestone_query(ROW_ID, "inspection_period"),
+    "transactions.milestones_due": transaction_service.due_query(
+        datetime(2024, 1, 1), user_id=USER_ID, limit=PAGE_SIZE
+    ),
+    "transactions.milestones_due_all_users": transaction_service.due_query(datetime(2024, 1, 1), limit=PAGE_SIZE),
+    "transactions.milestones_overdue": transaction_service.overdue_query(
+        datetime(2024, 1, 1), user_id=USER_ID, limit=PAGE_SIZE
+    ),
+    "transactions.milestones_at_risk": transaction_service.at_risk_query(
+        datetime(2024, 1, 1), user_id=USER_ID, limit=PAGE_SIZE
+    ),
+    "webhooks.docusign": select(Document).where(Document.docusign_id == "envelope-id"),
+}
+
+@pytest.fixture
+def plan_engine(db):
+    url = os.getenv("DATABASE_URL", "")
+    if not url.startswith("postgresql"):
+        yield db.get_bind()
+        return
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+def explain(connection, statement) -> list:
+    """
+    Return the plan lines for a statement, keeping its typed bind parameters.
+
+    IN lists are expanded first; each expanded name (status_1_2) takes the
+    type of the parameter it came from (status_1).
+    """
+    compiled = statement.compile(compile_kwargs={"render_postcompile": True})
+    types = {name: bind.type for bind, name in compiled.bind_names.items()}
+    explained = text(f"{EXPLAIN_PREFIX[connection.dialect.name]} {compiled}").bindparams(*[
+        bindparam(name, value, type_=types.get(name, types.get(name.rsplit("_", 1)[0])))
+        for name, value in compiled.params.items()
+    ])
+
+    if connection.dialect.name == "postgresql":
+        # Empty test tables make a seq scan the cheapest plan; forbid it so
+        # the planner shows whether a usable index exists at all.
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        return [row[0] for row in connection.execute(explained)]
+    return [row[-1] for row in connection.execute(explained)]
+
+def sequential_scans(dialect: str, plan: list) -> list:
+    if dialect == "postgresql":
+        return [line for line in plan if "Seq Scan" in line]
+    return [line for line in plan if line.startswith("SCAN ") and " USING " not in line]
+
+@pytest.mark.parametrize("name", sorted(ROUTER_QUERIES))
+def test_router_query_uses_index(plan_engine, name):
+    with plan_engine.begin() as connection:
+        plan = explain(connection, ROUTER_QUERIES[name])
+
+    scans = sequential_scans(plan_engine.dialect.name, plan)
+    assert not scans, f"{name} falls back to a sequential scan:\n" + "\n".join(plan)
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.cache import TTLCache
+from app.core.security import (
+    add_revocation_check,
+    create_access_token,
+    get_current_user,
+    invalidate_token,
+    token_cache,
+)
+
+@pytest.fixture(autouse=True)
+def clean_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+    security.revocation_checks.clear()
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    now = [1000.0]
+    cache = TTLCache(max_size=2, clock=lambda: now[0])
+    cache.set("a", 1, expires_at=1010)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+
+    # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    now[0] = 1010.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+def test_repeat_requests_skip_jwt_decode(monkeypatch, test_user_token, test_user):
+    first = asyncio.run(get_current_user(test_user_token))
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token should have been served from the cache")
+
+    monkeypatch.setattr(security.jwt, "decode", fail_decode)
+    second = asyncio.run(get_current_user(test_user_token))
+
+    assert second == first
+    assert str(second.user_id) == test_user["id"]
+
+def test_expired_token_is_not_served_from_cache(test_user):
+    token = create_access_token(
+        data={"sub": test_user["id"], "email": test_user["email"], "role": test_user["role"]},
+        expires_delta=timedelta(seconds=-1),
+    )
+    with pytest.raises(HTTPException):
+        asyncio.run(get_current_user(token))
+    assert len(token_cache) == 0
+
+def test_revocation_check_applies_to_cached_tokens(test_user_token, test_user):
+    asyncio.run(get_current_user(test_user_token))
+    assert len(token_cache) == 1
+
+    revoked = set()
+
+    async def check(claims):
+        return claims["sub"] in revoked
+
+    add_revocation_check(check)
+    asyncio.run(get_current_user(test_user_token))
+
+    revoked.add(test_user["id"])
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_current_user(test_user_token))
+    assert exc_info.value.status_code == 401
+    assert len(token_cache) == 0
+
+def test_invalidate_token(test_user_token):
+    asyncio.run(get_current_user(test_user_token))
+    invalidate_token(test_user_token)
+    assert len(token_cache) == 0
@@ -0,0 +1,67 @@
+import pytest
+
+from app.core.templating import (
+    CompiledTemplate,
+    MissingFieldError,
+    TemplateError,
+    compile_template,
+)
+
+def test_render_matches_str_format_for_plain_fields():
+    source = "Price: ${price} for {address}, listed {days:d} days"
+    context = {"price": "450,000", "address": "1 Main Street", "days": 12}
+    assert compile_template(source).render(context) == source.format(**context)
+
+def test_compiled_templates_are_cached():
+    assert compile_template("Hello {name}") is compile_template("Hello {name}")
+
+def test_field_sets():
+    template = compile_template(
+        "{greeting} {lead.name}{#if vip}, {tier} member{/if}{#each homes}{address}{/each}"
+    )
+    assert template.fields == {"greeting", "lead", "vip", "tier", "homes"}
+    # Fields inside sections are optional
+    assert template.required_fields == {"greeting", "lead"}
+    assert template.missing({"greeting": "Hi"}) == {"lead"}
+
+def test_conditional_sections():
+    template = compile_template("{#if financing}Financed by {lender}{#else}Cash offer{/if}")
+    assert template.render({"financing": True, "lender": "Acme Bank"}) == "Financed by Acme Bank"
+    assert template.render({"financing": False}) == "Cash offer"
+    assert template.render({}) == "Cash offer"
+
+def test_repeated_sections():
+    template = compile_template("{#each homes}{address} (${price:,}) for {lead}; {/each}{#each tags}#{this} {/each}")
+    context = {
+        "lead": "John",
+        "homes": [{"address": "1 Main", "price": 450000}, {"address": "2 Oak", "price": 525000}],
+        "tags": ["pool", "garage"],
+    }
+    assert template.render(context) == "1 Main ($450,000) for John; 2 Oak ($525,000) for John; #pool #garage "
+
+def test_escaped_braces_and_dotted_paths():
+    template = compile_template("{{literal}} {lead.name}")
+    assert template.render({"lead": {"name": "John"}}) == "{literal} John"
+
+def test_missing_field_raises():
+    with pytest.raises(MissingFieldError) as exc_info:
+        compile_template("Dear {lead_name}").render({})
+    assert exc_info.value.field == "lead_name"
+    # Callers that expected str.format's KeyError keep working
+    assert isinstance(exc_info.value, KeyError)
+
+def test_render_partial_keeps_unknown_placeholders():
+    template = compile_template("Thanks for viewing {property_address}. I enjoyed {highlights}.")
+    assert template.render_partial({"property_address": "1 Main"}) == (
+        "Thanks for viewing 1 Main. I enjoyed {highlights}."
+    )
+
+@pytest.mark.parametrize("source", [
+    "{#if open}never closed",
+    "{/each}",
+    "{#each homes}{#else}{/each}",
+    "{not a field}",
+])
+def test_invalid_templates(source):
+    with pytest.raises(TemplateError):
+        CompiledTemplate(source)
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from app.agents.transaction_coordinator_agent import TransactionCoordinatorAgent
+from app.mcp.core import AgentContext, AgentType
+from app.models.transaction import MilestoneStatus, Transaction, TransactionMilestone
+
+def add_transaction(db, user_id, milestones) -> Transaction:
+    transaction = Transaction(id=uuid4(), user_id=user_id, property_address="123 Main St", details={})
+    db.add(transaction)
+    db.flush()
+    for key, due_in, milestone_status in milestones:
+        db.add(TransactionMilestone(
+            transaction_id=transaction.id,
+            user_id=user_id,
+            key=key,
+            name=key.replace("_", " ").title(),
+            due_date=datetime.now(timezone.utc) + due_in,
+            status=milestone_status,
+        ))
+    db.commit()
+    return transaction
+
+def test_create_transaction_and_update_milestone(authorized_client):
+    response = authorized_client.post(
+        "/transactions", json={"property_address": "123 Main St", "details": {"purchase_price": 450000}}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    transaction = response.json()
+    assert [milestone["key"] for milestone in transaction["milestones"]] == [
+        "contract_signed", "earnest_money_deposited", "inspection_period", "loan_approval", "closing",
+    ]
+    assert all(milestone["status"] == "pending" for milestone in transaction["milestones"])
+
+    response = authorized_client.patch(
+        f"/transactions/{transaction['id']}/milestones/inspection_period", json={"status": "completed"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "completed"
+    assert response.json()["completed_at"] is not None
+
+    response = authorized_client.patch(
+        f"/transactions/{transaction['id']}/milestones/appraisal", json={"status": "completed"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = authorized_client.get(f"/transactions/{transaction['id']}")
+    statuses = {milestone["key"]: milestone["status"] for milestone in response.json()["milestones"]}
+    assert statuses["inspection_period"] == "completed"
+    assert statuses["closing"] == "pending"
+
+def test_deadline_views(authorized_client, db, test_user):
+    add_transaction(db, test_user["id"], [
+        ("contract_signed", timedelta(days=-2), MilestoneStatus.COMPLETED),
+        ("earnest_money_deposited", timedelta(hours=-3), MilestoneStatus.IN_PROGRESS),
+        ("inspection_period", timedelta(hours=30), MilestoneStatus.PENDING),
+        ("loan_approval", timedelta(hours=6), MilestoneStatus.IN_PROGRESS),
+        ("closing", timedelta(days=20), MilestoneStatus.PENDING),
+    ])
+    # Another agent's deal never shows up
+    add_transaction(db, uuid4(), [("closing", timedelta(hours=1), MilestoneStatus.PENDING)])
+
+    def keys(path, **params):
+        response = authorized_client.get(path, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        return [milestone["key"] for milestone in response.json()]
+
+    assert keys("/transactions/milestones/due") == ["loan_approval", "inspection_period"]
+    assert keys("/transactions/milestones/due", within_hours=12) == ["loan_approval"]
+    assert keys("/transactions/milestones/overdue") == ["earnest_money_deposited"]
+    assert keys("/transactions/milestones/at-risk") == ["inspection_period"]
+    assert keys("/transactions/milestones/due", within_hours=24 * 30, limit=1) == ["loan_approval"]
+
+def test_agent_updates_milestone_by_key_or_name():
+    agent = TransactionCoordinatorAgent(AgentContext(
+        agent_type=AgentType.TRANSACTION_COORDINATOR, capabilities=["document_generation"], tools=[]
+    ))
+    transaction_id = uuid4()
+
+    async def scenario():
+        await agent.create_transaction({"transaction_id": str(transaction_id)})
+        await agent.update_milestone(transaction_id, "Loan Approval", "completed")
+        transaction = await agent.update_milestone(transaction_id, "closing", "in_progress")
+        with pytest.raises(ValueError):
+            await agent.update_milestone(transaction_id, "Appraisal", "completed")
+        return transaction
+
+    transaction = asyncio.run(scenario())
+    milestones = transaction["milestones_by_key"]
+    assert milestones["loan_approval"].status == "completed"
+    assert milestones["loan_approval"].completed_at is not None
+    assert milestones["closing"].status == "in_progress"
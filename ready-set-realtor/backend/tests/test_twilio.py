@@ -0,0 +1,51 @@
+import asyncio
+
+from twilio.base.exceptions import TwilioRestException
+
+from app.services.twilio_service import TwilioService
+
+def test_send_sms_many_caps_concurrency_and_reports_failures(monkeypatch):
+    service = TwilioService()
+    in_flight = 0
+    peak = 0
+
+    async def fake_send_sms(to_number, message, media_url=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if to_number == "+15550000003":
+            raise TwilioRestException(400, "/Messages.json", "Invalid 'To' phone number")
+        if to_number == "+15550000006":
+            raise KeyError("sid")
+        return {"id": f"SM{to_number}", "to": to_number}
+
+    monkeypatch.setattr(service, "send_sms", fake_send_sms)
+    messages = [{"to_number": f"+1555000000{i}", "message": "Hello"} for i in range(10)]
+
+    results = asyncio.run(service.send_sms_many(messages, concurrency=3))
+
+    assert peak == 3
+    assert [result["to"] for result in results] == [item["to_number"] for item in messages]
+    assert [result["success"] for result in results].count(False) == 2
+    assert "Invalid 'To' phone number" in results[3]["error"]
+    assert results[6]["error"] == "'sid'"
+    assert results[0]["message"]["id"] == "SM+15550000000"
+
+def test_send_sms_times_out_when_twilio_stalls(monkeypatch):
+    service = TwilioService()
+    service.timeout = 0.05
+
+    class StalledMessages:
+        async def create_async(self, **params):
+            await asyncio.sleep(10)
+
+    class StalledClient:
+        messages = StalledMessages()
+
+    monkeypatch.setattr(TwilioService, "client", property(lambda self: StalledClient()))
+
+    results = asyncio.run(service.send_sms_many([{"to_number": "+15550000000", "message": "Hello"}]))
+    assert results[0]["success"] is False
+    assert results[0]["error"] == "TimeoutError"
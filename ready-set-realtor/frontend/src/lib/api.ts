@@ -85,9 +85,9 @@ export const auth = {
 }
 
 export const leads = {
-  getAll: async () => {
-    const response = await api.get("/leads")
-    return response.data
+  getAll: async (cursor?: string, limit?: number) => {
+    const response = await api.get("/leads", { params: { cursor, limit } })
+    return response.data as { items: any[]; next_cursor: string | null }
   },
   getById: async (id: string) => {
     const response = await api.get(`/leads/${id}`)